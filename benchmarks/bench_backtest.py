@@ -0,0 +1,9 @@
+"""Option-writing backtests: every entry date of a synthetic 20-year panel at once."""
+
+from grynn_pylib.data_providers import synthetic
+from grynn_pylib.finance import backtest
+
+
+def bench_backtest_short_put_20y_x50():
+    prices = synthetic.gbm_panel(50, years=20, seed=1)
+    return lambda: backtest.run(prices, dte=30, delta=0.3, take_profit=0.5, stop_loss=2.0)
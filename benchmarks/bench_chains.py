@@ -0,0 +1,72 @@
+"""Option chain post-processing: normalization of a yfinance-shaped payload, enrichment and indexing (no network).
+
+The normalization payload is a synthetic fixture in yfinance's option_chain layout, not a recording.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytz
+
+from grynn_pylib import ipc
+from grynn_pylib.data_providers import synthetic
+from grynn_pylib.data_providers.yahoo_finance import normalize_option_chain
+from grynn_pylib.finance import chains
+
+PAYLOAD = Path(__file__).parent / "data" / "synthetic_option_chain_QQQ_2025-03-21.json"
+
+
+def _load(copies: int = 1):
+    payload = json.loads(PAYLOAD.read_text())
+    frames = []
+    for kind in ("calls", "puts"):
+        df = pd.DataFrame(payload[kind])
+        if copies > 1:
+            # Unique contract symbols per copy, as if there were more strikes/expiries
+            df = pd.concat([df.assign(contractSymbol=df["contractSymbol"] + f"-{i}") for i in range(copies)])
+        frames.append(df.reset_index(drop=True))
+    return frames[0], frames[1], payload["info"], payload["date"], datetime.fromisoformat(payload["synced_at"])
+
+
+def _normalize(copies: int):
+    calls, puts, info, date_str, now = _load(copies)
+
+    def run():
+        # normalize_option_chain works in place, so each run gets fresh frames
+        normalize_option_chain(calls.copy(), puts.copy(), info, date_str, now=now)
+
+    return run
+
+
+def bench_normalize_chain():
+    return _normalize(1)
+
+
+def bench_normalize_chain_x100():
+    return _normalize(100)
+
+
+def _synthetic_chain():
+    asof = pytz.timezone("US/Central").localize(datetime(2025, 3, 3, 10, 0))
+    calls, puts, _ = synthetic.option_chain("SYN", spot=450.0, expiries=20, strikes=500, asof=asof, seed=1)
+    return calls, puts
+
+
+def bench_enrich_chain_20k():
+    calls, puts = _synthetic_chain()
+    both = pd.concat([calls, puts])
+    return lambda: chains.enrich_chain(both)
+
+
+def bench_chain_index_atm_all_expiries():
+    calls, puts = _synthetic_chain()
+    index = chains.ChainIndex([calls, puts])
+    return lambda: index.atm(option_type=None)
+
+
+def bench_ipc_shared_round_trip_20k():
+    calls, puts = _synthetic_chain()
+    both = pd.concat([calls, puts])
+    return lambda: ipc.from_shared(ipc.to_shared(both))
@@ -0,0 +1,25 @@
+"""Import time of the package and its lightweight entry points, in a fresh interpreter."""
+
+import subprocess
+import sys
+
+
+def _import(module: str):
+    return lambda: subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+
+
+def bench_import_python_baseline():
+    # Interpreter startup alone, to read the others against
+    return lambda: subprocess.run([sys.executable, "-c", "pass"], check=True)
+
+
+def bench_import_grynn_pylib():
+    return _import("grynn_pylib")
+
+
+def bench_import_finance_options():
+    return _import("grynn_pylib.finance.options")
+
+
+def bench_import_finance_timeseries():
+    return _import("grynn_pylib.finance.timeseries")
@@ -0,0 +1,38 @@
+"""Black-Scholes kernels: scalar calls vs vectorized 1e3 / 1e6 element arrays."""
+
+import numpy as np
+
+from grynn_pylib.finance import options
+
+
+def _inputs(n: int):
+    rng = np.random.default_rng(0)
+    spot = np.full(n, 100.0)
+    strike = rng.uniform(50, 150, n)
+    dte = rng.integers(1, 730, n).astype(float)
+    vol = rng.uniform(0.1, 0.8, n)
+    return spot, strike, dte, vol
+
+
+def bench_bs_price_scalar():
+    return lambda: options.bs_price(100.0, 105.0, 30, 0.05, 0.2, "call")
+
+
+def bench_bs_price_1e3():
+    spot, strike, dte, vol = _inputs(1_000)
+    return lambda: options.bs_price(spot, strike, dte, 0.05, vol, "put")
+
+
+def bench_bs_price_1e6():
+    spot, strike, dte, vol = _inputs(1_000_000)
+    return lambda: options.bs_price(spot, strike, dte, 0.05, vol, "put")
+
+
+def bench_bs_theta_1e6():
+    spot, strike, dte, vol = _inputs(1_000_000)
+    return lambda: options.bs_theta(spot, strike, dte / 365, 0.05, vol, "call")
+
+
+def bench_bs_delta_1e6():
+    spot, strike, dte, vol = _inputs(1_000_000)
+    return lambda: options.bs_delta(spot, strike, dte / 365, 0.05, vol, "call")
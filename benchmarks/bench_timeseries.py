@@ -0,0 +1,59 @@
+"""Rolling functions on a wide frame (20 years of business days x 500 series)."""
+
+import numpy as np
+import pandas as pd
+
+from grynn_pylib.finance import alignment, covariance, data_quality, timeseries
+
+
+def _panel(n_rows: int = 5000, n_cols: int = 500) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    data = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.01, size=(n_rows, n_cols)), axis=0))
+    dates = pd.bdate_range("2005-01-03", periods=n_rows)
+    return pd.DataFrame(data, index=dates, columns=[f"S{i:04d}" for i in range(n_cols)])
+
+
+def bench_rolling_cagr_snap():
+    df = _panel()
+    return lambda: timeseries.rolling_cagr(df, years=5, snap_to_closest=True)
+
+
+def bench_rolling_cagr_exact():
+    df = _panel()
+    return lambda: timeseries.rolling_cagr(df, years=5, snap_to_closest=False)
+
+
+def bench_rolling_cagr_snap_float32_out():
+    df = _panel()
+    out = np.empty(df.shape, dtype=np.float32)
+    return lambda: timeseries.rolling_cagr(df, years=5, snap_to_closest=True, out=out)
+
+
+def bench_drawdowns():
+    df = _panel()
+    return lambda: timeseries.drawdowns(df)
+
+
+def bench_rolling_risk_stats():
+    df = _panel()
+    return lambda: timeseries.rolling_risk_stats(df, years=[1, 3], stats=["volatility", "sharpe", "sortino"])
+
+
+def bench_data_quality_scan():
+    df = _panel()
+    return lambda: data_quality.scan(df)
+
+
+def bench_alignment_align_cached():
+    # Second market with its own holidays and a one-day offset, aligned repeatedly
+    df = _panel()
+    other = df.iloc[::2].shift(1, freq="D")
+    alignment.align(df, other)
+    return lambda: alignment.align(df, other)
+
+
+def bench_ewma_covariance_update():
+    returns = _panel().pct_change().iloc[1:]
+    ewma = covariance.EWMACovariance(halflife=60).fit(returns.iloc[:-1])
+    last = returns.iloc[-1]
+    return lambda: ewma.update(last)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Run the grynn_pylib benchmark suite.
+
+Benchmarks are `bench_*` functions in `benchmarks/bench_*.py`. Each does its setup and
+returns a zero-argument callable; only that callable is timed (best of --repeat runs,
+each auto-ranged to at least 0.2s).
+
+Usage:
+    python benchmarks/run.py                                   # run all, print a table
+    python benchmarks/run.py -k rolling                        # names containing 'rolling'
+    python benchmarks/run.py --out bench_output.json           # machine-readable results
+    python benchmarks/run.py --compare benchmarks/baseline.json --threshold 0.25
+"""
+
+import importlib.util
+import json
+import platform
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+import click
+from tabulate import tabulate
+
+BENCH_DIR = Path(__file__).parent
+
+
+def discover(keyword: str | None = None) -> dict:
+    """Map 'module.function' => bench_* function for every benchmark module."""
+    benches = {}
+    for path in sorted(BENCH_DIR.glob("bench_*.py")):
+        spec = importlib.util.spec_from_file_location(path.stem, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for name in sorted(dir(module)):
+            full_name = f"{path.stem}.{name}"
+            if name.startswith("bench_") and callable(getattr(module, name)):
+                if keyword is None or keyword in full_name:
+                    benches[full_name] = getattr(module, name)
+    return benches
+
+
+def run_one(bench, repeat: int) -> dict:
+    """Time one benchmark; seconds is the best per-call time over 'repeat' runs."""
+    fn = bench()
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    # autorange stops at >= 0.2s, so 'number' calls is a stable unit to repeat
+    times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {"seconds": min(times), "median_seconds": sorted(times)[len(times) // 2], "number": number}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[dict]:
+    """Rows of (name, baseline, current, ratio, status); status is REGRESSION above 1 + threshold."""
+    rows = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            rows.append(
+                {"name": name, "baseline_s": None, "current_s": current["seconds"], "ratio": None, "status": "new"}
+            )
+            continue
+        ratio = current["seconds"] / base["seconds"]
+        status = "REGRESSION" if ratio > 1 + threshold else ("faster" if ratio < 1 - threshold else "ok")
+        rows.append(
+            {
+                "name": name,
+                "baseline_s": base["seconds"],
+                "current_s": current["seconds"],
+                "ratio": ratio,
+                "status": status,
+            }
+        )
+    return rows
+
+
+@click.command()
+@click.option("-k", "keyword", default=None, help="Only run benchmarks whose name contains this string.")
+@click.option("--repeat", default=5, show_default=True, help="Timed runs per benchmark.")
+@click.option("--out", "out_path", type=click.Path(dir_okay=False), help="Write results as JSON.")
+@click.option("--compare", "baseline_path", type=click.Path(exists=True, dir_okay=False), help="Baseline JSON.")
+@click.option("--threshold", default=0.25, show_default=True, help="Allowed slowdown vs baseline (0.25 = 25%).")
+def main(keyword, repeat, out_path, baseline_path, threshold):
+    results = {}
+    for name, bench in discover(keyword).items():
+        results[name] = run_one(bench, repeat)
+        click.echo(f"{name}: {results[name]['seconds'] * 1e3:.3f} ms", err=True)
+
+    if out_path:
+        doc = {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }
+        Path(out_path).write_text(json.dumps(doc, indent=2) + "\n")
+
+    if not baseline_path:
+        table = [(name, r["seconds"] * 1e3, r["median_seconds"] * 1e3, r["number"]) for name, r in results.items()]
+        click.echo(tabulate(table, headers=["benchmark", "best ms", "median ms", "calls/run"], floatfmt=".3f"))
+        return
+
+    baseline = json.loads(Path(baseline_path).read_text())["results"]
+    rows = compare(results, baseline, threshold)
+    click.echo(tabulate(rows, headers="keys", floatfmt=".4f"))
+    regressions = [r["name"] for r in rows if r["status"] == "REGRESSION"]
+    if regressions:
+        click.echo(f"{len(regressions)} regression(s) over {threshold:.0%}: {', '.join(regressions)}", err=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,18 +3,21 @@
 # over last 'n_years' of data (default 10 years)
 from pathlib import Path
 from IPython.display import display, display_markdown as displaymd
-import yfinance as yf
 import pandas as pd
 from tabulate import tabulate
+from grynn_pylib.data_providers.price_store import PriceStore
 from grynn_pylib.finance import timeseries as ts
 
 tickers = ["QQQ", "QQQE", "SPY", "XLK", "VGT", "IWM", "ROM", "QLD", "SSO", "TQQQ"]
-n_years = "10y"
+n_years = 10
 # since yf 0.2.51 auto_adjust defaults to True and download/history does not return "Adj Close"
 # https://github.com/copilot/c/5f0930d5-0652-426e-a1fd-6da47b081c6c
 # https://github.com/ranaroussi/yfinance/issues/2219#issuecomment-2585580123
-df = yf.download(tickers, period=n_years)
-df = df["Close"]
+# The store keeps the history on disk; re-runs only download bars newer than the last stored one
+start = pd.Timestamp.today().normalize() - pd.DateOffset(years=n_years)
+store = PriceStore(Path.home() / ".cache" / "grynn" / "prices")
+store.update(tickers, start=start)
+df = store.read(tickers, columns="Close", start=start)
 start_date = df.index[0]
 end_date = df.index[-1]
 print(f"Data from {start_date} to {end_date} downloaded.")
@@ -5,7 +5,7 @@ import matplotlib.pyplot as plt
 import pandas as pd
 
 from grynn_pylib.data_providers import yahoo_finance
-import grynn_pylib.finance.options as options
+from grynn_pylib.finance import chains
 
 
 def plot_theta_vs_expiry(ticker: str = "QQQ", strike_range: float = 0.05, rate: float = 0.05):
@@ -45,38 +45,13 @@ def plot_theta_vs_expiry(ticker: str = "QQQ", strike_range: float = 0.05, rate:
             calls_atm = calls_df.loc[calls_df["strike"].between(strike_min, strike_max)]
             puts_atm = puts_df.loc[puts_df["strike"].between(strike_min, strike_max)]
 
-            # Calculate average theta for this expiry
-            if len(calls_atm) > 0 and "dte" in calls_atm.columns and "iv" in calls_atm.columns:
-                dte = calls_atm["dte"].iloc[0]
-                for _, row in calls_atm.iterrows():
-                    if row["iv"] > 0:
-                        theta = options.bs_theta(
-                            spot=spot,
-                            strike=row["strike"],
-                            time=dte / 365,
-                            rate=rate,
-                            volatility=row["iv"],
-                            option_type="call",
-                        )
-                        call_data.append(
-                            {"date": date_str, "dte": dte, "strike": row["strike"], "theta": theta, "iv": row["iv"]}
-                        )
-
-            if len(puts_atm) > 0 and "dte" in puts_atm.columns and "iv" in puts_atm.columns:
-                dte = puts_atm["dte"].iloc[0]
-                for _, row in puts_atm.iterrows():
-                    if row["iv"] > 0:
-                        theta = options.bs_theta(
-                            spot=spot,
-                            strike=row["strike"],
-                            time=dte / 365,
-                            rate=rate,
-                            volatility=row["iv"],
-                            option_type="put",
-                        )
-                        put_data.append(
-                            {"date": date_str, "dte": dte, "strike": row["strike"], "theta": theta, "iv": row["iv"]}
-                        )
+            # Greeks for the whole expiry in one vectorized pass
+            for df, option_type, data in [(calls_atm, "call", call_data), (puts_atm, "put", put_data)]:
+                enriched = chains.enrich_chain(df.loc[df["iv"] > 0], option_type, rate=rate)
+                data += [
+                    {"date": date_str, "dte": row.dte, "strike": row.strike, "theta": row.theta, "iv": row.iv}
+                    for row in enriched.itertuples()
+                ]
 
         except Exception as e:
             print(f"Error processing {date_str}: {e}")
@@ -1,11 +1,11 @@
 # CAGR 2
 
 # %%
-import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import yfinance as yf
 from matplotlib.widgets import Button
+from grynn_pylib.finance import data_quality
 import json
 
 # %%
@@ -15,13 +15,11 @@ import json
 # Download data
 df = yf.download("XLK, SPY, NIFTYBEES.NS", period="10y")["Adj Close"]
 
-# Clean data errors
-df.loc["2019-12-19":"2019-12-20", "NIFTYBEES.NS"] = np.nan
+# Clean data errors: bad ticks (out-and-back spikes) are replaced, >25% daily moves reported
+df, report = data_quality.clean(df, method="ffill", jump=0.25)
+print(report.summary())
 df = df.ffill()
 
-# check for extreme values (>25% change in a day)
-# TODO: Implement this
-
 
 # Convert NIFTYBEES to USD
 usdinr = yf.download("USDINR=X", period="10y")["Close"]
@@ -1,8 +1,21 @@
-"""grynn_pylib - A Python library for finance-related functions and general utility functions."""
+"""grynn_pylib - A Python library for finance-related functions and general utility functions.
 
-from . import data_providers
-from . import decorators
-from . import finance
-from . import utils
+Submodules are imported lazily on first attribute access (PEP 562), so `import grynn_pylib`
+and `from grynn_pylib.finance import options` do not pay for yfinance, pandas or
+exchange_calendars unless they are used.
+"""
 
-__all__ = ["data_providers", "decorators", "finance", "utils"]
+import importlib
+
+__all__ = ["concurrency", "data_providers", "decorators", "finance", "ipc", "reports", "utils"]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        # import_module also binds the submodule on the package, so this runs once per name
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,263 @@
+"""`grynn` command line: batch jobs over many tickers or series.
+
+Each unit of work (a ticker, a block of series) is written to its own Parquet file as soon
+as it finishes, via a temp file and an atomic rename. A unit whose output file exists is
+skipped on the next run, so an interrupted job resumes where it stopped. The run parameters
+are kept in _manifest.json in the output directory, and a run with different parameters
+refuses to resume there (use --no-resume to start over). Temp files left by a crash are
+removed at startup. At most 2 x workers units are in flight, which bounds memory regardless
+of the job size.
+
+Usage example:
+    grynn chains snapshot --tickers tickers.txt --workers 8 --out snapshots/2025-03-03
+    grynn timeseries cagr --input prices.parquet --years 1,3,5 --workers 16 --out cagr/
+"""
+
+import json
+import os
+import sys
+import zlib
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Iterable
+
+import click
+import pandas as pd
+from loguru import logger as log
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise click.ClickException("Parquet output requires pyarrow: pip install 'grynn_pylib[arrow]'") from e
+
+
+# Leading underscore: Parquet dataset readers (pd.read_parquet(out_dir)) skip it
+_MANIFEST = "_manifest.json"
+
+
+def _write_parquet(df: pd.DataFrame, path: Path) -> None:
+    """Write via a temp file and rename, so a file that exists is always complete."""
+    # Hidden while being written, so dataset readers never see a partial file
+    tmp = path.with_name(f".{path.name}.tmp")
+    df.to_parquet(tmp)
+    os.replace(tmp, path)
+
+
+def _prepare_out_dir(out: Path, params: dict, resume: bool) -> None:
+    """Create 'out', remove temp files left by a crashed run and record the run parameters.
+
+    Raises:
+        click.ClickException: resuming into a directory written with different parameters
+    """
+    out.mkdir(parents=True, exist_ok=True)
+    for tmp in out.glob("*.tmp"):
+        tmp.unlink(missing_ok=True)
+
+    manifest = out / _MANIFEST
+    if resume and manifest.exists():
+        previous = json.loads(manifest.read_text())
+        if previous != params:
+            changed = sorted(k for k in params.keys() | previous.keys() if previous.get(k) != params.get(k))
+            raise click.ClickException(
+                f"{out} was written with different parameters ({', '.join(changed)}); "
+                "use --no-resume to start over, or another --out"
+            )
+        return
+
+    tmp = out / f".{_MANIFEST}.tmp"
+    tmp.write_text(json.dumps(params, indent=2, sort_keys=True))
+    os.replace(tmp, manifest)
+
+
+def _run_units(
+    executor: Executor, func: Callable, units: Iterable[tuple], total: int, workers: int, label: str
+) -> tuple[int, list[tuple[str, str]]]:
+    """Run func(*unit) with at most 2 x workers units in flight; returns (rows written, failures)."""
+    pending = {}
+    units = iter(units)
+    rows, failures = 0, []
+    with click.progressbar(length=total, label=label, file=sys.stderr) as bar:
+        while True:
+            for unit in units:
+                pending[executor.submit(func, *unit)] = unit
+                if len(pending) >= 2 * workers:
+                    break
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                unit = pending.pop(future)
+                try:
+                    rows += future.result()
+                except Exception as e:
+                    log.warning(f"{unit[0]} failed: {e}")
+                    failures.append((str(unit[0]), str(e)))
+                bar.update(1)
+    return rows, failures
+
+
+def _report(rows: int, done: int, skipped: int, failures: list[tuple[str, str]]) -> None:
+    click.echo(f"{done} written ({rows} rows), {skipped} already done, {len(failures)} failed", err=True)
+    if failures:
+        for unit, error in failures:
+            click.echo(f"  {unit}: {error}", err=True)
+        raise SystemExit(1)
+
+
+@click.group()
+def main():
+    """Batch jobs for grynn_pylib."""
+
+
+@main.group()
+def chains():
+    """Option chain jobs."""
+
+
+def _snapshot_ticker(ticker: str, path: Path, source: str, max_expiries: int | None) -> int:
+    """Fetch every expiry of one ticker into a single Parquet file; returns the number of contracts."""
+    if source == "synthetic":
+        from .data_providers import synthetic
+
+        calls, puts, _ = synthetic.option_chain(ticker, expiries=max_expiries or 12, seed=zlib.crc32(ticker.encode()))
+        df = pd.concat([calls.assign(option_type="call"), puts.assign(option_type="put")])
+    else:
+        from .data_providers import yahoo_finance
+
+        df = yahoo_finance.get_option_chains(ticker, max_expiries)
+
+    _write_parquet(df, path)
+    return len(df)
+
+
+def _read_tickers(tickers_file: str | None, tickers: tuple[str, ...]) -> list[str]:
+    names = list(tickers)
+    if tickers_file:
+        with open(tickers_file) as f:
+            names += [line.split("#")[0].strip() for line in f]
+    # Keep the file order, drop blanks and duplicates
+    return list(dict.fromkeys(name.upper() for name in names if name))
+
+
+@chains.command("snapshot")
+@click.option("--tickers", "tickers_file", type=click.Path(exists=True, dir_okay=False), help="One ticker per line.")
+@click.option("--ticker", "tickers", multiple=True, help="Ticker to snapshot (repeatable).")
+@click.option("--out", "out_dir", required=True, type=click.Path(file_okay=False), help="Output directory.")
+@click.option("--workers", default=8, show_default=True, help="Concurrent downloads.")
+@click.option("--max-expiries", type=int, default=None, help="Only the nearest N expiries per ticker.")
+@click.option("--source", type=click.Choice(["yahoo", "synthetic"]), default="yahoo", show_default=True)
+@click.option("--resume/--no-resume", default=True, show_default=True, help="Skip tickers already written.")
+def chains_snapshot(tickers_file, tickers, out_dir, workers, max_expiries, source, resume):
+    """Snapshot full option chains, one <TICKER>.parquet per ticker (calls and puts, 'option_type' column)."""
+    _require_pyarrow()
+    names = _read_tickers(tickers_file, tickers)
+    if not names:
+        raise click.UsageError("No tickers given, use --tickers FILE or --ticker SYMBOL")
+
+    out = Path(out_dir)
+    _prepare_out_dir(out, {"command": "chains snapshot", "source": source, "max_expiries": max_expiries}, resume)
+    units = [(t, out / f"{t.replace('/', '_')}.parquet", source, max_expiries) for t in names]
+    todo = [u for u in units if not (resume and u[1].exists())]
+
+    # Downloads are I/O bound, threads are enough
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        rows, failures = _run_units(executor, _snapshot_ticker, todo, len(todo), workers, "chains")
+    _report(rows, len(todo) - len(failures), len(units) - len(todo), failures)
+
+
+@main.group()
+def timeseries():
+    """Timeseries metric jobs over wide Parquet panels (rows = dates, columns = series)."""
+
+
+def _parquet_columns(path: str, date_col: str | None) -> tuple[list[str], str | None]:
+    """Series columns of a Parquet panel and the date column (None when the dates are the index)."""
+    import pyarrow.parquet as pq
+
+    schema = pq.read_schema(path)
+    index_cols = set((schema.pandas_metadata or {}).get("index_columns", []) or [])
+    index_cols = {c for c in index_cols if isinstance(c, str)}
+    if date_col is None:
+        date_col = next(
+            (f.name for f in schema if f.name not in index_cols and str(f.type).startswith("timestamp")), None
+        )
+    series = [f.name for f in schema if f.name not in index_cols and f.name != date_col]
+    return series, date_col
+
+
+def _cagr_block(
+    name: str, src: str, path: Path, columns: list[str], date_col: str | None, years: list[int], snap: bool
+) -> int:
+    """CAGR of one block of series, written long: date, series, cagr_<y>y for each horizon."""
+    from .finance import timeseries as ts
+
+    df = pd.read_parquet(src, columns=columns + ([date_col] if date_col else []))
+    if date_col:
+        df = df.set_index(date_col)
+    df.index = pd.DatetimeIndex(df.index)
+    df = df.sort_index()
+
+    metrics = {}
+    for y in years:
+        cagr = ts.rolling_cagr(df, years=y, snap_to_closest=snap)
+        if isinstance(cagr, pd.Series):
+            # Less than a year of data: rolling_cagr returns a single NaN series
+            cagr = pd.DataFrame({c: cagr for c in df.columns})
+        metrics[f"cagr_{y}y"] = cagr.stack(future_stack=True)
+
+    result = pd.DataFrame(metrics)
+    result.index.names = ["date", "series"]
+    result = result.dropna(how="all").reset_index()
+    _write_parquet(result, path)
+    return len(result)
+
+
+@timeseries.command("cagr")
+@click.option("--input", "src", required=True, type=click.Path(exists=True, dir_okay=False), help="Wide Parquet panel.")
+@click.option("--out", "out_dir", required=True, type=click.Path(file_okay=False), help="Output directory.")
+@click.option("--years", default="1,3,5", show_default=True, help="Comma-separated CAGR horizons in years.")
+@click.option("--date-col", default=None, help="Date column (default: the index, or the first timestamp column).")
+@click.option("--snap-to-closest", is_flag=True, help="Snap window starts to the closest trading day.")
+@click.option("--block-size", default=256, show_default=True, help="Series per unit of work.")
+@click.option("--workers", default=os.cpu_count() or 1, show_default=True, help="Worker processes.")
+@click.option("--resume/--no-resume", default=True, show_default=True, help="Skip blocks already written.")
+def timeseries_cagr(src, out_dir, years, date_col, snap_to_closest, block_size, workers, resume):
+    """Rolling CAGR for every series, as a Parquet dataset of part-NNNNN.parquet files (long format).
+
+    Read it back with pd.read_parquet(out_dir).
+    """
+    _require_pyarrow()
+    try:
+        horizons = [int(y) for y in years.split(",") if y.strip()]
+    except ValueError as e:
+        raise click.BadParameter(f"expected comma-separated integers, got {years!r}", param_hint="--years") from e
+
+    columns, date_col = _parquet_columns(src, date_col)
+    out = Path(out_dir)
+    params = {
+        "command": "timeseries cagr",
+        "input": str(Path(src).resolve()),
+        "years": horizons,
+        "date_col": date_col,
+        "snap_to_closest": snap_to_closest,
+        "block_size": block_size,
+        # Blocks are slices of the column list, so it must not change between runs
+        "columns_crc32": zlib.crc32("\0".join(columns).encode()),
+    }
+    _prepare_out_dir(out, params, resume)
+
+    units = [
+        (f"part-{i:05d}", src, out / f"part-{i:05d}.parquet", columns[c0 : c0 + block_size], date_col, horizons)
+        for i, c0 in enumerate(range(0, len(columns), block_size))
+    ]
+    todo = [u + (snap_to_closest,) for u in units if not (resume and u[2].exists())]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        rows, failures = _run_units(executor, _cagr_block, todo, len(todo), workers, "cagr")
+    _report(rows, len(todo) - len(failures), len(units) - len(todo), failures)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Single-flight request coalescing and a thread-safe cache for concurrent data requests.
+
+When several threads ask for the same thing at once (the same FX pair, the same option
+chain), SingleFlight lets the first caller (the leader) run the fetch while the others
+wait for it and receive the same result object, or a copy of its exception (chained to
+the original). Nothing is remembered once the call has finished, so the next request
+fetches again. Shared results must be treated as read-only, or copied by the caller.
+
+single_flight() applies this to a function, keyed by its arguments. With cache=True
+successful results are also kept (like functools.cache), but a key is populated by exactly
+one call even under concurrency, and failures are not cached. Locking is per key, so a
+slow download never blocks requests for other keys.
+
+Usage example:
+    from grynn_pylib.concurrency import SingleFlight, single_flight
+
+    flight = SingleFlight()
+    chain = flight.do(("QQQ", "2025-03-21"), fetch_chain, "QQQ", "2025-03-21")
+
+    @single_flight(cache=True)
+    def download(pair, start=None, end=None):
+        ...
+
+    download.cache_clear()
+"""
+
+import copy
+import threading
+from functools import wraps
+from typing import Any, Callable, Hashable
+
+_MISSING = object()
+
+
+class _Call:
+    """One in-flight call; followers wait on 'done'."""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+def _waiter_error(error: BaseException, key: Hashable) -> BaseException:
+    """A fresh exception for one waiting thread, so waiters do not share (and extend) one traceback."""
+    try:
+        clone = copy.copy(error)
+    except Exception:
+        clone = None
+    if type(clone) is not type(error):
+        clone = RuntimeError(f"Shared call for {key!r} failed: {error!r}")
+    return clone
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one execution."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """Run fn(*args, **kwargs) unless a call for 'key' is in flight; then wait for and share its result.
+
+        Args:
+            key: Identifies the request; must be hashable
+            fn: The fetch, run by the first caller only
+
+        Returns:
+            The leader's result; if the leader fails, each waiting caller raises a copy of its
+            exception (same type, original as __cause__)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise _waiter_error(call.error, key) from call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        """Number of keys currently being fetched."""
+        with self._lock:
+            return len(self._calls)
+
+
+def _make_key(args: tuple, kwargs: dict) -> Hashable | None:
+    """Hashable key for a call, or None if an argument is unhashable."""
+    key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def single_flight(cache: bool = False, key: Callable[..., Hashable] | None = None) -> Callable:
+    """Decorator: coalesce concurrent calls with the same arguments (see SingleFlight).
+
+    Calls with unhashable arguments run directly, without coalescing or caching.
+
+    Args:
+        cache: Also keep successful results (thread-safe functools.cache); clear with func.cache_clear()
+        key: key(*args, **kwargs) -> hashable key (default: the arguments themselves)
+    """
+
+    def decorator(func):
+        flight = SingleFlight()
+        results: dict[Hashable, Any] = {}
+        lock = threading.Lock()
+
+        def fetch(k, args, kwargs):
+            # Re-check under the flight: a previous leader may have filled the cache
+            # between this caller's cache miss and its turn as leader
+            with lock:
+                value = results.get(k, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                with lock:
+                    results[k] = value
+            return value
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            k = key(*args, **kwargs) if key is not None else _make_key(args, kwargs)
+            if k is None:
+                return func(*args, **kwargs)
+            if not cache:
+                return flight.do(k, func, *args, **kwargs)
+            with lock:
+                value = results.get(k, _MISSING)
+            if value is not _MISSING:
+                return value
+            return flight.do(k, fetch, k, args, kwargs)
+
+        def cache_clear() -> None:
+            with lock:
+                results.clear()
+
+        def cache_info() -> dict[str, int]:
+            with lock:
+                size = len(results)
+            return {"size": size, "in_flight": flight.in_flight()}
+
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_info = cache_info
+        wrapper.flight = flight
+        return wrapper
+
+    return decorator
@@ -1,5 +1,15 @@
 """Data providers module for external data sources."""
 
-from . import yahoo_finance
+import importlib
 
-__all__ = ["yahoo_finance"]
+__all__ = ["price_store", "synthetic", "yahoo_finance"]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,204 @@
+"""Local Parquet store of daily OHLCV bars with incremental updates.
+
+Layout: one directory per symbol (percent-encoded, so "^GSPC" and "INRUSD=X" are safe),
+holding part files named part-<first>-<last>.parquet by the dates they cover. The last
+stored date is read from the file names, so an update only asks the provider for bars
+from that date on. The last stored bar is fetched again, because it may have been a
+partial (intraday) bar; on read, later parts win for duplicated dates.
+
+Bars are normalized once, at write time: tz-naive sorted DatetimeIndex named "Date",
+float64 columns, duplicate dates dropped. Reads only touch the requested columns.
+
+Usage example:
+    from grynn_pylib.data_providers.price_store import PriceStore
+
+    store = PriceStore("~/.cache/grynn/prices")
+    store.update(["QQQ", "SPY", "INRUSD=X"], start="2000-01-01")  # only new bars after the first run
+    close = store.read(["QQQ", "SPY"], columns="Close", start="2015-01-01")  # dates x symbols
+    ohlc = store.read(["QQQ"], columns=["Open", "Close"])  # (field, symbol) columns, like yf.download
+"""
+
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+from urllib.parse import quote, unquote
+
+import pandas as pd
+from loguru import logger as log
+
+from ..concurrency import SingleFlight
+from ..decorators import profiled
+
+FIELDS = ["Open", "High", "Low", "Close", "Volume"]
+_PART = re.compile(r"part-(\d{8})-(\d{8})\.parquet$")
+
+# fetch(symbols, start, end) -> frame with (field, symbol) columns, as yf.download returns
+Fetcher = Callable[[list[str], pd.Timestamp | None, pd.Timestamp | None], pd.DataFrame]
+
+
+def yahoo_fetch(symbols: list[str], start=None, end=None) -> pd.DataFrame:
+    """Default fetcher: split and dividend adjusted daily bars from yf.download."""
+    import yfinance as yf
+
+    return yf.download(symbols, start=start, end=end, auto_adjust=True, progress=False, group_by="column")
+
+
+def _normalize(bars: pd.DataFrame) -> pd.DataFrame:
+    bars = bars.dropna(how="all")
+    index = pd.DatetimeIndex(bars.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    bars = bars.set_axis(index.rename("Date")).astype(float)
+    bars = bars.loc[~bars.index.duplicated(keep="last")]
+    return bars.sort_index()
+
+
+class PriceStore:
+    """Per-symbol partitioned Parquet bars under 'root', see the module docstring."""
+
+    def __init__(self, root: str | Path, fetch: Fetcher | None = None, max_workers: int = 8):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError("PriceStore requires pyarrow: pip install 'grynn_pylib[arrow]'") from e
+        self.root = Path(root).expanduser()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.fetch = fetch or yahoo_fetch
+        self.max_workers = max_workers
+        # Concurrent update() calls for the same symbols and resume date share one fetch and write
+        self._flight = SingleFlight()
+
+    def _dir(self, symbol: str) -> Path:
+        return self.root / quote(symbol, safe="")
+
+    def _parts(self, symbol: str) -> list[tuple[pd.Timestamp, pd.Timestamp, Path]]:
+        """(first, last, path) of every part file, in write order (by first, then last date)."""
+        directory = self._dir(symbol)
+        if not directory.is_dir():
+            return []
+        parts = []
+        for path in directory.iterdir():
+            if match := _PART.match(path.name):
+                parts.append((pd.Timestamp(match.group(1)), pd.Timestamp(match.group(2)), path))
+        return sorted(parts, key=lambda p: (p[0], p[1]))
+
+    def symbols(self) -> list[str]:
+        """Symbols with at least one stored bar."""
+        return sorted(unquote(p.name) for p in self.root.iterdir() if p.is_dir() and self._parts(unquote(p.name)))
+
+    def last_timestamp(self, symbol: str) -> pd.Timestamp | None:
+        """Date of the last stored bar, from the part file names (no file is opened)."""
+        parts = self._parts(symbol)
+        return max(last for _, last, _ in parts) if parts else None
+
+    def write(self, symbol: str, bars: pd.DataFrame) -> int:
+        """Normalize and store bars for one symbol as a new part; returns the number of rows written."""
+        bars = _normalize(bars)
+        if bars.empty:
+            return 0
+        directory = self._dir(symbol)
+        directory.mkdir(exist_ok=True)
+        path = directory / f"part-{bars.index[0]:%Y%m%d}-{bars.index[-1]:%Y%m%d}.parquet"
+        # Temp file and rename, so a part that exists is always complete; the temp name is
+        # per thread, so two writers of the same part never interleave in one file
+        tmp = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        bars.to_parquet(tmp)
+        os.replace(tmp, path)
+        return len(bars)
+
+    @profiled()
+    def update(self, symbols: list[str] | str, start="1990-01-01", end=None) -> dict[str, int]:
+        """Fetch and store bars newer than what is stored (from 'start' for new symbols).
+
+        Symbols sharing the same resume date are fetched in one provider call. If another
+        thread is already updating the same group from the same date, this call waits for it
+        and returns its counts instead of fetching again.
+
+        Returns:
+            dict: symbol -> rows written (the refetched last bar included)
+        """
+        symbols = [symbols] if isinstance(symbols, str) else list(symbols)
+        by_start: dict[pd.Timestamp, list[str]] = {}
+        for symbol in symbols:
+            by_start.setdefault(self.last_timestamp(symbol) or pd.Timestamp(start), []).append(symbol)
+
+        written = {}
+        for resume, group in by_start.items():
+            written.update(self._flight.do((tuple(group), resume, end), self._update_group, group, resume, end))
+        return written
+
+    def _update_group(self, group: list[str], resume: pd.Timestamp, end) -> dict[str, int]:
+        log.debug(f"Fetching {len(group)} symbols from {resume.date()}")
+        bars = self.fetch(group, resume, end)
+        return {
+            symbol: self.write(symbol, _normalize(self._select(bars, symbol, len(group))).loc[resume:])
+            for symbol in group
+        }
+
+    @staticmethod
+    def _select(bars: pd.DataFrame, symbol: str, n_symbols: int) -> pd.DataFrame:
+        """One symbol's OHLCV columns out of a fetch result."""
+        if isinstance(bars.columns, pd.MultiIndex):
+            if symbol not in bars.columns.get_level_values(-1):
+                return bars.iloc[:0, :0]
+            return bars.xs(symbol, axis=1, level=-1)
+        assert n_symbols == 1, "fetch results for several symbols must have (field, symbol) columns"
+        return bars
+
+    def read_symbol(self, symbol: str, columns: list[str] | None = None, start=None, end=None) -> pd.DataFrame:
+        """Stored bars of one symbol (all fields by default)."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        start = pd.Timestamp(start) if start is not None else None
+        end = pd.Timestamp(end) if end is not None else None
+        # Part names give the date range, so parts outside [start, end] are not opened
+        paths = [
+            path
+            for first, last, path in self._parts(symbol)
+            if (start is None or last >= start) and (end is None or first <= end)
+        ]
+        if not paths:
+            return pd.DataFrame(columns=columns or FIELDS, index=pd.DatetimeIndex([], name="Date"), dtype=float)
+        read_columns = None if columns is None else [*columns, "Date"]
+        frame = pa.concat_tables([pq.read_table(p, columns=read_columns) for p in paths]).to_pandas()
+        frame = frame.loc[~frame.index.duplicated(keep="last")].sort_index()
+        return frame.loc[start:end]
+
+    @profiled()
+    def read(self, symbols: list[str] | str | None = None, columns: str | list[str] = "Close", start=None, end=None):
+        """Wide frame of stored bars.
+
+        Args:
+            symbols: Symbols to read (default: every stored symbol)
+            columns: One field (dates x symbols) or a list of fields ((field, symbol) columns)
+            start, end: Inclusive date bounds
+
+        Returns:
+            DataFrame on the union of the symbols' dates
+        """
+        symbols = self.symbols() if symbols is None else [symbols] if isinstance(symbols, str) else list(symbols)
+        fields = [columns] if isinstance(columns, str) else list(columns)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            frames = list(pool.map(lambda s: self.read_symbol(s, fields, start, end), symbols))
+        wide = {field: pd.concat([f[field].rename(s) for s, f in zip(symbols, frames)], axis=1) for field in fields}
+        if isinstance(columns, str):
+            return wide[columns]
+        return pd.concat(wide, axis=1, names=["Price", "Ticker"])
+
+    def compact(self, symbols: list[str] | str | None = None) -> None:
+        """Merge each symbol's parts into a single part (fewer files to open on read)."""
+        symbols = self.symbols() if symbols is None else [symbols] if isinstance(symbols, str) else list(symbols)
+        for symbol in symbols:
+            parts = self._parts(symbol)
+            if len(parts) < 2:
+                continue
+            bars = self.read_symbol(symbol)
+            self.write(symbol, bars)
+            keep = self._dir(symbol) / f"part-{bars.index[0]:%Y%m%d}-{bars.index[-1]:%Y%m%d}.parquet"
+            for _, _, path in parts:
+                if path != keep:
+                    path.unlink()
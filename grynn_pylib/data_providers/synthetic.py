@@ -0,0 +1,241 @@
+"""Synthetic market data for load tests and benchmarks (no network).
+
+- Correlated GBM price panels with a business-day DatetimeIndex, shaped like the
+  frames the finance.timeseries functions take (rows = dates, columns = series).
+- Option chains with the same schema get_option_chain produces (snake_case columns,
+  contract_symbol index, dte/spot/iv, ...), priced with Black-Scholes off an IV smile.
+
+Everything is vectorized and seeded: the same seed (and chunk size, for the streaming
+variants) gives the same data.
+
+Usage example:
+    from grynn_pylib.data_providers import synthetic
+
+    prices = synthetic.gbm_panel(2000, years=30, seed=42)
+    calls, puts, info = synthetic.option_chain("SYN", spot=450.0, expiries=20, strikes=500, seed=1)
+
+    for block in synthetic.iter_gbm_panel(20_000, years=30, chunk_series=1000, seed=42):
+        ...
+"""
+
+from datetime import datetime
+from typing import Any, Iterator
+
+import numpy as np
+import pandas as pd
+import pytz
+
+from ..finance import options
+from .yahoo_finance.client import normalize_option_chain
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+def _series_param(value, n: int) -> np.ndarray:
+    """Broadcast a scalar or per-series parameter to shape (n,)."""
+    return np.broadcast_to(np.asarray(value, dtype=float), (n,))
+
+
+def iter_gbm_panel(
+    n_series: int,
+    years: float = 30,
+    start: str = "1995-01-02",
+    mu=0.07,
+    sigma=0.2,
+    correlation: float = 0.3,
+    s0=100.0,
+    chunk_series: int = 1000,
+    seed: int | None = None,
+    dtype=np.float64,
+) -> Iterator[pd.DataFrame]:
+    """Stream a correlated GBM panel in blocks of 'chunk_series' columns.
+
+    Correlation comes from a one-factor model (every pair has 'correlation'), which keeps
+    the cost linear in n_series instead of a Cholesky factor of a k x k matrix.
+
+    Args:
+        n_series: Number of series (columns)
+        years: Length of the history in years of business days
+        start: First date
+        mu, sigma: Annual drift and volatility, scalar or one per series
+        correlation: Pairwise correlation of daily log returns (0 <= correlation < 1)
+        s0: Starting price, scalar or one per series
+        chunk_series: Columns per yielded block
+        seed: Seed for reproducibility
+        dtype: dtype of the yielded prices
+
+    Yields:
+        DataFrames with a business-day DatetimeIndex and columns S00000, S00001, ...
+    """
+    if not 0 <= correlation < 1:
+        raise ValueError(f"correlation must be in [0, 1), got {correlation}")
+
+    n_rows = int(round(years * TRADING_DAYS_PER_YEAR))
+    index = pd.bdate_range(start, periods=n_rows)
+    mu, sigma, s0 = (_series_param(v, n_series) for v in (mu, sigma, s0))
+    dt = 1 / TRADING_DAYS_PER_YEAR
+
+    seeds = np.random.SeedSequence(seed)
+    factor_seed, *chunk_seeds = seeds.spawn(1 + -(-n_series // chunk_series))
+    # The common factor is shared by all chunks so correlation holds across blocks
+    common = np.random.default_rng(factor_seed).standard_normal((n_rows, 1))
+
+    for i, c0 in enumerate(range(0, n_series, chunk_series)):
+        c1 = min(c0 + chunk_series, n_series)
+        rng = np.random.default_rng(chunk_seeds[i])
+        z = rng.standard_normal((n_rows, c1 - c0))
+        z *= np.sqrt(1 - correlation)
+        z += np.sqrt(correlation) * common
+
+        # log-price increments, first row is the starting price
+        z *= sigma[c0:c1] * np.sqrt(dt)
+        z += (mu[c0:c1] - 0.5 * sigma[c0:c1] ** 2) * dt
+        z[0] = 0.0
+        np.cumsum(z, axis=0, out=z)
+        np.exp(z, out=z)
+        z *= s0[c0:c1]
+
+        columns = [f"S{j:05d}" for j in range(c0, c1)]
+        yield pd.DataFrame(z.astype(dtype, copy=False), index=index, columns=columns, copy=False)
+
+
+def gbm_panel(n_series: int, years: float = 30, seed: int | None = None, **kwargs) -> pd.DataFrame:
+    """Correlated GBM price panel in one frame, see iter_gbm_panel for the parameters."""
+    kwargs.setdefault("chunk_series", max(n_series, 1))
+    blocks = list(iter_gbm_panel(n_series, years=years, seed=seed, **kwargs))
+    return blocks[0] if len(blocks) == 1 else pd.concat(blocks, axis=1)
+
+
+def _raw_chain(
+    rng: np.random.Generator,
+    ticker: str,
+    spot: float,
+    expiry: pd.Timestamp,
+    dte: int,
+    strikes: np.ndarray,
+    rate: float,
+    iv: float,
+    skew: float,
+    smile: float,
+    option_type: str,
+) -> pd.DataFrame:
+    """One expiry of calls or puts with the raw (camelCase) columns yfinance returns."""
+    n = len(strikes)
+    m = np.log(strikes / spot)
+    vol = np.clip(iv + skew * m + smile * m * m + rng.normal(0, 0.002, n), 0.01, None)
+
+    price = np.maximum(options.bs_price(spot, strikes, max(dte, 1), rate, vol, option_type), 0.0)
+    half_spread = np.maximum(0.01, 0.0075 * price)
+    bid = np.round(np.maximum(price - half_spread, 0.0), 2)
+    ask = np.round(price + half_spread, 2)
+    last = np.round(price * (1 + rng.normal(0, 0.01, n)), 2)
+    change = np.round(rng.normal(0, 0.02, n) * price, 2)
+
+    cp = "C" if option_type == "call" else "P"
+    strike_code = pd.Series(np.round(strikes * 1000).astype(np.int64)).astype(str).str.zfill(8)
+    itm = strikes < spot if option_type == "call" else strikes > spot
+
+    return pd.DataFrame(
+        {
+            "contractSymbol": f"{ticker}{expiry:%y%m%d}{cp}" + strike_code,
+            "lastTradeDate": expiry - pd.Timedelta(days=dte) - pd.to_timedelta(rng.integers(0, 86400, n), unit="s"),
+            "strike": strikes,
+            "lastPrice": last,
+            "bid": bid,
+            "ask": ask,
+            "change": change,
+            "percentChange": np.round(100 * change / np.maximum(last, 0.01), 4),
+            "volume": rng.integers(0, 5000, n),
+            "openInterest": rng.integers(0, 50000, n),
+            "impliedVolatility": vol,
+            "inTheMoney": itm,
+            "contractSize": "REGULAR",
+            "currency": "USD",
+        }
+    )
+
+
+def option_chain(
+    ticker: str = "SYN",
+    spot: float = 100.0,
+    expiries: int | list[str] = 12,
+    strikes: int = 100,
+    strike_range: float = 0.5,
+    rate: float = 0.04,
+    iv: float = 0.2,
+    skew: float = -0.3,
+    smile: float = 0.5,
+    asof: datetime | None = None,
+    tz: pytz.BaseTzInfo = pytz.timezone("US/Central"),
+    seed: int | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, Any]]:
+    """Synthetic multi-expiry option chain in the schema of get_option_chain.
+
+    Each expiry is generated in yfinance's raw shape and passed through
+    normalize_option_chain, so columns, dtypes and index match real chains exactly.
+
+    Args:
+        ticker: Underlying symbol
+        spot: Underlying price
+        expiries: Number of weekly (Friday) expiries after 'asof', or explicit YYYY-MM-DD dates
+        strikes: Strikes per expiry, evenly spaced over spot * (1 +/- strike_range) and rounded
+            to cents; strikes that round to the same cent are kept once, so low spots get fewer
+        rate: Risk-free rate used for pricing
+        iv, skew, smile: IV smile, iv + skew * m + smile * m**2 with m = ln(K/S)
+        asof: Sync timestamp (default: now in tz)
+        tz: Timezone for calculations (default: US/Central)
+        seed: Seed for reproducibility
+
+    Returns:
+        Tuple of (calls_df, puts_df, info_dict)
+    """
+    rng = np.random.default_rng(seed)
+    now = datetime.now(tz) if asof is None else asof
+    if isinstance(expiries, int):
+        first = pd.Timestamp(now.date()) + pd.Timedelta(days=1)
+        expiries = [f"{d:%Y-%m-%d}" for d in pd.date_range(first, periods=expiries, freq="W-FRI")]
+
+    info = {
+        "symbol": ticker,
+        "quoteType": "EQUITY",
+        "currency": "USD",
+        "marketState": "REGULAR",
+        "regularMarketPrice": spot,
+        "fiftyTwoWeekLow": round(spot * 0.8, 2),
+        "fiftyTwoWeekHigh": round(spot * 1.2, 2),
+    }
+    # Unique after rounding: equal strikes would get the same OCC contract symbol
+    strike_grid = np.unique(np.round(np.linspace(spot * (1 - strike_range), spot * (1 + strike_range), strikes), 2))
+
+    all_calls, all_puts = [], []
+    for date_str in expiries:
+        expiry = pd.Timestamp(date_str)
+        dte = (expiry.date() - now.date()).days
+        raw_calls = _raw_chain(rng, ticker, spot, expiry, dte, strike_grid, rate, iv, skew, smile, "call")
+        raw_puts = _raw_chain(rng, ticker, spot, expiry, dte, strike_grid, rate, iv, skew, smile, "put")
+        calls, puts = normalize_option_chain(raw_calls, raw_puts, info, date_str, tz, now=now)
+        all_calls.append(calls)
+        all_puts.append(puts)
+
+    return pd.concat(all_calls), pd.concat(all_puts), info
+
+
+def iter_option_chains(
+    tickers: int | list[str], seed: int | None = None, **kwargs
+) -> Iterator[tuple[str, pd.DataFrame, pd.DataFrame, dict[str, Any]]]:
+    """Stream synthetic chains one underlying at a time, see option_chain for kwargs.
+
+    Spots are drawn log-uniformly between 5 and 1000 unless 'spot' is given.
+
+    Yields:
+        Tuples of (ticker, calls_df, puts_df, info_dict)
+    """
+    if isinstance(tickers, int):
+        tickers = [f"SYN{i:04d}" for i in range(tickers)]
+
+    seeds = np.random.SeedSequence(seed).spawn(len(tickers) + 1)
+    spots = np.exp(np.random.default_rng(seeds[0]).uniform(np.log(5), np.log(1000), len(tickers)))
+    for ticker, spot, ticker_seed in zip(tickers, spots, seeds[1:]):
+        chain_kwargs = {"spot": round(float(spot), 2), **kwargs}
+        calls, puts, info = option_chain(ticker, seed=ticker_seed, **chain_kwargs)
+        yield ticker, calls, puts, info
@@ -20,13 +20,40 @@ calls = calls.sort_values(by=["ar", "volume"], ascending=[False, False])
 
 """
 
-from .client import get_spot_price, get_ticker_info, get_available_dates, get_option_chain
-from .spot_resolver import SpotPriceResolver
+import importlib
+
+# name => submodule it lives in; resolved on first access so that importing the package
+# does not import yfinance
+_LAZY_ATTRS = {
+    "QuotePoller": "poller",
+    "SpotPriceResolver": "spot_resolver",
+    "get_spot_price": "client",
+    "get_ticker_info": "client",
+    "get_available_dates": "client",
+    "get_option_chain": "client",
+    "get_option_chains": "client",
+    "normalize_option_chain": "client",
+}
 
 __all__ = [
+    "QuotePoller",
     "SpotPriceResolver",
     "get_spot_price",
     "get_ticker_info",
     "get_available_dates",
     "get_option_chain",
+    "get_option_chains",
+    "normalize_option_chain",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,4 +1,11 @@
-"""Yahoo Finance client for API interactions."""
+"""Yahoo Finance client for API interactions.
+
+Concurrent identical requests (same ticker, same expiry) share one in-flight yfinance
+download, see grynn_pylib.concurrency. Only the raw fetch is shared: every caller gets its
+own frames and dicts, built from copies. Nothing is cached; the next call fetches again.
+"""
+
+import copy
 
 from datetime import datetime
 from datetime import timedelta
@@ -10,13 +17,32 @@ import pandas as pd
 import pytz
 import yfinance as yf
 
+from ...concurrency import single_flight
+from ...decorators import profiled
 from .spot_resolver import SpotPriceResolver
 
 
-# Module-level spot resolver instance
+# Module-level spot resolver instance; it holds no state, so threads can share it
 _spot_resolver = SpotPriceResolver()
 
 
+# Raw yfinance fetches, coalesced across threads; their results are shared and must not be modified
+@single_flight()
+def _fetch_info(ticker_str: str) -> dict[str, Any]:
+    return yf.Ticker(ticker_str).info
+
+
+@single_flight()
+def _fetch_options(ticker_str: str) -> tuple[str, ...]:
+    return yf.Ticker(ticker_str).options
+
+
+@single_flight()
+def _fetch_option_chain(ticker_str: str, date_str: str) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, Any]]:
+    calls, puts, info = yf.Ticker(ticker_str).option_chain(date_str)
+    return calls, puts, info
+
+
 def get_spot_price(ticker: str | yf.Ticker) -> tuple[float, datetime, str, str]:
     """Get spot price information for a ticker.
 
@@ -35,11 +61,8 @@ def get_spot_price(ticker: str | yf.Ticker) -> tuple[float, datetime, str, str]:
         >>> print(f"{price} {currency} ({kind})")
         150.25 USD (regularMarketPrice)
     """
-    # Convert string to Ticker object if needed
-    if isinstance(ticker, str):
-        ticker = yf.Ticker(ticker)
-
-    info = ticker.info
+    # A caller's own Ticker object is used as is; symbols share the fetch (info is only read here)
+    info = _fetch_info(ticker) if isinstance(ticker, str) else ticker.info
 
     # Get price and reason (format: "key - marketState")
     price, reason = _spot_resolver.resolve_price_and_state(info)
@@ -76,8 +99,7 @@ def get_ticker_info(ticker_str: str) -> dict[str, Any]:
     Returns:
         Dictionary containing ticker info
     """
-    ticker = yf.Ticker(ticker_str)
-    return ticker.info
+    return copy.deepcopy(_fetch_info(ticker_str))
 
 
 def get_available_dates(ticker_str: str) -> list[str]:
@@ -92,9 +114,8 @@ def get_available_dates(ticker_str: str) -> list[str]:
     Raises:
         Exception: If no options data available
     """
-    ticker = yf.Ticker(ticker_str)
     try:
-        available_dates = ticker.options
+        available_dates = _fetch_options(ticker_str)
         if not available_dates:
             raise ValueError(f"No options data available for {ticker_str}")
         return list(available_dates)
@@ -103,8 +124,13 @@ def get_available_dates(ticker_str: str) -> list[str]:
         raise
 
 
+@profiled()
 def get_option_chain(
-    ticker_str: str, date_str: str, tz: pytz.BaseTzInfo = pytz.timezone("US/Central")
+    ticker_str: str,
+    date_str: str,
+    tz: pytz.BaseTzInfo = pytz.timezone("US/Central"),
+    enhance: bool = False,
+    rate: float = 0.05,
 ) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, Any]]:
     """Download option chain for a given date and enhance it with additional data.
 
@@ -112,15 +138,74 @@ def get_option_chain(
         ticker_str: Ticker symbol (e.g., 'AAPL')
         date_str: Expiration date in YYYY-MM-DD format
         tz: Timezone for calculations (default: US/Central)
+        enhance: Also add Greeks, moneyness, time value and 'ar' (see finance.chains.enrich_chain)
+        rate: Risk-free rate for the Greeks when enhance=True
 
     Returns:
         Tuple of (calls_df, puts_df, info_dict)
     """
-    ticker = yf.Ticker(ticker_str)
     log.info(f"Retrieving option chain for {ticker_str} on {date_str}")
 
-    calls, puts, info = ticker.option_chain(date_str)
+    calls, puts, info = _fetch_option_chain(ticker_str, date_str)
+    # normalize_option_chain works in place, and concurrent callers share the raw fetch
+    calls, puts, info = calls.copy(), puts.copy(), copy.deepcopy(info)
+    calls, puts = normalize_option_chain(calls, puts, info, date_str, tz)
+
+    if enhance:
+        from ...finance import chains
+
+        calls = chains.enrich_chain(calls, "call", rate=rate)
+        puts = chains.enrich_chain(puts, "put", rate=rate)
+
+    return calls, puts, info
+
 
+def get_option_chains(
+    ticker_str: str,
+    max_expiries: int | None = None,
+    tz: pytz.BaseTzInfo = pytz.timezone("US/Central"),
+    enhance: bool = False,
+    rate: float = 0.05,
+) -> pd.DataFrame:
+    """Every expiry of a ticker (or the nearest max_expiries) in one frame, see get_option_chain.
+
+    Returns:
+        Calls and puts concatenated, with an 'option_type' column ("call" / "put")
+    """
+    parts = []
+    for date_str in get_available_dates(ticker_str)[:max_expiries]:
+        calls, puts, _ = get_option_chain(ticker_str, date_str, tz=tz, enhance=enhance, rate=rate)
+        parts += [calls.assign(option_type="call"), puts.assign(option_type="put")]
+    if not parts:
+        raise ValueError(f"No expiries available for {ticker_str}")
+    return pd.concat(parts)
+
+
+@profiled()
+def normalize_option_chain(
+    calls: pd.DataFrame,
+    puts: pd.DataFrame,
+    info: dict[str, Any],
+    date_str: str,
+    tz: pytz.BaseTzInfo = pytz.timezone("US/Central"),
+    now: datetime | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Add dte/spot/expiry and underlying fields to raw yfinance calls/puts frames and normalize them.
+
+    The frames are modified in place: columns become snake_case, contract_symbol becomes the
+    index, and last_price/implied_volatility are renamed to last/iv.
+
+    Args:
+        calls: Raw calls frame as returned by yfinance.Ticker.option_chain
+        puts: Raw puts frame as returned by yfinance.Ticker.option_chain
+        info: Underlying info dict (used for spot, 52 week range and symbol)
+        date_str: Expiration date in YYYY-MM-DD format
+        tz: Timezone for calculations (default: US/Central)
+        now: Sync timestamp (default: current time in tz)
+
+    Returns:
+        Tuple of (calls_df, puts_df)
+    """
     # Resolve spot price
     spot = _spot_resolver.resolve_spot(info)
     assert spot > 0, "Could not get spot price from currentPrice || regularMarketPrice || previousClose"
@@ -128,7 +213,7 @@ def get_option_chain(
     # Compute days to expiry (DTE)
     # Default option expiry is 3pm CST (index options are 3:15pm CST/CDT)
     date_expiry = tz.localize(datetime.strptime(date_str, "%Y-%m-%d") + timedelta(hours=15))
-    current_timestamp_tz = datetime.now(tz)
+    current_timestamp_tz = datetime.now(tz) if now is None else now
 
     # Settlement happens one day after expiry
     # So an option expiring today is settled tomorrow
@@ -150,7 +235,7 @@ def get_option_chain(
         df.columns = [inflection.underscore(col) for col in df.columns]
 
         # Convert 'in_the_money' to boolean
-        df["in_the_money"] = df["in_the_money"].map({"True": True, "False": False}).astype(bool)
+        df["in_the_money"] = df["in_the_money"].astype(str).map({"True": True, "False": False}).astype(bool)
 
         # Set contract_symbol as index (verify_integrity => ensure no duplicates)
         df.set_index("contract_symbol", inplace=True, verify_integrity=True)
@@ -158,4 +243,4 @@ def get_option_chain(
         # Rename columns - making them easier to work with
         df.rename(columns={"last_price": "last", "implied_volatility": "iv"}, inplace=True)
 
-    return calls, puts, info
+    return calls, puts
@@ -0,0 +1,255 @@
+"""Watchlist quote poller that adapts its pace to each symbol's marketState.
+
+Every symbol has its own next-due time. A poll step fetches all due symbols in batches
+(one Yahoo quote request per batch of up to 'batch_size' symbols), resolves the spot price
+with SpotPriceResolver, and schedules the symbol again after the interval for its
+marketState: fast in REGULAR hours, slower around them, slowest when CLOSED (None parks
+the symbol until refresh()). Changed quotes are pushed to subscribers (callbacks) and to
+async iterators.
+
+Usage example:
+    from grynn_pylib.data_providers.yahoo_finance.poller import QuotePoller
+
+    poller = QuotePoller(["AAPL", "QQQ", "RELIANCE.NS"])
+    poller.subscribe(lambda q: print(q.symbol, q.price, q.state))
+    poller.start()                      # background thread
+    ...
+    poller.stop()
+
+    async for quote in poller.stream():  # inside a coroutine; starts the thread if needed
+        ...
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable
+
+from loguru import logger as log
+
+from .spot_resolver import SpotPriceResolver
+
+# Seconds between polls per Yahoo marketState; None = stop polling until refresh()
+DEFAULT_INTERVALS: dict[str, float | None] = {
+    "REGULAR": 15,
+    "PRE": 60,
+    "POST": 60,
+    "PREPRE": 900,
+    "POSTPOST": 900,
+    "CLOSED": 1800,
+}
+
+_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+
+# Quote time field for each resolved price field; anything else uses regularMarketTime
+_TIME_FIELDS = {"preMarketPrice": "preMarketTime", "postMarketPrice": "postMarketTime"}
+
+
+@dataclass(frozen=True)
+class Quote:
+    symbol: str
+    price: float
+    kind: str  # resolved price field, e.g. "regularMarketPrice"
+    state: str  # Yahoo marketState
+    currency: str | None
+    timestamp: datetime | None  # quote time reported by Yahoo
+    fetched_at: datetime
+
+
+def yahoo_quotes(symbols: list[str]) -> dict[str, dict[str, Any]]:
+    """Default fetcher: one v7 quote request for all 'symbols' (marketState and price fields)."""
+    from yfinance.data import YfData
+
+    result = YfData().get_raw_json(_QUOTE_URL, params={"symbols": ",".join(symbols), "formatted": "false"})
+    return {q["symbol"]: q for q in (result.get("quoteResponse") or {}).get("result") or []}
+
+
+class QuotePoller:
+    """Keeps the quotes of a watchlist fresh, see the module docstring.
+
+    Args:
+        symbols: Initial watchlist
+        intervals: Seconds between polls per marketState (missing states use "CLOSED")
+        batch_size: Symbols per request
+        error_backoff: Seconds before retrying symbols whose fetch failed or returned nothing
+        only_changes: Publish a quote only when its price or state changed
+        fetch: fetch(symbols) -> {symbol: info dict} (default: yahoo_quotes)
+        clock: Monotonic clock in seconds (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        symbols: list[str] | None = None,
+        intervals: dict[str, float | None] | None = None,
+        batch_size: int = 50,
+        error_backoff: float = 30,
+        only_changes: bool = True,
+        fetch: Callable[[list[str]], dict[str, dict[str, Any]]] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.intervals = {**DEFAULT_INTERVALS, **(intervals or {})}
+        self.batch_size = batch_size
+        self.error_backoff = error_backoff
+        self.only_changes = only_changes
+        self.fetch = fetch or yahoo_quotes
+        self.clock = clock
+        self.requests = 0
+
+        self._resolver = SpotPriceResolver()
+        self._lock = threading.Lock()
+        self._due: dict[str, float | None] = {}
+        self._quotes: dict[str, Quote] = {}
+        self._subscribers: list[Callable[[Quote], None]] = []
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.watch(symbols or [])
+
+    # -- watchlist -----------------------------------------------------------------------
+
+    def watch(self, symbols: list[str] | str) -> None:
+        """Add symbols; new ones are due immediately."""
+        symbols = [symbols] if isinstance(symbols, str) else symbols
+        with self._lock:
+            for symbol in symbols:
+                self._due.setdefault(symbol, 0.0)
+        self._wake.set()
+
+    def unwatch(self, symbols: list[str] | str) -> None:
+        symbols = [symbols] if isinstance(symbols, str) else symbols
+        with self._lock:
+            for symbol in symbols:
+                self._due.pop(symbol, None)
+                self._quotes.pop(symbol, None)
+
+    def refresh(self, symbols: list[str] | None = None) -> None:
+        """Make symbols (default: all, parked ones included) due now."""
+        with self._lock:
+            for symbol in self._due if symbols is None else symbols:
+                if symbol in self._due:
+                    self._due[symbol] = 0.0
+        self._wake.set()
+
+    @property
+    def quotes(self) -> dict[str, Quote]:
+        """Latest quote per symbol."""
+        with self._lock:
+            return dict(self._quotes)
+
+    # -- subscribers ---------------------------------------------------------------------
+
+    def subscribe(self, callback: Callable[[Quote], None]) -> Callable[[], None]:
+        """Call 'callback' with each published quote (from the polling thread); returns an unsubscribe function."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    async def stream(self) -> AsyncIterator[Quote]:
+        """Async iterator over published quotes; starts the polling thread if it is not running."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[Quote] = asyncio.Queue()
+        unsubscribe = self.subscribe(lambda quote: loop.call_soon_threadsafe(queue.put_nowait, quote))
+        if self._thread is None:
+            self.start()
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            unsubscribe()
+
+    # -- polling -------------------------------------------------------------------------
+
+    def _interval(self, state: str) -> float | None:
+        return self.intervals.get(state, self.intervals.get("CLOSED"))
+
+    def _to_quote(self, symbol: str, info: dict[str, Any], fetched_at: datetime) -> Quote:
+        price, reason = self._resolver.resolve_price_and_state(info)
+        kind, _, state = reason.partition(" - ")
+        time_field = info.get(_TIME_FIELDS.get(kind, "regularMarketTime")) or info.get("regularMarketTime")
+        timestamp = datetime.fromtimestamp(time_field) if time_field else None
+        return Quote(symbol, price, kind, state or "UNKNOWN", info.get("currency"), timestamp, fetched_at)
+
+    def poll_once(self) -> list[Quote]:
+        """Fetch every due symbol (in batches) and publish the results; returns the published quotes."""
+        now = self.clock()
+        with self._lock:
+            due = [s for s, t in self._due.items() if t is not None and t <= now]
+
+        published = []
+        for b0 in range(0, len(due), self.batch_size):
+            batch = due[b0 : b0 + self.batch_size]
+            self.requests += 1
+            try:
+                infos = self.fetch(batch)
+            except Exception as e:
+                log.warning(f"Quote request for {len(batch)} symbols failed: {e}")
+                infos = {}
+            fetched_at = datetime.now()
+
+            updates = []
+            with self._lock:
+                for symbol in batch:
+                    if symbol not in self._due:
+                        continue  # unwatched meanwhile
+                    try:
+                        quote = self._to_quote(symbol, infos[symbol], fetched_at)
+                    # Malformed Yahoo data must not kill the polling thread
+                    except (KeyError, ValueError, TypeError, OverflowError, OSError) as e:
+                        log.debug(f"No quote for {symbol}: {e}")
+                        self._due[symbol] = now + self.error_backoff
+                        continue
+                    interval = self._interval(quote.state)
+                    self._due[symbol] = None if interval is None else now + interval
+                    previous = self._quotes.get(symbol)
+                    self._quotes[symbol] = quote
+                    changed = previous is None or (previous.price, previous.state) != (quote.price, quote.state)
+                    if changed or not self.only_changes:
+                        updates.append(quote)
+                subscribers = list(self._subscribers)
+
+            for quote in updates:
+                for callback in subscribers:
+                    try:
+                        callback(quote)
+                    except Exception as e:
+                        log.warning(f"Quote subscriber failed for {quote.symbol}: {e}")
+            published += updates
+        return published
+
+    def next_due(self) -> float | None:
+        """Clock time of the next scheduled poll (None when every symbol is parked)."""
+        with self._lock:
+            times = [t for t in self._due.values() if t is not None]
+        return min(times) if times else None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            self.poll_once()
+            next_due = self.next_due()
+            # Sleep until the next symbol is due, or until watch()/refresh()/stop() wakes us
+            timeout = None if next_due is None else max(next_due - self.clock(), 0.05)
+            self._wake.wait(timeout)
+
+    def start(self) -> None:
+        """Poll in a daemon thread until stop()."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="QuotePoller", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -1,11 +1,16 @@
+import json
+import math
+import os
+import threading
 import time
+import tracemalloc
 from functools import wraps
 from loguru import logger
 
 
-def timed_call(logger_instance):
+def timed_call(logger_instance=None):
     if logger_instance is None:
-        logger_instance = logger.getLogger(__name__)
+        logger_instance = logger
 
     def decorator(func):
         @wraps(func)
@@ -20,3 +25,365 @@ def timed_call(logger_instance):
         return wrapper
 
     return decorator
+
+
+# Latency histogram: log-spaced buckets from 1µs to 100,000s, 10 per decade (~26% wide)
+_HIST_MIN_SECONDS = 1e-6
+_HIST_BUCKETS_PER_DECADE = 10
+_HIST_BUCKETS = 11 * _HIST_BUCKETS_PER_DECADE
+_MEM_TOP_SITES = 10
+# Deep enough to get from numpy/pandas internals back to the grynn_pylib line that caused them
+_MEM_TRACE_FRAMES = 32
+_THIS_FILE = os.path.abspath(__file__)
+_PACKAGE_DIR = os.path.dirname(_THIS_FILE)
+
+
+class _MemoryTrace:
+    """tracemalloc around one call: peak and net bytes, and the sites of allocations still alive at the end.
+
+    A site is the innermost grynn_pylib line on the allocation's stack (so a pandas temporary
+    is charged to the library line that asked for it), or the innermost frame otherwise.
+
+    Only one trace runs at a time (tracemalloc is process-wide); nested or concurrent profiled
+    calls are not memory-sampled while another trace is active.
+    """
+
+    _active = threading.Lock()
+
+    def __init__(self, top_n: int):
+        self.top_n = top_n
+        self.owns_tracing = False
+        self.base = 0
+
+    def start(self) -> bool:
+        if not self._active.acquire(blocking=False):
+            return False
+        if tracemalloc.is_tracing():
+            # Someone else is tracing: measure with reset_peak, without disturbing their traces
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start(_MEM_TRACE_FRAMES)
+            self.owns_tracing = True
+        self.base = tracemalloc.get_traced_memory()[0]
+        return True
+
+    def stop(self) -> tuple[int, int, list[tuple[str, int]]]:
+        try:
+            current, peak = tracemalloc.get_traced_memory()
+            sites = []
+            # Only when we started tracing is the snapshot limited to this call's allocations
+            if self.owns_tracing and self.top_n:
+                snapshot = tracemalloc.take_snapshot().filter_traces(
+                    [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, _THIS_FILE)]
+                )
+                by_site: dict[str, int] = {}
+                for trace in snapshot.traces:
+                    frame = next(
+                        (
+                            f
+                            for f in reversed(trace.traceback)
+                            if f.filename.startswith(_PACKAGE_DIR) and f.filename != _THIS_FILE
+                        ),
+                        trace.traceback[-1],
+                    )
+                    site = f"{frame.filename}:{frame.lineno}"
+                    by_site[site] = by_site.get(site, 0) + trace.size
+                sites = sorted(by_site.items(), key=lambda item: item[1], reverse=True)[: self.top_n]
+            return max(peak - self.base, 0), current - self.base, sites
+        finally:
+            if self.owns_tracing:
+                tracemalloc.stop()
+            self._active.release()
+
+
+class _CallStats:
+    """Counters, latency histogram and allocation totals for one profiled name."""
+
+    __slots__ = (
+        "calls",
+        "sampled",
+        "total",
+        "min",
+        "max",
+        "buckets",
+        "mem_sampled",
+        "mem_peak_total",
+        "mem_peak_max",
+        "mem_net_total",
+        "mem_sites",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.sampled = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.buckets = [0] * _HIST_BUCKETS
+        self.mem_sampled = 0
+        self.mem_peak_total = 0
+        self.mem_peak_max = 0
+        self.mem_net_total = 0
+        self.mem_sites: dict[str, int] = {}
+
+    def record(self, seconds: float) -> None:
+        self.sampled += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        bucket = int(math.log10(max(seconds, _HIST_MIN_SECONDS) / _HIST_MIN_SECONDS) * _HIST_BUCKETS_PER_DECADE)
+        self.buckets[min(bucket, _HIST_BUCKETS - 1)] += 1
+
+    def record_memory(self, peak: int, net: int, sites: list[tuple[str, int]]) -> None:
+        self.mem_sampled += 1
+        self.mem_peak_total += peak
+        self.mem_peak_max = max(self.mem_peak_max, peak)
+        self.mem_net_total += net
+        for site, size in sites:
+            self.mem_sites[site] = self.mem_sites.get(site, 0) + size
+
+    def percentile(self, q: float) -> float:
+        """Upper edge of the bucket holding the q-th sample, clamped to the observed min/max."""
+        if not self.sampled:
+            return math.nan
+        rank = q * self.sampled
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                edge = _HIST_MIN_SECONDS * 10 ** ((bucket + 1) / _HIST_BUCKETS_PER_DECADE)
+                return min(max(edge, self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float | int | list]:
+        sampled = self.sampled
+        summary = {
+            "calls": self.calls,
+            "sampled": sampled,
+            "total_s": self.total,
+            "mean_s": self.total / sampled if sampled else math.nan,
+            "min_s": self.min if sampled else math.nan,
+            "max_s": self.max if sampled else math.nan,
+            "p50_s": self.percentile(0.50),
+            "p95_s": self.percentile(0.95),
+            "p99_s": self.percentile(0.99),
+        }
+        if self.mem_sampled:
+            top_sites = sorted(self.mem_sites.items(), key=lambda item: item[1], reverse=True)[:_MEM_TOP_SITES]
+            summary |= {
+                "mem_sampled": self.mem_sampled,
+                "mem_peak_max_bytes": self.mem_peak_max,
+                "mem_peak_mean_bytes": self.mem_peak_total / self.mem_sampled,
+                "mem_net_mean_bytes": self.mem_net_total / self.mem_sampled,
+                # Summed over sampled calls: bytes still allocated at return, by source line
+                "mem_top_sites": [[site, size] for site, size in top_sites],
+            }
+        return summary
+
+
+class ProfileRegistry:
+    """Per-function call counts, latency histograms (p50/p95/p99) and, opt-in, allocations.
+
+    When disabled, profiled functions cost one attribute check per call. When enabled,
+    every call is counted and every n-th call (n = 1 / sample_rate) is timed.
+
+    With memory=True, every m-th call (m = 1 / memory_sample_rate) also runs under
+    tracemalloc and records peak and net bytes and the top allocation sites. tracemalloc
+    slows the traced call down several times, so keep memory_sample_rate low in production.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        sample_rate: float = 1.0,
+        memory: bool = False,
+        memory_sample_rate: float = 0.01,
+        memory_top_n: int = 5,
+    ):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.memory = memory
+        self.memory_sample_rate = memory_sample_rate
+        self.memory_top_n = memory_top_n
+        self._stats: dict[str, _CallStats] = {}
+        self._lock = threading.Lock()
+
+    def enable(
+        self, sample_rate: float | None = None, memory: bool | None = None, memory_sample_rate: float | None = None
+    ) -> None:
+        if sample_rate is not None:
+            self.sample_rate = sample_rate
+        if memory is not None:
+            self.memory = memory
+        if memory_sample_rate is not None:
+            self.memory_sample_rate = memory_sample_rate
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def _get(self, name: str) -> _CallStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(name, _CallStats())
+        return stats
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record one timed call of 'name' (counted and sampled)."""
+        stats = self._get(name)
+        with self._lock:
+            stats.calls += 1
+            stats.record(seconds)
+
+    def record_memory(self, name: str, peak: int, net: int, sites: list[tuple[str, int]]) -> None:
+        """Record the allocations of one memory-sampled call of 'name'."""
+        stats = self._get(name)
+        with self._lock:
+            stats.record_memory(peak, net, sites)
+
+    def _memory_every(self) -> int:
+        if not self.memory or self.memory_sample_rate <= 0:
+            return 0
+        return max(1, round(1 / self.memory_sample_rate))
+
+    def snapshot(self) -> dict[str, dict[str, float | int | list]]:
+        """Summary per name: calls, sampled, total/mean/min/max and p50/p95/p99 latency in seconds.
+
+        Names with memory-sampled calls also get mem_sampled, mem_peak_max_bytes,
+        mem_peak_mean_bytes, mem_net_mean_bytes and mem_top_sites.
+        """
+        with self._lock:
+            return {name: stats.summary() for name, stats in sorted(self._stats.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def to_json(self, path: str | os.PathLike | None = None, indent: int = 2) -> str:
+        """Snapshot as JSON (NaN for unsampled fields becomes null); also written to 'path' if given."""
+        snapshot = {
+            name: {k: None if isinstance(v, float) and math.isnan(v) else v for k, v in summary.items()}
+            for name, summary in self.snapshot().items()
+        }
+        text = json.dumps(snapshot, indent=indent)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+
+
+# Enabled from the environment so production processes can opt in without code changes
+registry = ProfileRegistry(
+    enabled=os.environ.get("GRYNN_PROFILE", "") not in ("", "0"),
+    memory=os.environ.get("GRYNN_PROFILE_MEMORY", "") not in ("", "0"),
+)
+
+
+class profiled:
+    """Profile a function (as a decorator) or a block (as a context manager) into a registry.
+
+    Both forms count every call and time every n-th one (n = 1 / sample_rate, defaulting
+    to the registry's sample_rate).
+
+    Usage example:
+        @profiled()
+        def bs_price(...): ...
+
+        with profiled("load_prices"):
+            df = yf.download(...)
+
+        registry.enable(sample_rate=0.1)
+        registry.snapshot()["grynn_pylib.finance.options.bs_price"]["p99_s"]
+
+        registry.enable(memory=True, memory_sample_rate=0.05)
+        registry.snapshot()["grynn_pylib.finance.timeseries.rolling_return"]["mem_top_sites"]
+    """
+
+    def __init__(
+        self, name: str | None = None, sample_rate: float | None = None, registry: ProfileRegistry | None = None
+    ):
+        self.name = name
+        self.sample_rate = sample_rate
+        self.registry = registry
+        self._local = threading.local()
+
+    def _registry(self) -> ProfileRegistry:
+        # Resolved per call so that rebinding the module-level registry (e.g. in tests) is honoured
+        return self.registry if self.registry is not None else registry
+
+    def _sample_every(self, reg: ProfileRegistry) -> int:
+        rate = self.sample_rate if self.sample_rate is not None else reg.sample_rate
+        return max(1, round(1 / rate)) if rate > 0 else 0
+
+    def __call__(self, func):
+        name = self.name or f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            reg = self._registry()
+            if not reg.enabled:
+                return func(*args, **kwargs)
+
+            stats = reg._get(name)
+            # Unlocked on purpose: the count may drop an increment under heavy thread contention
+            stats.calls += 1
+            calls = stats.calls
+            mem_every = reg._memory_every()
+            trace = _MemoryTrace(reg.memory_top_n) if mem_every and not calls % mem_every else None
+            every = self._sample_every(reg)
+            timed = every and not calls % every
+            if not timed and trace is None:
+                return func(*args, **kwargs)
+
+            traced = trace is not None and trace.start()
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                memory = trace.stop() if traced else None
+                with reg._lock:
+                    # tracemalloc inflates latency, so traced calls are left out of the timing histogram
+                    if timed and not traced:
+                        stats.record(elapsed)
+                    if memory is not None:
+                        stats.record_memory(*memory)
+
+        return wrapper
+
+    def __enter__(self):
+        if self.name is None:
+            raise ValueError("profiled() needs a name when used as a context manager")
+        reg = self._registry()
+        timed, trace = False, None
+        if reg.enabled:
+            # Same sampling as the decorator: count every block, time every n-th, trace every m-th
+            stats = reg._get(self.name)
+            with reg._lock:
+                stats.calls += 1
+                calls = stats.calls
+            mem_every = reg._memory_every()
+            if mem_every and not calls % mem_every:
+                trace = _MemoryTrace(reg.memory_top_n)
+                trace = trace if trace.start() else None
+            every = self._sample_every(reg)
+            timed = bool(every) and not calls % every
+        # A stack per thread, so the same instance can be nested or shared across threads
+        stack = self._local.__dict__.setdefault("starts", [])
+        stack.append((time.perf_counter() if timed or trace is not None else None, trace, reg))
+        return self
+
+    def __exit__(self, *exc):
+        start, trace, reg = self._local.starts.pop()
+        if start is not None:
+            elapsed = time.perf_counter() - start
+            memory = trace.stop() if trace is not None else None
+            stats = reg._get(self.name)
+            with reg._lock:
+                # As in the decorator, traced blocks are left out of the timing histogram
+                if memory is None:
+                    stats.record(elapsed)
+                else:
+                    stats.record_memory(*memory)
+        return False
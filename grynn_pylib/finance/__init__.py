@@ -1,6 +1,27 @@
 """Finance module for options pricing and timeseries analysis."""
 
-from . import options
-from . import timeseries
+import importlib
 
-__all__ = ["options", "timeseries"]
+__all__ = [
+    "alignment",
+    "backtest",
+    "calendars",
+    "chains",
+    "covariance",
+    "data_quality",
+    "options",
+    "out_of_core",
+    "parallel",
+    "parity",
+    "timeseries",
+]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
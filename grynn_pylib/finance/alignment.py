@@ -0,0 +1,153 @@
+"""As-of alignment of series from different exchanges and timezones by integer gather.
+
+An Aligner is built once from the indexes of its sources: each index is reduced to local
+wall-clock dates (tz dropped, like remove_tz, then normalized to midnight), the target
+index is their sorted union (or a given index), and for every source the position of its
+last row on or before each target date is precomputed. Aligning a frame is then a single
+numpy take on those positions, so repeated cross-market operations (an NSE price frame
+times a UTC FX series, a US and an Indian panel side by side) do not realign in pandas.
+
+Aligners are cached by the content of their indexes, so align()/asof() only build the
+position maps the first time a given combination of indexes is seen.
+
+Usage example:
+    from grynn_pylib.finance import alignment
+
+    nse, fx = alignment.align(nse_prices, usdinr)  # union of dates, last known values
+    usd = nse.div(fx.squeeze(axis=1), axis=0)
+
+    rate = alignment.asof(usdinr, nse_prices.index)  # as-of onto one index, as to_usd does
+    aligner = alignment.Aligner([spy.index, nifty.index], tolerance=pd.Timedelta(days=5))
+    spy_u, nifty_u = aligner.align(spy, nifty)
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from ..decorators import profiled
+
+_CACHE_SIZE = 64
+_cache: OrderedDict = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _dates(index: pd.Index, normalize: bool) -> pd.DatetimeIndex:
+    """Local wall-clock dates of 'index' (tz dropped), optionally floored to midnight."""
+    # One resolution for all sources, so positions and tolerances compare in the same unit
+    index = pd.DatetimeIndex(index).as_unit("ns")
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.normalize() if normalize else index
+
+
+def _fingerprint(index: pd.Index) -> tuple:
+    values = pd.DatetimeIndex(index).as_unit("ns").asi8
+    return (str(getattr(index, "tz", None)), len(values), hash(values.tobytes()))
+
+
+class Aligner:
+    """Union (or target) index and per-source as-of positions, see the module docstring.
+
+    Args:
+        indexes: Index of each source, in the order frames are passed to align()
+        target: Align onto this index instead of the union of the sources
+        tolerance: Leave values older than this (relative to the target date) as NaN
+        normalize: Compare dates only (daily data across exchanges); False keeps times
+    """
+
+    def __init__(
+        self,
+        indexes: list[pd.Index],
+        target: pd.Index | None = None,
+        tolerance: pd.Timedelta | None = None,
+        normalize: bool = True,
+    ):
+        sources = [_dates(index, normalize) for index in indexes]
+        for dates in sources:
+            if not dates.is_monotonic_increasing:
+                raise ValueError("Source indexes must be sorted in increasing order")
+        if target is None:
+            target = sources[0]
+            for dates in sources[1:]:
+                target = target.union(dates)
+            target = target.unique()
+        else:
+            target = _dates(target, normalize)
+        self.index = target
+        self._fingerprints = [_fingerprint(index) for index in indexes]
+
+        t = target.asi8
+        self.positions = []
+        for dates in sources:
+            pos = np.searchsorted(dates.asi8, t, side="right") - 1
+            if tolerance is not None:
+                stale = t - dates.asi8[np.maximum(pos, 0)] > pd.Timedelta(tolerance).value
+                pos = np.where(stale, -1, pos)
+            self.positions.append(pos)
+
+    def take(self, data: pd.DataFrame | pd.Series, source: int = 0) -> pd.DataFrame | pd.Series:
+        """Values of 'data' (indexed like source 'source') as of each target date; NaN before its first row."""
+        pos = self.positions[source]
+        n_rows = self._fingerprints[source][1]
+        if len(data) != n_rows:
+            raise ValueError(f"data has {len(data)} rows, source {source} has {n_rows}")
+        missing = pos < 0
+        values = data.to_numpy()
+        if not len(values):
+            taken = np.full((len(pos),) + values.shape[1:], np.nan)
+        else:
+            taken = values[np.where(missing, 0, pos)]
+        if missing.any():
+            taken = taken.astype(np.result_type(taken.dtype, np.float64), copy=False)
+            taken[missing] = np.nan
+        if isinstance(data, pd.Series):
+            return pd.Series(taken, index=self.index, name=data.name)
+        return pd.DataFrame(taken, index=self.index, columns=data.columns)
+
+    @profiled()
+    def align(self, *frames: pd.DataFrame | pd.Series) -> tuple:
+        """Every source frame on the target index, in the order the indexes were given."""
+        if len(frames) != len(self.positions):
+            raise ValueError(f"Expected {len(self.positions)} frames, got {len(frames)}")
+        return tuple(self.take(frame, i) for i, frame in enumerate(frames))
+
+
+def aligner(
+    indexes: list[pd.Index],
+    target: pd.Index | None = None,
+    tolerance: pd.Timedelta | None = None,
+    normalize: bool = True,
+) -> Aligner:
+    """Cached Aligner for these indexes (keyed by index content, not identity)."""
+    key = (
+        tuple(_fingerprint(index) for index in indexes),
+        None if target is None else _fingerprint(target),
+        None if tolerance is None else pd.Timedelta(tolerance).value,
+        normalize,
+    )
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+    # Built outside the lock so a slow build does not block other keys
+    result = Aligner(indexes, target=target, tolerance=tolerance, normalize=normalize)
+    with _cache_lock:
+        # Another thread may have built the same key meanwhile: keep the first one
+        result = _cache.setdefault(key, result)
+        _cache.move_to_end(key)
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return result
+
+
+def align(*frames: pd.DataFrame | pd.Series, target: pd.Index | None = None, tolerance=None, normalize=True) -> tuple:
+    """Align frames on the union of their dates (or 'target') with as-of (last known value) semantics."""
+    return aligner([f.index for f in frames], target, tolerance, normalize).align(*frames)
+
+
+def asof(data: pd.DataFrame | pd.Series, target: pd.Index, tolerance=None, normalize=True):
+    """'data' as of each date of 'target' (the result has target's dates, tz dropped)."""
+    return aligner([data.index], target, tolerance, normalize).take(data)
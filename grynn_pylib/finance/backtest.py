@@ -0,0 +1,239 @@
+"""Vectorized backtests of option-writing programs on underlying price history.
+
+Historical chains are not available, so premiums and marks come from Black-Scholes with a
+volatility proxy: trailing realized volatility (times a premium factor) or a supplied
+series such as VIX / 100. Strikes are continuous (not rounded to listed strikes).
+
+Every entry date is evaluated at once: for each ticker the engine builds an
+(entries x holding days) matrix of option marks, applies the exit rules to the whole
+matrix, and derives the per-entry trade table. The rolling program (enter, exit, re-enter
+on the exit date) then only follows exit pointers through that table.
+
+Usage example:
+    from grynn_pylib.finance import backtest, timeseries
+
+    result = backtest.run(prices, strategy="short_put", dte=30, delta=0.3, take_profit=0.5)
+    result.trades.groupby(level="ticker")["annualized_return"].describe()
+    timeseries.rolling_cagr(result.equity, years=5)
+    timeseries.drawdowns(result.equity)
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from ..decorators import profiled
+from . import options
+from .options import _norm_ppf
+
+STRATEGIES = ("short_put", "covered_call")
+TRADING_DAYS_PER_YEAR = 252
+
+
+@dataclass
+class BacktestResult:
+    """trades: one row per (ticker, entry date) with every entry evaluated independently.
+    equity: rolling program value (dates x tickers, starts at 1.0), NaN outside the program.
+    """
+
+    trades: pd.DataFrame
+    equity: pd.DataFrame
+
+
+def _bs_value(spot, strike, t, rate, vol, is_call: bool):
+    """bs_price on year fractions, intrinsic value once t <= 0."""
+    live = t > 0
+    option_type = "call" if is_call else "put"
+    with np.errstate(divide="ignore", invalid="ignore"):
+        value = options.bs_price(spot, strike, np.where(live, t, 1.0) * 365, rate, vol, option_type)
+    intrinsic = np.maximum(spot - strike, 0) if is_call else np.maximum(strike - spot, 0)
+    return np.where(live, value, intrinsic)
+
+
+def _strikes(spot, t, rate, vol, is_call: bool, delta: float | None, moneyness: float | None):
+    """Strike at a target |delta| (Black-Scholes inversion) or at spot * moneyness."""
+    if delta is not None:
+        d1 = _norm_ppf(delta if is_call else 1 - delta)
+        return spot * np.exp(-d1 * vol * np.sqrt(t) + (rate + 0.5 * vol**2) * t)
+    return spot * moneyness
+
+
+def realized_vol(prices: pd.DataFrame, window: int = 21) -> pd.DataFrame:
+    """Annualized trailing volatility of daily log returns."""
+    return np.log(prices).diff().rolling(window).std() * np.sqrt(TRADING_DAYS_PER_YEAR)
+
+
+def _run_one(
+    dates: np.ndarray,
+    spot: np.ndarray,
+    vol: np.ndarray,
+    is_call: bool,
+    dte: int,
+    rate: float,
+    delta: float | None,
+    moneyness: float | None,
+    take_profit: float | None,
+    stop_loss: float | None,
+    roll_dte: int | None,
+):
+    """Trade table columns and the (entries x days) capital-ratio matrix for one ticker."""
+    n = len(dates)
+    expiry = dates + np.timedelta64(dte, "D")
+    natural_exit = np.searchsorted(dates, expiry, side="right") - 1
+    # An entry needs a later session on or before its expiry, so every trade lasts at least one day
+    valid = (expiry <= dates[-1]) & (natural_exit > np.arange(n)) & np.isfinite(spot) & np.isfinite(vol) & (vol > 0)
+    entries = np.flatnonzero(valid)
+    if not len(entries):
+        return None
+
+    horizon = int((natural_exit[entries] - entries).max())
+    offsets = np.arange(horizon + 1)
+    path = np.minimum(entries[:, None] + offsets[None, :], n - 1)
+    held = offsets[None, :] <= (natural_exit[entries] - entries)[:, None]
+
+    s0, v0 = spot[entries], vol[entries]
+    t0 = dte / 365
+    strike = _strikes(s0, t0, rate, v0, is_call, delta, moneyness)
+    premium = _bs_value(s0, strike, t0, rate, v0, is_call)
+
+    # Marks along the holding path, vol proxy of each day
+    remaining_days = (expiry[entries][:, None] - dates[path]) / np.timedelta64(1, "D")
+    t_path = remaining_days / 365
+    s_path = spot[path]
+    v_path = np.where(np.isfinite(vol[path]), vol[path], v0[:, None])
+    marks = _bs_value(s_path, strike[:, None], t_path, rate, v_path, is_call)
+
+    exit_now = np.zeros_like(held)
+    if take_profit is not None:
+        exit_now |= marks <= premium[:, None] * (1 - take_profit)
+    if stop_loss is not None:
+        exit_now |= marks >= premium[:, None] * (1 + stop_loss)
+    if roll_dte is not None:
+        exit_now |= remaining_days <= roll_dte
+    exit_now[:, 0] = False
+    exit_now &= held
+    # First rule hit, else the natural exit at expiry
+    exit_k = np.where(exit_now.any(axis=1), exit_now.argmax(axis=1), natural_exit[entries] - entries)
+
+    # Capital ratio along the path: cash secured put on K, or stock + short call; cash earns rate.
+    # The day-0 mark equals the premium, so every ratio row starts at 1.0.
+    elapsed = (dates[path] - dates[entries][:, None]) / np.timedelta64(365, "D")
+    growth = np.exp(rate * elapsed)
+    if is_call:
+        capital0 = s0
+        capital = s_path + premium[:, None] * growth - marks
+    else:
+        capital0 = strike
+        capital = (strike + premium)[:, None] * growth - marks
+    ratio = capital / capital0[:, None]
+
+    rows = np.arange(len(entries))
+    exit_idx = entries + exit_k
+    held_years = (dates[exit_idx] - dates[entries]) / np.timedelta64(365, "D")
+    period_return = ratio[rows, exit_k] - 1
+    trades = {
+        "exit_date": dates[exit_idx],
+        "spot": s0,
+        "vol": v0,
+        "strike": strike,
+        "premium": premium,
+        "exit_spot": spot[exit_idx],
+        "exit_value": marks[rows, exit_k],
+        "pnl": premium - marks[rows, exit_k],
+        "return": period_return,
+        "annualized_return": (1 + period_return) ** (1 / np.maximum(held_years, 1 / 365)) - 1,
+        "early_exit": exit_k < natural_exit[entries] - entries,
+    }
+    return entries, exit_k, ratio, trades
+
+
+def _program_equity(n: int, entries: np.ndarray, exit_k: np.ndarray, ratio: np.ndarray) -> np.ndarray:
+    """Chain trades (re-enter on each exit date) and stitch their capital ratios into one curve."""
+    equity = np.full(n, np.nan)
+    row_of = np.full(n, -1)
+    row_of[entries] = np.arange(len(entries))
+    row, level = 0, 1.0
+    while row >= 0:
+        start, k = entries[row], exit_k[row]
+        equity[start : start + k + 1] = level * ratio[row, : k + 1]
+        level = equity[start + k]
+        # k >= 1 (see the entry filter and exit rules), so the program moves forward
+        row = row_of[start + k]
+    return equity
+
+
+@profiled()
+def run(
+    prices: pd.DataFrame | pd.Series,
+    strategy: str = "short_put",
+    dte: int = 30,
+    delta: float | None = None,
+    moneyness: float | None = None,
+    vol: pd.DataFrame | pd.Series | None = None,
+    vol_window: int = 21,
+    vol_premium: float = 1.0,
+    rate: float = 0.04,
+    take_profit: float | None = None,
+    stop_loss: float | None = None,
+    roll_dte: int | None = None,
+) -> BacktestResult:
+    """Backtest a rolling short put (cash secured) or covered call program on every ticker.
+
+    Args:
+        prices: Daily closes (DatetimeIndex, one column per ticker)
+        strategy: "short_put" or "covered_call"
+        dte: Calendar days to expiry at entry
+        delta: Strike at this |delta| (e.g. 0.3); exclusive with moneyness
+        moneyness: Strike at spot * moneyness (e.g. 0.95 for a 5% OTM put)
+        vol: Volatility proxy aligned with prices (default: realized_vol(prices, vol_window))
+        vol_premium: Multiplier on the proxy (implied vol usually trades above realized)
+        rate: Risk-free rate, also earned on cash collateral
+        take_profit: Close once this fraction of the premium is captured (0.5 = 50%)
+        stop_loss: Close once the loss reaches this multiple of the premium (2.0 = 200%)
+        roll_dte: Close (and roll) at this many calendar days to expiry
+
+    Returns:
+        BacktestResult; equity is a price-like frame for timeseries.rolling_cagr/drawdowns
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"strategy must be one of {STRATEGIES}, got {strategy!r}")
+    if (delta is None) == (moneyness is None):
+        raise ValueError("Pass exactly one of delta or moneyness")
+    assert isinstance(prices.index, pd.DatetimeIndex), "prices must have a DatetimeIndex"
+    assert prices.index.is_monotonic_increasing, "prices must be sorted by date"
+
+    frame = prices.to_frame() if isinstance(prices, pd.Series) else prices
+    if vol is None:
+        vol = realized_vol(frame, vol_window)
+    vol = (vol.to_frame(frame.columns[0]) if isinstance(vol, pd.Series) else vol).reindex(frame.index)
+    if vol.shape[1] == 1 and frame.shape[1] > 1:
+        # One proxy (e.g. VIX) for every ticker
+        vol = pd.DataFrame({c: vol.iloc[:, 0] for c in frame.columns})
+
+    dates = frame.index.tz_localize(None).to_numpy("datetime64[ns]")
+    is_call = strategy == "covered_call"
+    trade_frames, equity = {}, {}
+    for ticker in frame.columns:
+        out = _run_one(
+            dates,
+            frame[ticker].to_numpy(dtype=float),
+            vol[ticker].to_numpy(dtype=float) * vol_premium,
+            is_call,
+            dte,
+            rate,
+            delta,
+            moneyness,
+            take_profit,
+            stop_loss,
+            roll_dte,
+        )
+        if out is None:
+            equity[ticker] = np.full(len(dates), np.nan)
+            continue
+        entries, exit_k, ratio, trades = out
+        trade_frames[ticker] = pd.DataFrame(trades, index=pd.Index(frame.index[entries], name="entry_date"))
+        equity[ticker] = _program_equity(len(dates), entries, exit_k, ratio)
+
+    trades = pd.concat(trade_frames, names=["ticker"]) if trade_frames else pd.DataFrame()
+    return BacktestResult(trades=trades, equity=pd.DataFrame(equity, index=frame.index))
@@ -0,0 +1,144 @@
+"""Exchange trading calendars with cached session arrays.
+
+Sessions are loaded once per exchange from `exchange_calendars` and kept as a sorted
+DatetimeIndex. Windows are then expressed as integer offsets into that array (n sessions
+back) instead of DateOffset arithmetic on every lookup.
+
+Exchange codes are ISO MIC codes as used by exchange_calendars, e.g. "XNYS" (NYSE),
+"XNAS" (Nasdaq), "XBOM" (BSE), "XLON" (LSE).
+"""
+
+import functools
+
+import exchange_calendars as xcals
+import numpy as np
+import pandas as pd
+from loguru import logger as log
+
+SESSIONS_PER_YEAR = 252
+
+_DEFAULT_START = pd.Timestamp("1990-01-01")
+
+# exchange => (requested_start, requested_end, sessions)
+# Kept separately from the sessions so that a request starting on a holiday (before the
+# first session) does not trigger a reload every time.
+_sessions_cache: dict[str, tuple[pd.Timestamp, pd.Timestamp, pd.DatetimeIndex]] = {}
+
+
+def _to_naive_dates(dates) -> pd.DatetimeIndex:
+    """Convert dates to a tz-naive, normalized DatetimeIndex (local wall-clock dates)."""
+    idx = pd.DatetimeIndex(np.atleast_1d(dates)) if not isinstance(dates, pd.DatetimeIndex) else dates
+    if idx.tz is not None:
+        idx = idx.tz_localize(None)
+    return idx.normalize()
+
+
+def _load_sessions(exchange: str, start: pd.Timestamp, end: pd.Timestamp | None) -> pd.DatetimeIndex:
+    """Return the cached session array for 'exchange', extending it if [start, end] is not covered."""
+    cached = _sessions_cache.get(exchange)
+    if cached is not None and start >= cached[0] and (end is None or end <= cached[1]):
+        return cached[2]
+
+    requested_lo = lo = start if cached is None else min(start, cached[0])
+    hi = end if cached is None else max(cached[1] if end is None else end, cached[1])
+    try:
+        cal = xcals.get_calendar(exchange, start=lo, end=hi)
+    except ValueError:
+        # Some calendars only record holidays from a later year (e.g. XBOM from 1997) and
+        # refuse an earlier start; retry from their first supported date
+        bound_min = xcals.get_calendar(exchange).bound_min()
+        if bound_min is None or lo >= bound_min:
+            raise
+        lo = bound_min
+        cal = xcals.get_calendar(exchange, start=lo, end=hi)
+    sessions = cal.sessions
+    if sessions.tz is not None:
+        sessions = sessions.tz_localize(None)
+
+    log.debug(f"Loaded {len(sessions)} {exchange} sessions from {sessions[0].date()} to {sessions[-1].date()}")
+    _sessions_cache[exchange] = (requested_lo, sessions[-1] if hi is None else hi, sessions)
+    _session_lags.cache_clear()
+    return sessions
+
+
+def get_sessions(exchange: str = "XNYS", start=None, end=None) -> pd.DatetimeIndex:
+    """Return the trading sessions of 'exchange' between start and end (inclusive, tz-naive dates).
+
+    The full session array is cached per exchange and only rebuilt when a request falls
+    outside the range already loaded; the result is a slice of that cached array.
+    """
+    start = _DEFAULT_START if start is None else _to_naive_dates(start)[0]
+    end = None if end is None else _to_naive_dates(end)[0]
+    sessions = _load_sessions(exchange, start, end)
+    lo = sessions.searchsorted(start, side="left")
+    hi = len(sessions) if end is None else sessions.searchsorted(end, side="right")
+    return sessions[lo:hi]
+
+
+def session_positions(dates, exchange: str = "XNYS") -> tuple[pd.DatetimeIndex, np.ndarray]:
+    """Map each date to the ordinal of the session on or before it.
+
+    Returns:
+        Tuple of (sessions, positions) where sessions[positions[i]] <= dates[i]. Dates before
+        the first session of the exchange get position -1.
+    """
+    idx = _to_naive_dates(dates)
+    full = _load_sessions(exchange, min(idx.min(), _DEFAULT_START), idx.max())
+    # Start one session early so a first date falling on a holiday/weekend still snaps back
+    lo = max(full.searchsorted(idx.min(), side="right") - 1, 0)
+    hi = full.searchsorted(idx.max(), side="right")
+    sessions = full[lo:hi]
+    positions = sessions.searchsorted(idx, side="right") - 1
+    return sessions, positions
+
+
+@functools.cache
+def _session_lags(exchange: str, years: int) -> np.ndarray:
+    """For every session k, the number of sessions back to the last session <= session[k] - years.
+
+    -1 where the window starts before the first loaded session.
+    """
+    sessions = _sessions_cache[exchange][2]
+    anchors = sessions.searchsorted(sessions - pd.DateOffset(years=years), side="right") - 1
+    lags = np.arange(len(sessions)) - anchors
+    lags[anchors < 0] = -1
+    return lags
+
+
+def window_lags(exchange: str, years: int, sessions: pd.DatetimeIndex | None = None) -> np.ndarray:
+    """Integer look-back (in sessions) for a 'years' window ending on each session.
+
+    The lags are computed once per (exchange, years) over the whole cached session array, so
+    rolling functions only do `position - lag` at lookup time.
+    """
+    if sessions is None:
+        sessions = get_sessions(exchange)
+    cached = _sessions_cache[exchange][2]
+    lags = _session_lags(exchange, years)
+    # 'sessions' is always a contiguous slice of the cached array
+    offset = cached.searchsorted(sessions[0]) if len(sessions) else 0
+    return lags[offset : offset + len(sessions)]
+
+
+def trading_dte(expiry, exchange: str = "XNYS", asof=None) -> int | np.ndarray:
+    """Number of trading sessions from 'asof' up to and including 'expiry'.
+
+    Today counts if it is a session, so an option expiring today has a trading DTE of 1,
+    matching the calendar-day convention used by `get_option_chain`.
+
+    Args:
+        expiry: Expiry date(s) (str, Timestamp, or array-like)
+        exchange: Exchange code (default: XNYS)
+        asof: Reference date (default: today)
+
+    Returns:
+        int for scalar input, np.ndarray for array-like input
+    """
+    scalar = np.ndim(expiry) == 0
+    expiries = _to_naive_dates(expiry)
+    asof = _to_naive_dates(pd.Timestamp.now() if asof is None else asof)[0]
+    sessions = get_sessions(exchange, start=min(asof, expiries.min()), end=max(asof, expiries.max()))
+
+    dte = sessions.searchsorted(expiries, side="right") - sessions.searchsorted(asof, side="left")
+    dte = np.maximum(dte, 0)
+    return int(dte[0]) if scalar else dte
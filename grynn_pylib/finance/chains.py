@@ -0,0 +1,353 @@
+"""Vectorized analytics over normalized option chain frames (see yahoo_finance.get_option_chain).
+
+Usage example:
+    from grynn_pylib.data_providers import yahoo_finance
+    from grynn_pylib.finance import chains
+
+    calls, puts, info = yahoo_finance.get_option_chain("QQQ", "2025-03-21")
+    calls = chains.enrich_chain(calls, "call")
+    calls.sort_values(by=["ar", "volume"], ascending=[False, False])
+"""
+
+import numpy as np
+import pandas as pd
+
+from ..decorators import profiled
+from . import options
+from .options import _norm_cdf, _norm_pdf
+
+GREEK_COLUMNS = ["mid", "moneyness", "intrinsic", "time_value", "delta", "gamma", "theta", "vega", "ar"]
+
+
+def _option_types(df: pd.DataFrame, option_type: str | None) -> np.ndarray:
+    """Boolean 'is call' per row, from the argument, an 'option_type' column or the OCC contract symbol."""
+    if option_type is not None:
+        if option_type not in ("call", "put"):
+            raise ValueError(f"option_type must be 'call' or 'put', got {option_type!r}")
+        return np.full(len(df), option_type == "call")
+    if "option_type" in df.columns:
+        return (df["option_type"] == "call").to_numpy()
+    # OCC symbols end in C|P + 8 digit strike, e.g. QQQ250321C00500000
+    cp = pd.Index(df.index).astype(str).str[-9]
+    if not cp.isin(["C", "P"]).all():
+        raise ValueError("Cannot infer call/put from the index, pass option_type")
+    return np.asarray(cp == "C")
+
+
+@profiled()
+def enrich_chain(df: pd.DataFrame, option_type: str | None = None, rate: float = 0.05) -> pd.DataFrame:
+    """Add Greeks and premium metrics to a normalized chain in one vectorized pass.
+
+    Uses the 'dte', 'spot', 'strike' and 'iv' columns (and bid/ask/last for the price).
+    Calls and puts may be mixed when option_type is None: the type comes from an
+    'option_type' column if present, else from the contract symbol in the index.
+
+    Added columns:
+        mid: (bid + ask) / 2, or last when there is no two-sided quote
+        moneyness: strike / spot
+        intrinsic, time_value: mid split into exercise value and the rest (time_value >= 0)
+        delta, gamma: Black-Scholes, gamma in 1 / price
+        theta: price per day
+        vega: price per 1 vol point (0.01 of iv)
+        ar: annualized return of selling the time value, against the spot (calls, covered)
+            or the strike (puts, cash secured): time_value / collateral * 365 / dte
+
+    Greeks are NaN where iv or dte is not positive.
+
+    Args:
+        df: Normalized calls and/or puts frame
+        option_type: "call", "put" or None to infer per row
+        rate: Risk-free rate
+
+    Returns:
+        A copy of df with the columns in GREEK_COLUMNS appended (replaced if present)
+    """
+    is_call = _option_types(df, option_type)
+    spot = df["spot"].to_numpy(dtype=float)
+    strike = df["strike"].to_numpy(dtype=float)
+    dte = df["dte"].to_numpy(dtype=float)
+    iv = df["iv"].to_numpy(dtype=float)
+    bid = df["bid"].to_numpy(dtype=float)
+    ask = df["ask"].to_numpy(dtype=float)
+    last = df["last"].to_numpy(dtype=float)
+
+    mid = np.where((bid > 0) & (ask > 0), (bid + ask) / 2, last)
+    intrinsic = np.where(is_call, np.maximum(spot - strike, 0), np.maximum(strike - spot, 0))
+    time_value = np.maximum(mid - intrinsic, 0)
+
+    valid = (iv > 0) & (dte > 0)
+    t = np.where(valid, dte, np.nan) / 365
+    vol = np.where(valid, iv, np.nan)
+    sqrt_t = np.sqrt(t)
+    d1 = (np.log(spot / strike) + (rate + 0.5 * vol**2) * t) / (vol * sqrt_t)
+    d2 = d1 - vol * sqrt_t
+    pdf_d1 = _norm_pdf(d1)
+    discounted_strike = strike * np.exp(-rate * t)
+    # N(-x) = 1 - N(x): one ndtr call per input instead of two
+    cdf_d1, cdf_d2 = _norm_cdf(d1), _norm_cdf(d2)
+
+    delta = np.where(is_call, cdf_d1, cdf_d1 - 1)
+    gamma = pdf_d1 / (spot * vol * sqrt_t)
+    decay = -(spot * pdf_d1 * vol) / (2 * sqrt_t)
+    carry = np.where(is_call, -rate * discounted_strike * cdf_d2, rate * discounted_strike * (1 - cdf_d2))
+    theta = (decay + carry) / 365
+    vega = spot * pdf_d1 * sqrt_t / 100
+
+    collateral = np.where(is_call, spot, strike)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ar = np.where(dte > 0, time_value / collateral * 365 / dte, np.nan)
+
+    values = {
+        "mid": mid,
+        "moneyness": strike / spot,
+        "intrinsic": intrinsic,
+        "time_value": time_value,
+        "delta": delta,
+        "gamma": gamma,
+        "theta": theta,
+        "vega": vega,
+        "ar": ar,
+    }
+    return df.drop(columns=[c for c in GREEK_COLUMNS if c in df.columns]).assign(**values)
+
+
+@profiled()
+def rank_short_puts(
+    puts: pd.DataFrame,
+    rate: float = 0.05,
+    drift: float | None = None,
+    min_pop: float = 0.0,
+    quantiles=(0.05, 0.5),
+    top: int | None = None,
+) -> pd.DataFrame:
+    """Score every put in a normalized chain (any number of expiries/tickers) as a short put candidate.
+
+    The premium is the bid (what a seller gets), or last when there is no bid. Odds use each
+    put's own iv under a lognormal terminal price, see options.pop_short_put.
+
+    Added columns:
+        premium, breakeven
+        pop: probability of profit at expiry
+        ev: expected P&L per share at expiry
+        ev_on_risk: ev / (strike - premium)
+        ev_annualized: ev_on_risk * 365 / dte
+        return_q<NN>: quantiles of the return on risk (e.g. return_q05 = 5% worst case)
+
+    Args:
+        puts: Normalized puts frame
+        rate: Risk-free rate
+        drift: Expected return of the underlying for real-world odds (default: rate, risk neutral)
+        min_pop: Drop candidates with a lower probability of profit
+        quantiles: Return quantiles to add
+        top: Keep only the best 'top' rows
+
+    Returns:
+        Candidates sorted by ev_annualized, best first
+    """
+    drift = rate if drift is None else drift
+    bid = puts["bid"].to_numpy(dtype=float)
+    premium = np.where(bid > 0, bid, puts["last"].to_numpy(dtype=float))
+    strike = puts["strike"].to_numpy(dtype=float)
+    spot = puts["spot"].to_numpy(dtype=float)
+    dte = puts["dte"].to_numpy(dtype=float)
+    iv = puts["iv"].to_numpy(dtype=float)
+
+    valid = (iv > 0) & (dte > 0) & (premium > 0) & (strike > premium)
+    t = np.where(valid, dte, np.nan) / 365
+    vol = np.where(valid, iv, np.nan)
+    risk = strike - premium
+
+    ev = options.ev_short_put(spot, strike, premium, t, drift, vol)
+    values = {
+        "premium": premium,
+        "breakeven": risk,
+        "pop": options.pop_short_put(spot, strike, premium, t, drift, vol),
+        "ev": ev,
+        "ev_on_risk": ev / risk,
+        "ev_annualized": ev / risk * 365 / dte,
+    }
+    if quantiles:
+        returns = options.return_quantiles_short_put(spot, strike, premium, t, drift, vol, q=quantiles)
+        for i, q in enumerate(quantiles):
+            values[f"return_q{round(q * 100):02d}"] = returns[:, i]
+
+    ranked = puts.assign(**values).loc[valid]
+    ranked = ranked.loc[ranked["pop"] >= min_pop]
+    ranked = ranked.sort_values("ev_annualized", ascending=False, kind="stable")
+    return ranked if top is None else ranked.head(top)
+
+
+# Bucket edges, left-closed: [0.1, 0.25) etc. Delta edges are on |delta|.
+DELTA_EDGES = (0.0, 0.1, 0.25, 0.4, 0.6, 0.75, 0.9, 1.0)
+MONEYNESS_EDGES = (0.0, 0.8, 0.9, 0.95, 0.975, 1.025, 1.05, 1.1, 1.2, np.inf)
+
+
+def _bucket_labels(edges) -> list[str]:
+    return [f"{lo:g}-{hi:g}" for lo, hi in zip(edges[:-1], edges[1:])]
+
+
+def _concat_ranges(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """np.concatenate([np.arange(a, b) for a, b in zip(starts, stops)]) without the Python loop."""
+    lengths = np.maximum(stops - starts, 0)
+    offsets = np.cumsum(lengths) - lengths
+    return np.arange(lengths.sum()) - np.repeat(offsets, lengths) + np.repeat(starts, lengths)
+
+
+class ChainIndex:
+    """Strike-sorted index over option chain frames for fast screening queries.
+
+    Rows are sorted by (type, expiry, strike) once. Each (type, expiry) group is a
+    contiguous block, and a composite key group * span + strike makes every group
+    searchable with one np.searchsorted call, so a query over all expiries costs
+    O(groups * log n) in numpy instead of a boolean scan per expiry.
+
+    Delta and moneyness buckets are precomputed the same way (rows sorted by group and
+    bucket), so bucket lookups are range lookups too.
+
+    Usage example:
+        index = ChainIndex([calls, puts])
+        index.atm(option_type="put")                    # ATM put for every expiry
+        index.nearest(450, expiry="2025-03-21", n=3)    # 3 call strikes closest to 450
+        index.strike_range(440, 460, option_type=None)  # calls and puts, all expiries
+        index.moneyness_range(0.95, 1.0, option_type="put")
+        index.bucket("0.25-0.4", kind="delta")          # |delta| in [0.25, 0.4)
+
+    All queries return rows of `index.frame` (a copy of the inputs sorted as above),
+    ordered by type, expiry and strike.
+    """
+
+    def __init__(
+        self,
+        frames: pd.DataFrame | list[pd.DataFrame],
+        option_type: str | None = None,
+        rate: float = 0.05,
+        delta_edges=DELTA_EDGES,
+        moneyness_edges=MONEYNESS_EDGES,
+    ):
+        df = pd.concat(frames) if isinstance(frames, (list, tuple)) else frames
+        if df.empty:
+            raise ValueError("Cannot index an empty chain")
+        is_put = ~_option_types(df, option_type)
+        expiry = pd.DatetimeIndex(df["expiry"]).normalize().tz_localize(None).to_numpy("datetime64[D]")
+        strike = df["strike"].to_numpy(dtype=float)
+
+        order = np.lexsort((strike, expiry, is_put))
+        df = df.iloc[order]
+        is_put, expiry, strike = is_put[order], expiry[order], strike[order]
+        if "delta" not in df.columns:
+            df = enrich_chain(df, option_type, rate=rate)
+
+        new_group = np.r_[True, (is_put[1:] != is_put[:-1]) | (expiry[1:] != expiry[:-1])]
+        self._start = np.flatnonzero(new_group)
+        self._stop = np.r_[self._start[1:], len(df)]
+        group = np.cumsum(new_group) - 1
+        self.group_put = is_put[self._start]
+        self.group_expiry = expiry[self._start]
+        self.group_spot = df["spot"].to_numpy(dtype=float)[self._start]
+
+        # Strikes are >= 0, so a span above the max strike keeps groups from overlapping
+        self._span = 2 * float(strike.max(initial=0)) + 1
+        self._keys = group * self._span + strike
+        self.frame = df
+
+        self.delta_labels = _bucket_labels(delta_edges)
+        self.moneyness_labels = _bucket_labels(moneyness_edges)
+        self._buckets = {
+            "delta": self._bucket_index(np.abs(df["delta"].to_numpy(dtype=float)), delta_edges, group),
+            "moneyness": self._bucket_index(strike / df["spot"].to_numpy(dtype=float), moneyness_edges, group),
+        }
+
+    @staticmethod
+    def _bucket_index(values: np.ndarray, edges, group: np.ndarray) -> tuple[np.ndarray, np.ndarray, int]:
+        """Row order sorted by (group, bucket) and the matching sorted keys; NaN or out-of-range rows are dropped."""
+        n_buckets = len(edges) - 1
+        bucket = np.searchsorted(np.asarray(edges, dtype=float), values, side="right") - 1
+        # The top edge is inclusive, |delta| == 1 belongs to the last bucket
+        bucket[values == edges[-1]] = n_buckets - 1
+        valid = ~np.isnan(values) & (bucket >= 0) & (bucket < n_buckets)
+        rows = np.flatnonzero(valid)
+        keys = group[rows] * n_buckets + bucket[rows]
+        order = np.argsort(keys, kind="stable")
+        return rows[order], keys[order], n_buckets
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @property
+    def expiries(self) -> list[pd.Timestamp]:
+        return [pd.Timestamp(d) for d in np.unique(self.group_expiry)]
+
+    def _groups(self, expiry=None, option_type: str | None = "call") -> np.ndarray:
+        mask = np.ones(len(self._start), dtype=bool)
+        if option_type is not None:
+            if option_type not in ("call", "put"):
+                raise ValueError(f"option_type must be 'call', 'put' or None, got {option_type!r}")
+            mask &= self.group_put == (option_type == "put")
+        if expiry is not None:
+            expiries = (
+                [expiry] if isinstance(expiry, (str, pd.Timestamp)) or not hasattr(expiry, "__iter__") else expiry
+            )
+            wanted = pd.DatetimeIndex([pd.Timestamp(e) for e in expiries])
+            if wanted.tz is not None:
+                wanted = wanted.tz_localize(None)
+            mask &= np.isin(self.group_expiry, wanted.normalize().to_numpy("datetime64[D]"))
+        return np.flatnonzero(mask)
+
+    def _rows(self, positions: np.ndarray) -> pd.DataFrame:
+        return self.frame.iloc[positions]
+
+    def _nearest_positions(self, groups: np.ndarray, targets: np.ndarray, n: int) -> np.ndarray:
+        starts, stops = self._start[groups], self._stop[groups]
+        # Targets beyond [0, span) would land in a neighbouring group: keep the point inside its own
+        pos = np.clip(np.searchsorted(self._keys, groups * self._span + targets), starts, stops)
+        # The n nearest are among the n rows either side of the insertion point
+        candidates = pos[:, None] + np.arange(-n, n)[None, :]
+        valid = (candidates >= starts[:, None]) & (candidates < stops[:, None])
+        clipped = np.clip(candidates, 0, len(self._keys) - 1)
+        distance = np.where(valid, np.abs(self._keys[clipped] - (groups * self._span + targets)[:, None]), np.inf)
+        best = np.argsort(distance, axis=1, kind="stable")[:, :n]
+        chosen = np.take_along_axis(clipped, best, axis=1)
+        keep = np.take_along_axis(valid, best, axis=1)
+        return np.sort(chosen[keep])
+
+    def nearest(self, strike: float, expiry=None, option_type: str | None = "call", n: int = 1) -> pd.DataFrame:
+        """The n strikes closest to 'strike' in each selected expiry (all expiries by default)."""
+        groups = self._groups(expiry, option_type)
+        return self._rows(self._nearest_positions(groups, np.full(len(groups), float(strike)), n))
+
+    def atm(self, expiry=None, option_type: str | None = "call", n: int = 1) -> pd.DataFrame:
+        """The n strikes closest to spot in each selected expiry."""
+        groups = self._groups(expiry, option_type)
+        return self._rows(self._nearest_positions(groups, self.group_spot[groups], n))
+
+    def _range_positions(self, groups: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        starts, stops = self._start[groups], self._stop[groups]
+        # Bounds beyond [0, span) would reach into neighbouring groups: clip to each group's rows
+        left = np.clip(np.searchsorted(self._keys, groups * self._span + lo, side="left"), starts, stops)
+        right = np.clip(np.searchsorted(self._keys, groups * self._span + hi, side="right"), left, stops)
+        return _concat_ranges(left, right)
+
+    def strike_range(self, lo: float, hi: float, expiry=None, option_type: str | None = "call") -> pd.DataFrame:
+        """Rows with lo <= strike <= hi in each selected expiry."""
+        groups = self._groups(expiry, option_type)
+        return self._rows(
+            self._range_positions(groups, np.full(len(groups), float(lo)), np.full(len(groups), float(hi)))
+        )
+
+    def moneyness_range(self, lo: float, hi: float, expiry=None, option_type: str | None = "call") -> pd.DataFrame:
+        """Rows with lo <= strike / spot <= hi in each selected expiry."""
+        groups = self._groups(expiry, option_type)
+        spot = self.group_spot[groups]
+        return self._rows(self._range_positions(groups, lo * spot, hi * spot))
+
+    def bucket(self, label: str, kind: str = "delta", expiry=None, option_type: str | None = "call") -> pd.DataFrame:
+        """Rows in one precomputed bucket, e.g. bucket("0.25-0.4") or bucket("0.95-0.975", kind="moneyness")."""
+        if kind not in self._buckets:
+            raise ValueError(f"kind must be one of {list(self._buckets)}, got {kind!r}")
+        labels = self.delta_labels if kind == "delta" else self.moneyness_labels
+        if label not in labels:
+            raise ValueError(f"Unknown {kind} bucket {label!r}, expected one of {labels}")
+        rows, keys, n_buckets = self._buckets[kind]
+        target = self._groups(expiry, option_type) * n_buckets + labels.index(label)
+        positions = _concat_ranges(np.searchsorted(keys, target, "left"), np.searchsorted(keys, target, "right"))
+        return self._rows(np.sort(rows[positions]))
@@ -0,0 +1,254 @@
+"""Data-quality pass over wide price frames (rows = dates, columns = series).
+
+Flags, for every column at once:
+    jump    |daily change| above a threshold (relative to the previous valid price)
+    spike   a move out and (mostly) back on the next day: a bad tick, not a real move
+    stale   the same price repeated for at least 'stale' sessions in a row
+    gap     dates missing from the index (exchange sessions, or too many calendar days)
+
+Flags are kept as one uint8 bit field per cell, and the report lists each issue once
+(stale runs and gaps as one row per run). Work is done a block of columns at a time, so
+the temporaries are bounded by 'block_size' columns on 10k-column frames.
+
+Bad ticks distort rolling_cagr and drawdowns, so this is meant to run on every load.
+
+Usage example:
+    from grynn_pylib.finance import data_quality
+
+    prices, report = data_quality.clean(prices, method="interpolate")   # repairs spikes by default
+    print(report.summary())
+    report.issues.query("kind == 'jump'")
+    prices = data_quality.repair(raw, report, method="ffill", kinds=("spike", "stale"))
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from ..decorators import profiled
+
+JUMP, SPIKE, STALE = 1, 2, 4
+KINDS = {"jump": JUMP, "spike": SPIKE, "stale": STALE}
+REPAIR_METHODS = ("mask", "ffill", "interpolate")
+_ISSUE_COLUMNS = ["kind", "column", "start", "end", "length", "value", "change"]
+
+
+@dataclass
+class QualityReport:
+    """issues: one row per jump/spike cell, stale run or index gap (column is None for gaps).
+    flags: uint8 bit field (JUMP | SPIKE | STALE) shaped like the scanned frame.
+    """
+
+    issues: pd.DataFrame
+    flags: np.ndarray
+    index: pd.Index
+    columns: pd.Index
+
+    def mask(self, kinds=("jump", "spike", "stale")) -> pd.DataFrame:
+        """Boolean frame of the cells flagged with any of 'kinds'."""
+        bits = np.bitwise_or.reduce([KINDS[k] for k in kinds]) if kinds else 0
+        return pd.DataFrame((self.flags & bits) != 0, index=self.index, columns=self.columns)
+
+    def summary(self) -> pd.DataFrame:
+        """Issue counts per kind: how many issues, cells and columns are affected."""
+        issues = self.issues
+        return issues.groupby("kind").agg(
+            issues=("kind", "size"), cells=("length", "sum"), columns=("column", "nunique")
+        )
+
+
+def _ffill_rows(values: np.ndarray) -> np.ndarray:
+    """Forward fill NaNs down each column of a 2D array."""
+    rows = np.where(np.isnan(values), 0, np.arange(len(values))[:, None])
+    np.maximum.accumulate(rows, axis=0, out=rows)
+    return values[rows, np.arange(values.shape[1])]
+
+
+def _run_lengths(same: np.ndarray) -> np.ndarray:
+    """Per cell, the number of consecutive True values ending at that cell (0 where False)."""
+    count = np.cumsum(same, axis=0)
+    reset = np.where(same, 0, count)
+    np.maximum.accumulate(reset, axis=0, out=reset)
+    return count - reset
+
+
+def _scan_block(values: np.ndarray, jump: float, spike: float, reversal: float, stale: int):
+    """Flags and per-cell change for one column block."""
+    prev = np.full_like(values, np.nan)
+    prev[1:] = _ffill_rows(values)[:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = values / prev - 1
+        log_change = np.log1p(change)
+    next_log = np.full_like(log_change, np.nan)
+    next_log[:-1] = log_change[1:]
+
+    # Out and back: a large move followed by an opposite move undoing most of it
+    with np.errstate(invalid="ignore"):
+        is_spike = (np.abs(change) > spike) & (np.sign(next_log) == -np.sign(log_change))
+        is_spike &= np.abs(log_change + next_log) < (1 - reversal) * np.abs(log_change)
+        reverting = np.zeros_like(is_spike)
+        reverting[1:] = is_spike[:-1]
+        is_jump = (np.abs(change) > jump) & ~is_spike & ~reverting
+
+    same = np.zeros(values.shape, dtype=bool)
+    same[1:] = values[1:] == values[:-1]
+    # Length of the run of repeats each repeated cell belongs to: back + forward counts
+    back = _run_lengths(same)
+    forward = _run_lengths(same[::-1])[::-1]
+    is_stale = same & (back + forward - 1 >= stale)
+
+    flags = is_jump.astype(np.uint8) * JUMP
+    flags |= is_spike.astype(np.uint8) * SPIKE
+    flags |= is_stale.astype(np.uint8) * STALE
+    return flags, change
+
+
+def _gaps(index: pd.DatetimeIndex, exchange: str | None, max_gap_days: int) -> pd.DataFrame:
+    """Index-level gaps: missing exchange sessions, else calendar gaps over max_gap_days."""
+    dates = index.tz_localize(None) if index.tz is not None else index
+    if exchange is not None:
+        from . import calendars
+
+        sessions = calendars.get_sessions(exchange, dates[0], dates[-1])
+        missing = sessions[~sessions.isin(dates.normalize())]
+        if not len(missing):
+            return pd.DataFrame(columns=["start", "end", "length"])
+        # Consecutive missing sessions form one gap
+        positions = sessions.get_indexer(missing)
+        breaks = np.flatnonzero(np.diff(positions) > 1) + 1
+        first = np.r_[0, breaks]
+        last = np.r_[breaks - 1, len(missing) - 1]
+        return pd.DataFrame({"start": missing[first], "end": missing[last], "length": last - first + 1})
+
+    days = np.diff(dates.to_numpy()) / np.timedelta64(1, "D")
+    at = np.flatnonzero(days > max_gap_days)
+    return pd.DataFrame({"start": dates[at], "end": dates[at + 1], "length": days[at].astype(int) - 1})
+
+
+@profiled()
+def scan(
+    df: pd.DataFrame | pd.Series,
+    jump: float = 0.25,
+    spike: float = 0.15,
+    reversal: float = 0.5,
+    stale: int = 5,
+    exchange: str | None = None,
+    max_gap_days: int = 5,
+    block_size: int = 1024,
+) -> QualityReport:
+    """Flag jumps, spikes, stale runs and index gaps in one vectorized pass.
+
+    Args:
+        df: Prices with a sorted DatetimeIndex
+        jump: Flag daily changes with |change| above this (0.25 = 25%)
+        spike: Minimum |change| of the first leg of a spike
+        reversal: Fraction of the first leg the next day must undo to make a spike
+        stale: Minimum number of repeated prices (after the first) to flag a stale run
+        exchange: Check the index against this exchange's sessions (e.g. "XNYS"); otherwise
+            a gap is more than max_gap_days calendar days between consecutive rows
+        max_gap_days: See exchange
+        block_size: Columns processed per step
+
+    Returns:
+        QualityReport
+    """
+    assert isinstance(df.index, pd.DatetimeIndex), "The index must be a DatetimeIndex"
+    assert df.index.is_monotonic_increasing, "The index must be sorted in increasing order"
+    frame = df.to_frame() if isinstance(df, pd.Series) else df
+
+    n, m = frame.shape
+    flags = np.zeros((n, m), dtype=np.uint8)
+    cells = []
+    for c0 in range(0, m, block_size):
+        c1 = min(c0 + block_size, m)
+        values = frame.iloc[:, c0:c1].to_numpy(dtype=float)
+        block_flags, change = _scan_block(values, jump, spike, reversal, stale)
+        flags[:, c0:c1] = block_flags
+
+        rows, cols = np.nonzero(block_flags & (JUMP | SPIKE))
+        kind = np.where(block_flags[rows, cols] & SPIKE, "spike", "jump")
+        cells.append(
+            pd.DataFrame(
+                {
+                    "kind": kind,
+                    "row": rows,
+                    "end_row": rows,
+                    "col": cols + c0,
+                    "length": 1,
+                    "value": values[rows, cols],
+                    "change": change[rows, cols],
+                }
+            )
+        )
+
+        # Stale runs: one row per run, from its first to its last repeated price (column-major order)
+        is_stale = (block_flags & STALE) != 0
+        padded = np.zeros((n + 2, c1 - c0), dtype=bool)
+        padded[1:-1] = is_stale
+        edges = np.diff(padded.astype(np.int8), axis=0)
+        start_cols, start_rows = np.nonzero(edges.T == 1)
+        _, end_rows = np.nonzero(edges.T == -1)
+        cells.append(
+            pd.DataFrame(
+                {
+                    "kind": "stale",
+                    "row": start_rows,
+                    "end_row": end_rows - 1,
+                    "col": start_cols + c0,
+                    "length": end_rows - start_rows,
+                    "value": values[start_rows, start_cols],
+                    "change": 0.0,
+                }
+            )
+        )
+
+    found = pd.concat(cells, ignore_index=True)
+    index = frame.index
+    issues = pd.DataFrame(
+        {
+            "kind": found["kind"],
+            "column": frame.columns[found["col"].to_numpy()],
+            "start": index[found["row"].to_numpy()],
+            "end": index[found["end_row"].to_numpy()],
+            "length": found["length"].astype(int),
+            "value": found["value"],
+            "change": found["change"],
+        }
+    )
+    gaps = _gaps(index, exchange, max_gap_days).assign(kind="gap", column=None, value=np.nan, change=np.nan)
+    issues = pd.concat([issues, gaps[_ISSUE_COLUMNS]], ignore_index=True) if len(gaps) else issues
+    issues = issues.sort_values(["start", "kind"], kind="stable", ignore_index=True)
+    return QualityReport(issues=issues, flags=flags, index=frame.index, columns=frame.columns)
+
+
+def repair(
+    df: pd.DataFrame | pd.Series, report: QualityReport, method: str = "mask", kinds=("spike",)
+) -> pd.DataFrame | pd.Series:
+    """Replace the cells flagged with 'kinds' by NaN ("mask"), the last good price ("ffill")
+    or a time-weighted interpolation between good prices ("interpolate", interior only).
+
+    Jumps are not repaired by default: a large move can be real (crash, takeover, split).
+    """
+    if method not in REPAIR_METHODS:
+        raise ValueError(f"method must be one of {REPAIR_METHODS}, got {method!r}")
+    unknown = set(kinds) - set(KINDS)
+    if unknown:
+        raise ValueError(f"Unknown kinds {sorted(unknown)}, expected some of {list(KINDS)}")
+
+    mask = report.mask(kinds).to_numpy()
+    if isinstance(df, pd.Series):
+        mask = mask[:, 0]
+    masked = df.mask(mask)
+    if method == "ffill":
+        # Only the masked cells are filled; NaNs already in the data stay
+        return masked.fillna(masked.ffill().where(mask))
+    if method == "interpolate":
+        return masked.fillna(masked.interpolate(method="time", limit_area="inside").where(mask))
+    return masked
+
+
+def clean(df: pd.DataFrame | pd.Series, method: str = "mask", kinds=("spike",), **scan_kwargs):
+    """scan() then repair(); returns (repaired frame, report)."""
+    report = scan(df, **scan_kwargs)
+    return repair(df, report, method=method, kinds=kinds), report
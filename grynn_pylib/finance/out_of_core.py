@@ -0,0 +1,180 @@
+"""Out-of-core variants of the finance.timeseries functions.
+
+Inputs are wide panels (rows = dates, columns = series) stored as memory-mapped `.npy`
+files or Arrow IPC (Feather v2) files. Work is done one column block at a time, and
+results are written to a memory-mapped `.npy` output, so peak memory is bounded by
+`block_size` (plus the index) rather than by the size of the universe.
+
+Usage example:
+    from grynn_pylib.finance import out_of_core
+
+    cagr = out_of_core.rolling_cagr("prices.npy", "cagr_5y.npy", index=dates, years=5)
+    dd = out_of_core.drawdowns("prices.arrow", "drawdowns.npy", index_col="date")
+"""
+
+from pathlib import Path
+from typing import Callable
+from warnings import warn
+
+import numpy as np
+import pandas as pd
+
+from . import timeseries
+
+_ARROW_SUFFIXES = {".arrow", ".feather", ".ipc"}
+
+
+class _NpySource:
+    """Column-block reader over a 2D `.npy` file opened with mmap_mode='r'."""
+
+    def __init__(self, path: Path, index):
+        self.array = np.load(path, mmap_mode="r")
+        if self.array.ndim != 2:
+            raise ValueError(f"Expected a 2D array in {path}, got shape {self.array.shape}")
+        if index is None:
+            raise ValueError("'index' is required for .npy inputs (DatetimeIndex or path to a datetime64 .npy)")
+        if isinstance(index, (str, Path)):
+            index = np.load(index)
+        self.index = pd.DatetimeIndex(index)
+        self.columns = pd.RangeIndex(self.array.shape[1])
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.array.shape
+
+    def block(self, c0: int, c1: int) -> np.ndarray:
+        return np.asarray(self.array[:, c0:c1], dtype=float)
+
+
+class _ArrowSource:
+    """Column-block reader over a memory-mapped Arrow IPC file."""
+
+    def __init__(self, path: Path, index_col: str | None):
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("Reading Arrow files requires pyarrow: pip install 'grynn_pylib[arrow]'") from e
+
+        # read_all() on a memory map is zero-copy; columns are only paged in when touched
+        self._mmap = pa.memory_map(str(path), "r")
+        self.table = pa.ipc.open_file(self._mmap).read_all()
+
+        if index_col is None:
+            index_col = next((f.name for f in self.table.schema if pa.types.is_timestamp(f.type)), None)
+        if index_col is None:
+            raise ValueError(f"No timestamp column found in {path}, pass 'index_col'")
+
+        self.index = pd.DatetimeIndex(self.table.column(index_col).to_numpy())
+        self.columns = pd.Index([name for name in self.table.column_names if name != index_col])
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.index), len(self.columns)
+
+    def block(self, c0: int, c1: int) -> np.ndarray:
+        cols = [self.table.column(name).to_numpy() for name in self.columns[c0:c1]]
+        return np.column_stack(cols).astype(float, copy=False)
+
+
+def open_panel(path: str | Path, index=None, index_col: str | None = None) -> _NpySource | _ArrowSource:
+    """Open a panel for block-wise reading.
+
+    Args:
+        path: `.npy` file (2D) or Arrow IPC file (`.arrow`, `.feather`, `.ipc`)
+        index: DatetimeIndex (or path to a datetime64 `.npy`) for the rows of a `.npy` panel
+        index_col: Timestamp column of an Arrow panel (default: first timestamp column)
+
+    Returns:
+        A source with `.index`, `.columns`, `.shape` and `.block(c0, c1)`
+    """
+    path = Path(path)
+    if path.suffix in _ARROW_SUFFIXES:
+        return _ArrowSource(path, index_col)
+    return _NpySource(path, index)
+
+
+def _apply_blocks(
+    func: Callable[..., pd.DataFrame],
+    source: _NpySource | _ArrowSource,
+    out: str | Path,
+    block_size: int = 256,
+    dtype=np.float64,
+) -> np.memmap:
+    """Apply 'func' to each column block of 'source' and write the result into a memmapped `.npy`."""
+    n_rows, n_cols = source.shape
+    result = np.lib.format.open_memmap(out, mode="w+", dtype=dtype, shape=(n_rows, n_cols))
+
+    for c0 in range(0, n_cols, block_size):
+        c1 = min(c0 + block_size, n_cols)
+        block = pd.DataFrame(source.block(c0, c1), index=source.index)
+        # Written straight into the memmapped slice, no result-sized temporaries
+        func(block, out=result[:, c0:c1])
+
+    result.flush()
+    return result
+
+
+def rolling_return(
+    src: str | Path,
+    out: str | Path,
+    years: int = 5,
+    snap_to_closest: bool = False,
+    index=None,
+    index_col: str | None = None,
+    block_size: int = 256,
+    dtype=np.float64,
+) -> np.memmap:
+    """Block-wise timeseries.rolling_return over a memory-mapped panel, written to 'out' (.npy)."""
+    return _apply_blocks(
+        lambda df, out: timeseries.rolling_return(df, years=years, snap_to_closest=snap_to_closest, out=out),
+        open_panel(src, index=index, index_col=index_col),
+        out,
+        block_size=block_size,
+        dtype=dtype,
+    )
+
+
+def rolling_cagr(
+    src: str | Path,
+    out: str | Path,
+    years: int = 5,
+    snap_to_closest: bool = False,
+    index=None,
+    index_col: str | None = None,
+    block_size: int = 256,
+    dtype=np.float64,
+) -> np.memmap:
+    """Block-wise timeseries.rolling_cagr over a memory-mapped panel, written to 'out' (.npy)."""
+    source = open_panel(src, index=index, index_col=index_col)
+    if (source.index[-1] - source.index[0]).days < 365:
+        warn("Less than 1 year of data. Returning NaNs")
+        result = np.lib.format.open_memmap(out, mode="w+", dtype=dtype, shape=source.shape)
+        result[:] = np.nan
+        result.flush()
+        return result
+
+    return _apply_blocks(
+        lambda df, out: timeseries.rolling_cagr(df, years=years, snap_to_closest=snap_to_closest, out=out),
+        source,
+        out,
+        block_size=block_size,
+        dtype=dtype,
+    )
+
+
+def drawdowns(
+    src: str | Path,
+    out: str | Path,
+    index=None,
+    index_col: str | None = None,
+    block_size: int = 256,
+    dtype=np.float64,
+) -> np.memmap:
+    """Block-wise timeseries.drawdowns over a memory-mapped panel, written to 'out' (.npy)."""
+    return _apply_blocks(
+        timeseries.drawdowns,
+        open_panel(src, index=index, index_col=index_col),
+        out,
+        block_size=block_size,
+        dtype=dtype,
+    )
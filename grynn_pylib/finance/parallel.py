@@ -0,0 +1,199 @@
+"""Parallel, column-sharded execution of finance.timeseries functions, and parallel chain fetches.
+
+The input panel is copied once into a `multiprocessing.shared_memory` block (column-major,
+so each shard is a contiguous slab). Workers attach to it by name, compute their columns
+and write straight into a shared output block. Only the index and the shard bounds are
+pickled, and the returned DataFrame is a view over the output block, not a copy.
+
+option_chains() fetches tickers in worker processes; each chain comes back as Arrow IPC in
+shared memory (see grynn_pylib.ipc) rather than as a pickled DataFrame.
+
+Usage example:
+    from grynn_pylib.finance import parallel
+
+    cagr = parallel.rolling_cagr(prices, years=5, snap_to_closest=True, workers=32)
+    chains = parallel.option_chains(["QQQ", "SPY", "IWM"], max_expiries=6, workers=3)
+"""
+
+import os
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from loguru import logger as log
+
+from .. import ipc
+from . import timeseries
+
+_FUNCTIONS = {
+    "rolling_return": timeseries.rolling_return,
+    "rolling_cagr": timeseries.rolling_cagr,
+    "drawdowns": timeseries.drawdowns,
+}
+
+
+def _run_shard(
+    func_name: str,
+    in_name: str,
+    out_name: str,
+    shape: tuple[int, int],
+    index: pd.DatetimeIndex,
+    c0: int,
+    c1: int,
+    kwargs: dict,
+) -> None:
+    """Worker: compute columns [c0, c1) of the shared input into the shared output."""
+    shm_in = shared_memory.SharedMemory(name=in_name)
+    shm_out = shared_memory.SharedMemory(name=out_name)
+    try:
+        src = np.ndarray(shape, dtype=np.float64, buffer=shm_in.buf, order="F")
+        dst = np.ndarray(shape, dtype=np.float64, buffer=shm_out.buf, order="F")
+        # The column slice of a Fortran-ordered block is contiguous, so the function
+        # computes straight into the shared output without a result frame to copy
+        _FUNCTIONS[func_name](pd.DataFrame(src[:, c0:c1], index=index, copy=False), out=dst[:, c0:c1], **kwargs)
+        # Views must be released before the segments can be closed
+        del src, dst
+    finally:
+        shm_in.close()
+        shm_out.close()
+
+
+def parallel_apply(
+    func_name: str,
+    df: pd.DataFrame,
+    workers: int | None = None,
+    shard_size: int | None = None,
+    executor: Executor | None = None,
+    **kwargs,
+) -> pd.DataFrame:
+    """Run a timeseries function over column shards of 'df' in a process pool.
+
+    Args:
+        func_name: One of "rolling_return", "rolling_cagr", "drawdowns"
+        df: Wide panel with a DatetimeIndex (rows = dates, columns = series)
+        workers: Number of processes (default: os.cpu_count())
+        shard_size: Columns per task (default: about 4 tasks per worker)
+        executor: Existing ProcessPoolExecutor to reuse across calls
+        **kwargs: Passed through to the timeseries function
+
+    Returns:
+        DataFrame backed by the shared output block (released when the frame is garbage collected)
+    """
+    if func_name not in _FUNCTIONS:
+        raise ValueError(f"func_name must be one of {list(_FUNCTIONS)}, got {func_name!r}")
+    if isinstance(df, pd.Series):
+        return _FUNCTIONS[func_name](df, **kwargs)
+
+    n_rows, n_cols = df.shape
+    workers = workers or os.cpu_count() or 1
+    shard_size = shard_size or max(1, -(-n_cols // (workers * 4)))
+    nbytes = max(n_rows * n_cols * np.dtype(np.float64).itemsize, 1)
+
+    shm_in = shared_memory.SharedMemory(create=True, size=nbytes)
+    shm_out = shared_memory.SharedMemory(create=True, size=nbytes)
+    try:
+        src = np.ndarray((n_rows, n_cols), dtype=np.float64, buffer=shm_in.buf, order="F")
+        src[:] = df.to_numpy(dtype=np.float64)
+        del src
+
+        pool = executor or ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                pool.submit(
+                    _run_shard,
+                    func_name,
+                    shm_in.name,
+                    shm_out.name,
+                    (n_rows, n_cols),
+                    df.index,
+                    c0,
+                    min(c0 + shard_size, n_cols),
+                    kwargs,
+                )
+                for c0 in range(0, n_cols, shard_size)
+            ]
+            for future in futures:
+                future.result()
+        finally:
+            if executor is None:
+                pool.shutdown()
+    except BaseException:
+        shm_out.close()
+        shm_out.unlink()
+        raise
+    finally:
+        shm_in.close()
+        shm_in.unlink()
+
+    # The name can go now; the mapping lives until the result array is collected
+    out = np.ndarray((n_rows, n_cols), dtype=np.float64, buffer=shm_out.buf, order="F")
+    shm_out.unlink()
+    # Not at exit: the frame may still be alive then, and the OS reclaims the mapping anyway
+    weakref.finalize(out, shm_out.close).atexit = False
+    return pd.DataFrame(out, index=df.index, columns=df.columns, copy=False)
+
+
+def rolling_return(
+    df: pd.DataFrame, years: int = 5, snap_to_closest: bool = False, workers: int | None = None, **kwargs
+) -> pd.DataFrame:
+    """Column-parallel timeseries.rolling_return, see parallel_apply."""
+    return parallel_apply("rolling_return", df, workers, years=years, snap_to_closest=snap_to_closest, **kwargs)
+
+
+def rolling_cagr(
+    df: pd.DataFrame, years: int = 5, snap_to_closest: bool = False, workers: int | None = None, **kwargs
+) -> pd.DataFrame:
+    """Column-parallel timeseries.rolling_cagr, see parallel_apply."""
+    return parallel_apply("rolling_cagr", df, workers, years=years, snap_to_closest=snap_to_closest, **kwargs)
+
+
+def drawdowns(df: pd.DataFrame, workers: int | None = None, **kwargs) -> pd.DataFrame:
+    """Column-parallel timeseries.drawdowns, see parallel_apply."""
+    return parallel_apply("drawdowns", df, workers, **kwargs)
+
+
+def _yahoo_chains(ticker: str, max_expiries: int | None) -> pd.DataFrame:
+    from ..data_providers import yahoo_finance
+
+    return yahoo_finance.get_option_chains(ticker, max_expiries)
+
+
+def _fetch_chain(args: tuple[Callable, str, int | None]) -> pd.DataFrame | None:
+    """Worker: one ticker's chain, or None (logged) if the fetch fails."""
+    fetch, ticker, max_expiries = args
+    try:
+        return fetch(ticker, max_expiries)
+    except Exception as e:
+        log.warning(f"{ticker}: {e}")
+        return None
+
+
+def option_chains(
+    tickers: list[str],
+    max_expiries: int | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    fetch: Callable[[str, int | None], pd.DataFrame] | None = None,
+    transport: str = "arrow",
+) -> dict[str, pd.DataFrame]:
+    """Fetch option chains for many tickers in worker processes, see ipc.map_frames.
+
+    Args:
+        tickers: Tickers to fetch
+        max_expiries: Only the nearest N expiries per ticker
+        workers: Processes (default: os.cpu_count())
+        executor: Existing ProcessPoolExecutor to reuse
+        fetch: fetch(ticker, max_expiries) -> frame (default: yahoo_finance.get_option_chains);
+            must be a module-level function
+        transport: "arrow" (default) or "pickle"
+
+    Returns:
+        dict: ticker -> calls and puts with an 'option_type' column; failed tickers are left out
+    """
+    fetch = fetch or _yahoo_chains
+    units = [(fetch, ticker, max_expiries) for ticker in tickers]
+    results = ipc.map_frames(_fetch_chain, units, workers=workers, executor=executor, transport=transport)
+    return {ticker: chain for ticker, chain in zip(tickers, results) if chain is not None}
@@ -0,0 +1,116 @@
+"""Put-call parity and synthetics scanner over normalized option chains.
+
+European put-call parity: C - P = S * exp(-qT) - K * exp(-rT). Rearranged:
+    synthetic forward   F = K + (C - P) * exp(rT)
+    implied rate        r* = -ln((S * exp(-qT) - (C - P)) / K) / T
+    conversion          long stock + short call + long put, locks in K at expiry
+    reversal            short stock + long call + short put
+
+US equity options are American, so puts (and calls before dividends) can trade above
+parity; residuals and implied rates are screening signals, not guaranteed arbitrage.
+
+Usage example:
+    from grynn_pylib.finance import parity
+
+    scan = parity.scan(pd.concat(all_calls), pd.concat(all_puts), rate=0.045)
+    scan.loc[scan["arb"] > 0.05].sort_values("arb", ascending=False)
+    parity.implied_rates(scan)      # per ticker/expiry term structure
+"""
+
+import numpy as np
+import pandas as pd
+
+from ..decorators import profiled
+
+_KEYS = ["underlying_symbol", "expiry", "strike"]
+_QUOTES = ["bid", "ask", "last", "spot", "dte"]
+
+
+def _mid(bid: np.ndarray, ask: np.ndarray, last: np.ndarray) -> np.ndarray:
+    return np.where((bid > 0) & (ask > 0), (bid + ask) / 2, last)
+
+
+@profiled()
+def scan(calls: pd.DataFrame, puts: pd.DataFrame, rate: float = 0.05, dividend_yield: float = 0.0) -> pd.DataFrame:
+    """Pair calls and puts on (underlying, expiry, strike) and compute parity metrics in one pass.
+
+    Any number of tickers and expiries can be passed at once (concatenated normalized frames).
+
+    Args:
+        calls: Normalized calls (underlying_symbol, expiry, strike, bid, ask, last, spot, dte)
+        puts: Normalized puts with the same columns
+        rate: Risk-free rate (continuous)
+        dividend_yield: Continuous dividend yield of the underlying
+
+    Returns:
+        DataFrame indexed by (underlying_symbol, expiry, strike), sorted, with columns:
+            spot, dte, call_mid, put_mid
+            residual: (C - P) - (S e^-qT - K e^-rT) on mids
+            forward: synthetic forward from mids
+            implied_rate: rate that zeroes the residual; implied_borrow = rate - implied_rate
+            conversion: C_bid - P_ask - (S e^-qT - K e^-rT), per share, at the quotes you can trade
+            reversal: (S e^-qT - K e^-rT) - (C_ask - P_bid)
+            arb: max(conversion, reversal, 0)
+    """
+    left = calls.reset_index()[_KEYS + _QUOTES]
+    right = puts.reset_index()[_KEYS + ["bid", "ask", "last"]]
+    # Sorted inner merge on the contract keys; pairs come out ordered by ticker, expiry, strike
+    pairs = pd.merge(left, right, on=_KEYS, how="inner", suffixes=("_call", "_put"), sort=True)
+
+    spot = pairs["spot"].to_numpy(dtype=float)
+    strike = pairs["strike"].to_numpy(dtype=float)
+    dte = pairs["dte"].to_numpy(dtype=float)
+    c_bid, c_ask = pairs["bid_call"].to_numpy(dtype=float), pairs["ask_call"].to_numpy(dtype=float)
+    p_bid, p_ask = pairs["bid_put"].to_numpy(dtype=float), pairs["ask_put"].to_numpy(dtype=float)
+    c_mid = _mid(c_bid, c_ask, pairs["last_call"].to_numpy(dtype=float))
+    p_mid = _mid(p_bid, p_ask, pairs["last_put"].to_numpy(dtype=float))
+
+    t = np.where(dte > 0, dte, np.nan) / 365
+    growth = np.exp(rate * t)
+    pv_strike = strike / growth
+    pv_spot = spot * np.exp(-dividend_yield * t)
+    parity_value = pv_spot - pv_strike
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        implied_rate = -np.log((pv_spot - (c_mid - p_mid)) / strike) / t
+
+    # Quotes of 0 mean no market on that side, so that leg cannot be traded
+    tradable = (c_bid > 0) & (c_ask > 0) & (p_bid > 0) & (p_ask > 0)
+    conversion = np.where(tradable, c_bid - p_ask - parity_value, np.nan)
+    reversal = np.where(tradable, parity_value - (c_ask - p_bid), np.nan)
+
+    result = pd.DataFrame(
+        {
+            "spot": spot,
+            "dte": pairs["dte"].to_numpy(),
+            "call_mid": c_mid,
+            "put_mid": p_mid,
+            "residual": (c_mid - p_mid) - parity_value,
+            "forward": strike + (c_mid - p_mid) * growth,
+            "implied_rate": implied_rate,
+            "implied_borrow": rate - implied_rate,
+            "conversion": conversion,
+            "reversal": reversal,
+            "arb": np.fmax(np.fmax(conversion, reversal), 0),
+        },
+        index=pd.MultiIndex.from_frame(pairs[_KEYS]),
+    )
+    return result
+
+
+def implied_rates(scan_result: pd.DataFrame, moneyness: float = 0.05) -> pd.DataFrame:
+    """Per (underlying, expiry): median implied rate and forward over strikes within +/- moneyness of spot.
+
+    Near-the-money pairs have the tightest quotes and the least early-exercise premium.
+    """
+    strike = scan_result.index.get_level_values("strike").to_numpy(dtype=float)
+    near = np.abs(strike / scan_result["spot"].to_numpy() - 1) <= moneyness
+    grouped = scan_result.loc[near].groupby(level=["underlying_symbol", "expiry"], sort=True)
+    return grouped.agg(
+        dte=("dte", "first"),
+        spot=("spot", "first"),
+        forward=("forward", "median"),
+        implied_rate=("implied_rate", "median"),
+        implied_borrow=("implied_borrow", "median"),
+        pairs=("forward", "size"),
+    )
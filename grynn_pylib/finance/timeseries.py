@@ -1,17 +1,115 @@
-import functools
 import pandas as pd
-import yfinance as yf
 import numpy as np
-from warnings import warn
+from warnings import catch_warnings, simplefilter, warn
 from loguru import logger as log
 
+from ..concurrency import single_flight
+from ..decorators import profiled
+from . import alignment
 
-def rolling_return(s: pd.Series, years: int = 5, snap_to_closest: bool = False) -> pd.Series:
+# yfinance and exchange_calendars (via .calendars) are imported where used: together they
+# are most of this module's import time and only a few functions need them
+
+
+# Rows processed per step on the out=/dtype= paths; bounds the size of the temporaries
+_CHUNK_ROWS = 256
+
+
+def _output_buffer(s: pd.DataFrame | pd.Series, out: np.ndarray | None, dtype) -> np.ndarray:
+    """Validate 'out' (or allocate one of 'dtype') for the buffer-based code paths."""
+    if out is None:
+        return np.empty(s.shape, dtype=dtype or np.float64)
+    if out.shape != s.shape:
+        raise ValueError(f"out has shape {out.shape}, expected {s.shape}")
+    if not np.issubdtype(out.dtype, np.floating):
+        raise ValueError(f"out must be a floating point array, got {out.dtype}")
+    if dtype is not None and np.dtype(dtype) != out.dtype:
+        raise ValueError(f"dtype {np.dtype(dtype)} does not match out.dtype {out.dtype}")
+    return out
+
+
+def _wrap_output(s: pd.DataFrame | pd.Series, out: np.ndarray) -> pd.DataFrame | pd.Series:
+    """Wrap a result buffer in a Series|DataFrame shaped like 's', without copying it."""
+    if isinstance(s, pd.DataFrame):
+        return pd.DataFrame(out, index=s.index, columns=s.columns, copy=False)
+    return pd.Series(out, index=s.index, name=s.name, copy=False)
+
+
+def _ffill_inside(a: np.ndarray) -> None:
+    """In-place ffill(limit_area="inside") down the rows of a 2D array, in chunks of rows.
+
+    Within a chunk, each gap takes the row of the last valid value at or above it (a running
+    maximum of valid row numbers), or the previous chunk's last row if there is none. Only
+    columns with a gap in the chunk are touched, so gap-free panels cost one isnan pass.
+    """
+    n_rows, n_cols = a.shape
+    last_valid = np.full(n_cols, -1)
+    carry = np.full(n_cols, np.nan, dtype=a.dtype)
+    for r0 in range(0, n_rows, _CHUNK_ROWS):
+        chunk = a[r0 : r0 + _CHUNK_ROWS]
+        missing = np.isnan(chunk)
+        gaps = np.flatnonzero(missing.any(axis=0))
+        if len(gaps):
+            sub = chunk[:, gaps]
+            src = np.where(missing[:, gaps], -1, np.arange(len(chunk))[:, None])
+            np.maximum.accumulate(src, axis=0, out=src)
+            chunk[:, gaps] = np.where(src >= 0, np.take_along_axis(sub, np.maximum(src, 0), axis=0), carry[gaps])
+            last_valid[gaps] = np.where(src[-1] >= 0, r0 + src[-1], last_valid[gaps])
+            full = np.ones(n_cols, dtype=bool)
+            full[gaps] = False
+            last_valid[full] = r0 + len(chunk) - 1
+        else:
+            last_valid[:] = r0 + len(chunk) - 1
+        carry[:] = chunk[-1]
+
+    # Undo the fill past the last valid value (limit_area="inside")
+    first_tail = last_valid.min() + 1 if n_cols else n_rows
+    for r0 in range(max(first_tail, 0), n_rows, _CHUNK_ROWS):
+        chunk = a[r0 : r0 + _CHUNK_ROWS]
+        chunk[np.arange(r0, r0 + len(chunk))[:, None] > last_valid] = np.nan
+
+
+def _rolling_return_into(s, years: int, snap_to_closest: bool, out: np.ndarray | None, dtype) -> np.ndarray:
+    """
+    rolling_return computed into a single buffer: the values are copied (cast) into 'out',
+    forward-filled in place, then divided by their window start in row chunks from the end,
+    so a chunk's window starts (always earlier rows) are still unmodified when it is read.
+    """
+    out = _output_buffer(s, out, dtype)
+    buf = out.reshape(len(s), -1)
+    np.copyto(buf, s.to_numpy().reshape(len(s), -1), casting="same_kind")
+    _ffill_inside(buf)
+
+    anchors = _window_anchors(s.index, years, snap_to_closest)
+    for r1 in range(len(s), 0, -_CHUNK_ROWS):
+        r0 = max(r1 - _CHUNK_ROWS, 0)
+        chunk_anchors = anchors[r0:r1]
+        has_start = chunk_anchors >= 0
+        old_vals = np.full((r1 - r0, buf.shape[1]), np.nan, dtype=buf.dtype)
+        old_vals[has_start] = buf[chunk_anchors[has_start]]
+        buf[r0:r1] /= old_vals
+
+    return out
+
+
+@profiled()
+def rolling_return(
+    s: pd.Series, years: int = 5, snap_to_closest: bool = False, out: np.ndarray | None = None, dtype=None
+) -> pd.Series:
     """
     Returns a timeseries representing the simple return over 'years'.
     If 'snap_to_closest' is True, then we will snap to the last known value
     prior to (current_date - years). If False, we use the direct freq-based
     pct_change, which may yield NaNs if exact dates don't line up.
+
+    If 'out' (a float array shaped like s) or 'dtype' (e.g. np.float32) is given, the
+    result is computed in that single buffer and returned wrapped without a copy. 'out'
+    may be the input's own (writable) buffer to compute in place.
+
+    Peak memory, on top of the input:
+    - default: about 4x (s_filled, target dates/lookups, old_vals, ratio)
+    - out/dtype: the output buffer (nothing extra if 'out' is passed) plus one chunk
+      of rows and an int64 lookup per row
     """
     # Basic sanity checks
     assert isinstance(
@@ -19,6 +117,9 @@ def rolling_return(s: pd.Series, years: int = 5, snap_to_closest: bool = False)
     ), f"The index of the Series must be a DatetimeIndex, got: {type(s.index)}"
     assert s.index.is_monotonic_increasing, "The index of the Series must be sorted in increasing order"
 
+    if out is not None or dtype is not None:
+        return _wrap_output(s, _rolling_return_into(s, years, snap_to_closest, out, dtype))
+
     # Forward-fill to avoid NaNs *inside* existing date ranges
     s_filled = s.ffill(limit_area="inside")
     offset = pd.DateOffset(years=years)
@@ -55,48 +156,428 @@ def rolling_return(s: pd.Series, years: int = 5, snap_to_closest: bool = False)
     return pd.Series(ratio, index=idx, name=s_filled.name)
 
 
-def rolling_cagr(s: pd.DataFrame | pd.Series, years=5, snap_to_closest=False):
+@profiled()
+def rolling_cagr(s: pd.DataFrame | pd.Series, years=5, snap_to_closest=False, out=None, dtype=None):
+    """
+    Rolling CAGR over 'years', see rolling_return (including 'out'/'dtype').
+
+    Peak memory, on top of the input: about 5x by default; with out/dtype the same as
+    rolling_return, since the power is applied in place.
+    """
     # Basic sanity checks
     assert isinstance(
         s.index, pd.DatetimeIndex
     ), f"The index of the Series must be a DatetimeIndex, got: {type(s.index)}"
     assert s.index.is_monotonic_increasing, "The index of the Series must be sorted in increasing order"
 
+    buffered = out is not None or dtype is not None
     if (s.index[-1] - s.index[0]).days < 365:
         warn("Less than 1 year of data. Returning NaNs")
+        if buffered:
+            out = _output_buffer(s, out, dtype)
+            out[:] = np.nan
+            return _wrap_output(s, out)
         return pd.Series(index=s.index, data=np.nan)
 
+    if buffered:
+        out = _rolling_return_into(s, years, snap_to_closest, out, dtype)
+        np.power(out, 1 / years, out=out)
+        out -= 1
+        return _wrap_output(s, out)
+
     simple_return = rolling_return(s, years=years, snap_to_closest=snap_to_closest)
     return (simple_return ** (1 / years)) - 1
 
 
-@functools.cache
-def download_ccy_pair(ccy_from, ccy_to="USD", start=None, end=None):
+@profiled()
+def rolling_return_calendar(
+    s: pd.DataFrame | pd.Series,
+    years: int = 5,
+    exchange: str | dict[str, str] = "XNYS",
+    sessions: int | None = None,
+) -> pd.DataFrame | pd.Series:
+    """
+    Like rolling_return(snap_to_closest=True), but windows are measured on the trading
+    calendar of 'exchange'. Each date is mapped to its session, and the start of the window
+    is an integer offset into the cached session array (see finance.calendars), so holidays
+    on one exchange don't shift windows computed for another.
+
+    If 'sessions' is given the window is exactly that many trading sessions, otherwise it
+    spans 'years', snapped to the last session on or before (session - years).
+    'exchange' may be a dict of column => exchange code for frames that mix markets.
+    """
+    from . import calendars
+
+    # Basic sanity checks
+    assert isinstance(
+        s.index, pd.DatetimeIndex
+    ), f"The index of the Series must be a DatetimeIndex, got: {type(s.index)}"
+    assert s.index.is_monotonic_increasing, "The index of the Series must be sorted in increasing order"
+
+    if isinstance(exchange, dict):
+        assert isinstance(s, pd.DataFrame), "A per-column exchange mapping requires a DataFrame"
+        groups: dict[str, list] = {}
+        for col in s.columns:
+            groups.setdefault(exchange[col], []).append(col)
+        parts = [rolling_return_calendar(s[cols], years, exch, sessions) for exch, cols in groups.items()]
+        return pd.concat(parts, axis=1)[s.columns]
+
+    s_filled = s.ffill(limit_area="inside")
+    vals = s_filled.to_numpy(dtype=float).reshape(len(s_filled), -1)
+
+    # pos[i] = ordinal of the session on or before s.index[i]
+    session_idx, pos = calendars.session_positions(s.index, exchange)
+
+    # Last known value on each session (several rows may map to the same session)
+    grid = np.full((len(session_idx), vals.shape[1]), np.nan)
+    last_in_session = pos >= 0
+    last_in_session[:-1] &= pos[:-1] != pos[1:]
+    grid[pos[last_in_session]] = vals[last_in_session]
+    grid = pd.DataFrame(grid).ffill(limit_area="inside").to_numpy()
+
+    if sessions is None:
+        lags = calendars.window_lags(exchange, years, session_idx)
+    else:
+        lags = np.full(len(session_idx), sessions)
+
+    # Window start for each row, as a position into 'grid'
+    row_lags = np.where(pos >= 0, lags[pos], -1)
+    anchors = pos - row_lags
+    valid_mask = (pos >= 0) & (row_lags >= 0) & (anchors >= 0)
+
+    old_vals = np.full_like(vals, np.nan)
+    old_vals[valid_mask] = grid[anchors[valid_mask]]
+    ratio = vals / old_vals
+
+    if isinstance(s, pd.DataFrame):
+        return pd.DataFrame(ratio, index=s.index, columns=s.columns)
+
+    return pd.Series(ratio[:, 0], index=s.index, name=s.name)
+
+
+@profiled()
+def rolling_cagr_calendar(
+    s: pd.DataFrame | pd.Series,
+    years: int = 5,
+    exchange: str | dict[str, str] = "XNYS",
+    sessions: int | None = None,
+):
+    """
+    Trading-calendar aware rolling CAGR, see rolling_return_calendar.
+    With 'sessions', the window length in years is sessions / SESSIONS_PER_YEAR.
+    """
+    # Basic sanity checks
+    assert isinstance(
+        s.index, pd.DatetimeIndex
+    ), f"The index of the Series must be a DatetimeIndex, got: {type(s.index)}"
+    assert s.index.is_monotonic_increasing, "The index of the Series must be sorted in increasing order"
+
+    if (s.index[-1] - s.index[0]).days < 365:
+        warn("Less than 1 year of data. Returning NaNs")
+        return pd.Series(index=s.index, data=np.nan)
+
+    from . import calendars
+
+    simple_return = rolling_return_calendar(s, years=years, exchange=exchange, sessions=sessions)
+    window_years = years if sessions is None else sessions / calendars.SESSIONS_PER_YEAR
+    return (simple_return ** (1 / window_years)) - 1
+
+
+def download_ccy_pair(ccy_from, ccy_to="USD", start=None, end=None, store=None):
+    """
+    Daily bars of {ccy_from}{ccy_to}=X, with (field, ticker) columns as yf.download returns.
+
+    With a data_providers.price_store.PriceStore, only bars newer than the stored ones are
+    downloaded and the result is read back from the store, on every call.
+
+    Without a store, results are cached per arguments (download_ccy_pair.cache_clear()
+    resets them), and concurrent calls for the same arguments share one download.
+    """
     ccy_pair = f"{ccy_from}{ccy_to}=X"
+    if store is not None:
+        # Not cached: the store is the cache, and it must see every update
+        store.update([ccy_pair], start=start or "1990-01-01")
+        return store.read([ccy_pair], columns=["Open", "High", "Low", "Close"], start=start, end=end)
+    return _download_ccy_pair(ccy_pair, start, end)
+
+
+@single_flight(cache=True)
+def _download_ccy_pair(ccy_pair, start, end):
+    import yfinance as yf
+
     log.debug(f"Downloading currency pair {ccy_pair}")
     df = yf.download(ccy_pair, start=start, end=end)
     return df
 
 
+download_ccy_pair.cache_clear = _download_ccy_pair.cache_clear
+
+
 def normalize_currencies(df: pd.DataFrame, to="USD"):
     # TODO
     pass
 
 
-def to_usd(df, ccy_df=None, from_ccy="INR"):
+@profiled()
+def to_usd(df, ccy_df=None, from_ccy="INR", out=None, dtype=None, store=None):
+    """
+    Convert 'df' to USD by multiplying with the {from_ccy}USD rate.
+
+    Without 'ccy_df' the rate is downloaded, incrementally through 'store' (a PriceStore)
+    if one is given.
+
+    By default this is df.mul(ccy_df, axis=0), aligned on the union of both indexes.
+    With 'out'/'dtype' the rate is looked up as-of df.index (last known rate, on local
+    dates via finance.alignment) and the product written into a single buffer shaped like df.
+
+    Peak memory, on top of the input: about 2x by default (aligned copies + product);
+    with out/dtype the output buffer (nothing if 'out' is passed) plus one rate per row.
+    """
     start_date = df.index[0]
     end_date = df.index[-1]
     if ccy_df is None:
-        ccy_df = yf.download(f"{from_ccy}USD=X", start=start_date, end=end_date)["Close"]
+        ccy_df = download_ccy_pair(from_ccy, "USD", start_date, end_date, store=store)["Close"]
+    # yf.download returns the rate as a one-column frame, which mul() would align on columns
+    if isinstance(ccy_df, pd.DataFrame):
+        ccy_df = ccy_df.squeeze(axis=1)
     # TODO: Mask the Volume column if present
-    return df.mul(ccy_df, axis=0)
+    if out is None and dtype is None:
+        return df.mul(ccy_df, axis=0)
+
+    # Cached as-of gather on local dates, so an NSE frame and a UTC FX series line up
+    rate = alignment.asof(ccy_df, df.index).to_numpy(dtype=float)
+    out = _output_buffer(df, out, dtype)
+    np.multiply(df.to_numpy().reshape(len(df), -1), rate[:, None], out=out.reshape(len(df), -1), casting="same_kind")
+    return _wrap_output(df, out)
 
 
-def drawdowns(data: pd.DataFrame | pd.Series):
+@profiled()
+def drawdowns(data: pd.DataFrame | pd.Series, out=None, dtype=None):
     """
     Calculate the drawdowns of a time series.
+
+    With 'out'/'dtype' the result is written chunk by chunk into a single buffer, keeping
+    only the running maximum (one value per column) between chunks; 'out' may be the
+    input's own buffer.
+
+    Peak memory, on top of the input: about 2x by default (cummax + ratio); with
+    out/dtype the output buffer (nothing if 'out' is passed) plus one chunk of rows.
+    """
+    if out is None and dtype is None:
+        return (data / data.cummax()) - 1
+
+    out = _output_buffer(data, out, dtype)
+    vals = data.to_numpy().reshape(len(data), -1)
+    buf = out.reshape(len(data), -1)
+    running_max = np.full(buf.shape[1], np.nan, dtype=buf.dtype)
+    peaks = np.empty((min(_CHUNK_ROWS, len(buf)), buf.shape[1]), dtype=buf.dtype)
+    for r0 in range(0, len(buf), _CHUNK_ROWS):
+        r1 = min(r0 + _CHUNK_ROWS, len(buf))
+        peak = peaks[: r1 - r0]
+        # fmax skips NaNs, like cummax; the previous chunks' peak seeds this one
+        np.fmax.accumulate(vals[r0:r1], axis=0, out=peak, dtype=buf.dtype)
+        np.fmax(peak, running_max, out=peak)
+        running_max[:] = peak[-1]
+        np.divide(vals[r0:r1], peak, out=buf[r0:r1], casting="same_kind")
+        buf[r0:r1] -= 1
+    return _wrap_output(data, out)
+
+
+RISK_STATS = ("volatility", "sharpe", "downside_deviation", "sortino", "beta", "correlation")
+
+
+def _window_anchors(idx: pd.DatetimeIndex, years: int, snap_to_closest: bool) -> np.ndarray:
+    """
+    Position of the window start for each row, -1 if there is none. The window for row i
+    is (anchor, i], i.e. the same pair of dates rolling_return divides.
+    """
+    offset = pd.DateOffset(years=years)
+    if snap_to_closest:
+        return np.searchsorted(idx, idx - offset, side="right") - 1
+
+    # Exact matches only, as pct_change(freq=offset): first j with idx[j] + offset == idx[i]
+    shifted = idx + offset
+    anchors = shifted.searchsorted(idx, side="left")
+    found = anchors < len(idx)
+    found[found] = shifted[anchors[found]] == idx[found]
+    return np.where(found, anchors, -1)
+
+
+def _cumsum0(x: np.ndarray) -> np.ndarray:
+    """Cumulative sum along rows with a leading zero row, so sum(x[a+1:i+1]) == cs[i+1] - cs[a+1]."""
+    cs = np.zeros((x.shape[0] + 1,) + x.shape[1:])
+    np.cumsum(x, axis=0, out=cs[1:])
+    return cs
+
+
+def _window_sum(cs: np.ndarray, anchors: np.ndarray) -> np.ndarray:
+    """Sum over rows (anchor, i] for every row i, NaN where the window has no start."""
+    rows = np.flatnonzero(anchors >= 0)
+    result = np.full((len(anchors), cs.shape[1]), np.nan)
+    result[rows] = cs[rows + 1] - cs[anchors[rows] + 1]
+    return result
+
+
+@profiled()
+def rolling_risk_stats(
+    s: pd.DataFrame | pd.Series,
+    years: int | list[int] = 1,
+    stats: list[str] | None = None,
+    benchmark: pd.Series | None = None,
+    snap_to_closest: bool = False,
+    periods_per_year: int = 252,
+    risk_free: float = 0.0,
+    mar: float = 0.0,
+) -> pd.DataFrame:
     """
-    return (data / data.cummax()) - 1
+    Rolling risk statistics of the period returns of 's' over windows of 'years'.
+
+    Windows follow rolling_return: the window ending at t starts at t - years (snapped to the
+    last known date if 'snap_to_closest', else only where that date exists) and is NaN when
+    there is no such start. Each statistic is computed from cumulative sums of the (centered)
+    returns, so every window is O(1) and all columns are done at once; the sums are shared
+    across all requested 'years'.
+
+    stats: any of RISK_STATS (default: all, beta/correlation only with a benchmark).
+    benchmark: price series for beta/correlation, as-of aligned to s.index.
+    risk_free, mar: annual risk-free rate (Sharpe) and minimum acceptable return (Sortino,
+    downside deviation). Volatility, Sharpe, Sortino and downside deviation are annualized
+    with 'periods_per_year'.
+
+    Returns a DataFrame with columns (stat, years, column), or (stat, years) for a Series.
+    """
+    # Basic sanity checks
+    assert isinstance(
+        s.index, pd.DatetimeIndex
+    ), f"The index of the Series must be a DatetimeIndex, got: {type(s.index)}"
+    assert s.index.is_monotonic_increasing, "The index of the Series must be sorted in increasing order"
+
+    years_list = [years] if isinstance(years, int) else list(years)
+    if stats is None:
+        stats = [k for k in RISK_STATS if benchmark is not None or k not in ("beta", "correlation")]
+    unknown = set(stats) - set(RISK_STATS)
+    if unknown:
+        raise ValueError(f"Unknown stats {sorted(unknown)}, expected any of {RISK_STATS}")
+    if benchmark is None and {"beta", "correlation"} & set(stats):
+        raise ValueError("beta and correlation require a benchmark")
+
+    vals = s.ffill(limit_area="inside").to_numpy(dtype=float).reshape(len(s), -1)
+    returns = np.full_like(vals, np.nan)
+    returns[1:] = vals[1:] / vals[:-1] - 1
+    valid = np.isfinite(returns)
+
+    # Center on the column mean before accumulating; sums of squares of raw returns lose
+    # precision over long histories, centered ones don't (the variance is shift invariant)
+    with catch_warnings():
+        simplefilter("ignore", RuntimeWarning)  # all-NaN columns
+        mu = np.nanmean(returns, axis=0)
+    x = np.where(valid, returns - mu, 0.0)
+    cs_n = _cumsum0(valid.astype(float))
+    cs_x = _cumsum0(x)
+    cs_xx = _cumsum0(x * x)
+
+    if {"downside_deviation", "sortino"} & set(stats):
+        downside = np.where(valid, np.minimum(returns - mar / periods_per_year, 0.0), 0.0)
+        cs_dd = _cumsum0(downside * downside)
+
+    if benchmark is not None:
+        b_vals = benchmark.reindex(s.index, method="ffill").to_numpy(dtype=float)
+        b_returns = np.full_like(b_vals, np.nan)
+        b_returns[1:] = b_vals[1:] / b_vals[:-1] - 1
+        pair = valid & np.isfinite(b_returns)[:, None]
+        y = np.where(pair, (b_returns - np.nanmean(b_returns))[:, None], 0.0)
+        xp = np.where(pair, x, 0.0)
+        cs_pn = _cumsum0(pair.astype(float))
+        cs_px, cs_py = _cumsum0(xp), _cumsum0(y)
+        cs_pxy, cs_pyy, cs_pxx = _cumsum0(xp * y), _cumsum0(y * y), _cumsum0(xp * xp)
+
+    ann = np.sqrt(periods_per_year)
+    results = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for yrs in years_list:
+            anchors = _window_anchors(s.index, yrs, snap_to_closest)
+            n = _window_sum(cs_n, anchors)
+            n[n < 2] = np.nan
+            sx = _window_sum(cs_x, anchors)
+            std = np.sqrt(np.maximum(_window_sum(cs_xx, anchors) - sx * sx / n, 0.0) / (n - 1))
+            mean = sx / n + mu
+
+            if "volatility" in stats:
+                results["volatility", yrs] = std * ann
+            if "sharpe" in stats:
+                results["sharpe", yrs] = (mean - risk_free / periods_per_year) / std * ann
+            if {"downside_deviation", "sortino"} & set(stats):
+                dd = np.sqrt(_window_sum(cs_dd, anchors) / n)
+                if "downside_deviation" in stats:
+                    results["downside_deviation", yrs] = dd * ann
+                if "sortino" in stats:
+                    results["sortino", yrs] = (mean - mar / periods_per_year) / dd * ann
+
+            if benchmark is not None:
+                pn = _window_sum(cs_pn, anchors)
+                pn[pn < 2] = np.nan
+                px, py = _window_sum(cs_px, anchors), _window_sum(cs_py, anchors)
+                cov = _window_sum(cs_pxy, anchors) - px * py / pn
+                var_y = _window_sum(cs_pyy, anchors) - py * py / pn
+                if "beta" in stats:
+                    results["beta", yrs] = cov / var_y
+                if "correlation" in stats:
+                    var_x = _window_sum(cs_pxx, anchors) - px * px / pn
+                    results["correlation", yrs] = cov / np.sqrt(var_x * var_y)
+
+    columns = s.columns if isinstance(s, pd.DataFrame) else [s.name]
+    frames = {key: pd.DataFrame(results[key], index=s.index, columns=columns) for key in results}
+    out = pd.concat(frames, axis=1).sort_index(axis=1)
+    if isinstance(s, pd.Series):
+        out.columns = out.columns.droplevel(-1)
+    return out
+
+
+def _single_risk_stat(stat: str, s: pd.DataFrame | pd.Series, years: int, **kwargs) -> pd.DataFrame | pd.Series:
+    result = rolling_risk_stats(s, years=years, stats=[stat], **kwargs)[stat, years]
+    if isinstance(s, pd.Series):
+        return result.rename(s.name)
+    return result
+
+
+def rolling_volatility(s: pd.DataFrame | pd.Series, years: int = 1, snap_to_closest=False, periods_per_year=252):
+    """Annualized rolling volatility of period returns, see rolling_risk_stats."""
+    return _single_risk_stat("volatility", s, years, snap_to_closest=snap_to_closest, periods_per_year=periods_per_year)
+
+
+def rolling_sharpe(
+    s: pd.DataFrame | pd.Series, years: int = 1, risk_free=0.0, snap_to_closest=False, periods_per_year=252
+):
+    """Annualized rolling Sharpe ratio ('risk_free' is an annual rate), see rolling_risk_stats."""
+    return _single_risk_stat(
+        "sharpe", s, years, risk_free=risk_free, snap_to_closest=snap_to_closest, periods_per_year=periods_per_year
+    )
+
+
+def rolling_downside_deviation(
+    s: pd.DataFrame | pd.Series, years: int = 1, mar=0.0, snap_to_closest=False, periods_per_year=252
+):
+    """Annualized rolling downside deviation below 'mar' (annual), see rolling_risk_stats."""
+    return _single_risk_stat(
+        "downside_deviation", s, years, mar=mar, snap_to_closest=snap_to_closest, periods_per_year=periods_per_year
+    )
+
+
+def rolling_sortino(s: pd.DataFrame | pd.Series, years: int = 1, mar=0.0, snap_to_closest=False, periods_per_year=252):
+    """Annualized rolling Sortino ratio against 'mar' (annual), see rolling_risk_stats."""
+    return _single_risk_stat(
+        "sortino", s, years, mar=mar, snap_to_closest=snap_to_closest, periods_per_year=periods_per_year
+    )
+
+
+def rolling_beta(s: pd.DataFrame | pd.Series, benchmark: pd.Series, years: int = 1, snap_to_closest=False):
+    """Rolling beta of period returns against 'benchmark' prices, see rolling_risk_stats."""
+    return _single_risk_stat("beta", s, years, benchmark=benchmark, snap_to_closest=snap_to_closest)
+
+
+def rolling_correlation(s: pd.DataFrame | pd.Series, benchmark: pd.Series, years: int = 1, snap_to_closest=False):
+    """Rolling correlation of period returns with 'benchmark' prices, see rolling_risk_stats."""
+    return _single_risk_stat("correlation", s, years, benchmark=benchmark, snap_to_closest=snap_to_closest)
 
 
 def remove_tz(df):
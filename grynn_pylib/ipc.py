@@ -0,0 +1,169 @@
+"""Hand DataFrames between processes as Arrow IPC in shared memory instead of pickles.
+
+The sending process serializes a frame once, straight into a `multiprocessing.shared_memory`
+block, and passes back only a small SharedFrame handle (block name and size). The receiver
+memory-maps the block and reads the Arrow table without copying, converts it to pandas
+and unlinks the block (the mapping lives as long as any Arrow buffer still uses it).
+Arrow keeps the index, tz-aware timestamps, categoricals and string columns, so
+normalized option chains and wide price panels round-trip unchanged (except the index freq).
+
+map_frames() is a process-pool map over functions that return DataFrames (or tuples of
+them) and uses this transport by default.
+
+Usage example:
+    from grynn_pylib import ipc
+
+    handle = ipc.to_shared(df)      # in the worker
+    df = ipc.from_shared(handle)    # in the parent; the block is unlinked after reading
+
+    for ticker, chain in zip(tickers, ipc.map_frames(fetch_chain, tickers, workers=8)):
+        ...
+"""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+import pandas as pd
+
+TRANSPORTS = ("arrow", "pickle")
+_SHM_DIR = "/dev/shm"
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError("Arrow IPC requires pyarrow: pip install 'grynn_pylib[arrow]'") from e
+    return pa
+
+
+@dataclass(frozen=True)
+class SharedFrame:
+    """Picklable handle to a DataFrame serialized as an Arrow IPC file in shared memory."""
+
+    name: str
+    size: int
+    series: bool = False
+
+
+def to_shared(df: pd.DataFrame | pd.Series) -> SharedFrame:
+    """Serialize 'df' into a new shared memory block; the receiver must call from_shared() once."""
+    pa = _require_pyarrow()
+    series = isinstance(df, pd.Series)
+    table = pa.Table.from_pandas(df.to_frame() if series else df, preserve_index=True)
+
+    # Size the block with a dry run: MockOutputStream counts bytes without writing them
+    sink = pa.MockOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    size = sink.size()
+
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    try:
+        sink = pa.FixedSizeBufferWriter(pa.py_buffer(shm.buf))
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        sink.close()
+        # Arrow objects export shm.buf; all of them must be gone before it can be closed
+        del writer, sink
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    # The receiver owns the block from here: without this, the resource tracker of a worker
+    # that exits first would unlink it before it is read
+    resource_tracker.unregister(shm._name, "shared_memory")
+    shm.close()
+    return SharedFrame(shm.name, size, series)
+
+
+def from_shared(handle: SharedFrame, unlink: bool = True) -> pd.DataFrame | pd.Series:
+    """Read a frame written by to_shared(); unlinks the block unless unlink=False (then the caller owns it)."""
+    pa = _require_pyarrow()
+    shm = shared_memory.SharedMemory(name=handle.name)
+    try:
+        path = Path(_SHM_DIR) / shm.name.lstrip("/")
+        if path.exists():
+            # Arrow maps the block itself and its buffers keep the mapping alive, so columns that
+            # stay Arrow-backed after to_pandas (strings on pandas >= 3) need no copy and no cleanup
+            source = pa.memory_map(str(path), "r")
+        else:
+            # No file view of shared memory (macOS): one copy out of the block
+            source = pa.py_buffer(bytes(shm.buf[: handle.size]))
+        df = pa.ipc.open_file(source).read_all().to_pandas()
+    finally:
+        shm.close()
+        if unlink:
+            shm.unlink()
+        else:
+            resource_tracker.unregister(shm._name, "shared_memory")
+    return df.squeeze(axis=1) if handle.series else df
+
+
+def _encode(result: Any) -> Any:
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return to_shared(result)
+    if isinstance(result, tuple):
+        return tuple(_encode(r) for r in result)
+    return result
+
+
+def _decode(result: Any) -> Any:
+    if isinstance(result, SharedFrame):
+        return from_shared(result)
+    if isinstance(result, tuple):
+        return tuple(_decode(r) for r in result)
+    return result
+
+
+def _call_shared(func: Callable, item: Any) -> Any:
+    """Worker side of map_frames: run func and hand DataFrames back through shared memory."""
+    return _encode(func(item))
+
+
+def map_frames(
+    func: Callable[[Any], Any],
+    items: Iterable,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    transport: str = "arrow",
+) -> Iterator:
+    """Process-pool map over a function returning DataFrames (or tuples of them); results in order.
+
+    Args:
+        func: Picklable (module level) function of one item
+        items: Inputs, one task each
+        workers: Processes when no executor is given (default: os.cpu_count())
+        executor: Existing ProcessPoolExecutor to reuse
+        transport: "arrow" (shared memory Arrow IPC) or "pickle" (plain executor results)
+    """
+    if transport not in TRANSPORTS:
+        raise ValueError(f"transport must be one of {TRANSPORTS}, got {transport!r}")
+    if transport == "arrow":
+        _require_pyarrow()
+    return _iter_results(func, items, workers, executor, transport)
+
+
+def _iter_results(func, items, workers, executor, transport) -> Iterator:
+    pool = executor or ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+    try:
+        if transport == "pickle":
+            yield from pool.map(func, items)
+            return
+        futures = [pool.submit(_call_shared, func, item) for item in items]
+        for i, future in enumerate(futures):
+            try:
+                yield _decode(future.result())
+            except BaseException:
+                # Also on early exit (GeneratorExit): release the blocks of results not read
+                for rest in futures[i + 1 :]:
+                    if not rest.cancel() and rest.exception() is None:
+                        _decode(rest.result())
+                raise
+    finally:
+        if executor is None:
+            pool.shutdown()
@@ -0,0 +1,300 @@
+"""Streaming report export: Excel (xlsxwriter constant_memory), HTML (jinja2) and Markdown (tabulate).
+
+Every exporter takes one DataFrame, an iterable of DataFrame chunks (e.g. from a generator),
+or a dict of sheet/section name => either of those. Rows are written chunk by chunk and
+never collected, so memory stays flat however long the report is. Column formats are
+worked out once per sheet, from its first chunk; the write method follows each chunk's
+dtypes, so a column whose dtype changes between chunks is still written.
+
+Usage example:
+    from grynn_pylib import reports
+
+    reports.write_excel("chains.xlsx", {"calls": calls, "puts": puts}, formats={"iv": "0.0%"})
+    reports.write_html("risk.html", risk_chunks(), title="Risk", float_format=",.4f")
+    reports.write_markdown("cagr.md", {"5y CAGR": cagr_5y})
+"""
+
+import math
+from datetime import date
+from itertools import chain
+from pathlib import Path
+from typing import IO, Callable, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+Frames = pd.DataFrame | Iterable[pd.DataFrame]
+
+# Excel's limit is 1,048,576 rows including the header; longer sheets spill into "<name> (2)", ...
+EXCEL_MAX_ROWS = 1_048_575
+_EXCEL_EPOCH = np.datetime64("1899-12-30", "ns")
+_DEFAULT_NUM_FORMATS = {"datetime": "yyyy-mm-dd hh:mm:ss", "date": "yyyy-mm-dd"}
+
+
+def _as_sheets(frames: Frames | dict[str, Frames], default_name: str) -> dict[str, Frames]:
+    if isinstance(frames, dict):
+        return frames
+    return {default_name: frames}
+
+
+def _chunks(frames: Frames, chunk_rows: int, index: bool) -> Iterator[pd.DataFrame]:
+    """Yield chunks of at most chunk_rows rows, with the index moved into columns if requested."""
+    if isinstance(frames, pd.DataFrame):
+        frames = [frames]
+    for frame in frames:
+        if isinstance(frame, pd.Series):
+            frame = frame.to_frame()
+        for start in range(0, len(frame), chunk_rows):
+            chunk = frame.iloc[start : start + chunk_rows]
+            yield chunk.reset_index() if index else chunk
+
+
+def _is_missing(value) -> bool:
+    """None, NaN, NaT or pd.NA (non-scalars such as lists are never missing)."""
+    return value is None or (pd.api.types.is_scalar(value) and pd.isna(value))
+
+
+def _open(out: str | Path | IO[str]):
+    if isinstance(out, (str, Path)):
+        return open(out, "w", encoding="utf-8")
+    return _NoClose(out)
+
+
+class _NoClose:
+    """Context manager over a caller-owned stream that leaves it open."""
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+
+    def __enter__(self) -> IO[str]:
+        return self.stream
+
+    def __exit__(self, *exc):
+        return False
+
+
+# --- Excel -----------------------------------------------------------------------------
+
+
+def _excel_column(series: pd.Series) -> tuple[str, list]:
+    """(kind, values) for one column: numbers and dates as floats (NaN = blank), the rest as objects."""
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return "bool", series.tolist()
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        if getattr(dtype, "tz", None) is not None:
+            # Excel has no time zones, write the wall-clock time
+            series = series.dt.tz_localize(None)
+        serial = (series.to_numpy(dtype="datetime64[ns]") - _EXCEL_EPOCH) / np.timedelta64(1, "D")
+        return "datetime", serial.tolist()
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "number", series.to_numpy(dtype=float, na_value=np.nan).tolist()
+    return "object", series.tolist()
+
+
+def _sheet_layout(workbook, worksheet, first: pd.DataFrame, formats: dict[str, str], widths: dict[str, float]):
+    """Set column formats/widths once per worksheet, from the kinds of the first chunk."""
+    for col, name in enumerate(first.columns):
+        kind, _ = _excel_column(first[name].iloc[:0])
+        if kind == "object" and len(first) and isinstance(first[name].iloc[0], date):
+            kind = "date"
+        num_format = formats.get(str(name), _DEFAULT_NUM_FORMATS.get(kind))
+        fmt = workbook.add_format({"num_format": num_format}) if num_format else None
+        width = widths.get(str(name), 20 if kind == "datetime" else max(10, min(40, len(str(name)) + 2)))
+        worksheet.set_column(col, col, width, fmt)
+
+
+def write_excel(
+    path: str | Path,
+    sheets: Frames | dict[str, Frames],
+    formats: dict[str, str] | None = None,
+    column_widths: dict[str, float] | None = None,
+    index: bool = True,
+    chunk_rows: int = 50_000,
+) -> Path:
+    """
+    Stream DataFrames into an .xlsx with xlsxwriter's constant_memory mode
+
+    Each row is flushed to disk once the next one is started, so memory is bounded by
+    chunk_rows regardless of the size of the workbook. Cell formats are set per column
+    (Excel number formats, e.g. {"iv": "0.0%", "strike": "#,##0.00"}) rather than per cell.
+    Sheets longer than Excel's row limit continue on "<name> (2)", "<name> (3)", ...
+    """
+    import xlsxwriter
+
+    formats = formats or {}
+    column_widths = column_widths or {}
+    path = Path(path)
+    workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+    header_format = workbook.add_format({"bold": True})
+    try:
+        for sheet_name, frames in _as_sheets(sheets, "Sheet1").items():
+            chunks = _chunks(frames, chunk_rows, index)
+            first = next(chunks, None)
+            if first is None:
+                workbook.add_worksheet(sheet_name[:31])
+                continue
+
+            part, worksheet, row = 1, None, EXCEL_MAX_ROWS + 1
+            for chunk in chain([first], chunks):
+                # Kinds per chunk: a later chunk may hold e.g. strings in a column that started as floats
+                kinds, columns = zip(*(_excel_column(chunk[name]) for name in chunk.columns))
+                for values in zip(*columns):
+                    if row > EXCEL_MAX_ROWS:
+                        name = sheet_name if part == 1 else f"{sheet_name[:26]} ({part})"
+                        worksheet = workbook.add_worksheet(name[:31])
+                        _sheet_layout(workbook, worksheet, first, formats, column_widths)
+                        worksheet.write_row(0, 0, [str(c) for c in first.columns], header_format)
+                        worksheet.freeze_panes(1, 0)
+                        part, row = part + 1, 1
+                    for col, (kind, value) in enumerate(zip(kinds, values)):
+                        if kind == "number" or kind == "datetime":
+                            if not math.isnan(value):
+                                worksheet.write_number(row, col, value)
+                        elif _is_missing(value):
+                            continue
+                        elif kind == "bool":
+                            worksheet.write_boolean(row, col, value)
+                        else:
+                            worksheet.write(row, col, value)
+                    row += 1
+    finally:
+        workbook.close()
+    return path
+
+
+# --- HTML ------------------------------------------------------------------------------
+
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{{ title }}</title>
+<style>
+table { border-collapse: collapse; font-family: sans-serif; font-size: 13px; }
+th, td { border: 1px solid #ddd; padding: 2px 6px; }
+th { background: #f3f3f3; position: sticky; top: 0; }
+td.num { text-align: right; }
+</style>
+</head>
+<body>
+{% if title %}<h1>{{ title }}</h1>{% endif %}
+{% for name, header, numeric, rows in sections %}
+{% if name %}<h2>{{ name }}</h2>{% endif %}
+<table>
+<thead><tr>{% for h in header %}<th>{{ h }}</th>{% endfor %}</tr></thead>
+<tbody>
+{% for row in rows %}<tr>
+{%- for cell in row %}<td{% if numeric[loop.index0] %} class="num"{% endif %}>{{ cell }}</td>{% endfor -%}
+</tr>
+{% endfor %}</tbody>
+</table>
+{% endfor %}
+</body>
+</html>
+"""
+
+
+def _formatters(first: pd.DataFrame, float_format: str, formats: dict[str, str]) -> list[Callable]:
+    """One formatter per column (Python format specs), chosen once from the first chunk."""
+
+    def make(spec: str | None) -> Callable:
+        if spec is None:
+            return lambda v: "" if _is_missing(v) else str(v)
+        return lambda v: "" if _is_missing(v) else format(v, spec)
+
+    result = []
+    for name in first.columns:
+        spec = formats.get(str(name))
+        if spec is None and pd.api.types.is_float_dtype(first[name].dtype):
+            spec = float_format
+        result.append(make(spec))
+    return result
+
+
+def _text_rows(chunks: Iterator[pd.DataFrame], first: pd.DataFrame, float_format: str, formats: dict[str, str]):
+    fmts = _formatters(first, float_format, formats)
+    for chunk in chain([first], chunks):
+        columns = [list(map(f, chunk[name].tolist())) for f, name in zip(fmts, chunk.columns)]
+        yield from zip(*columns)
+
+
+def write_html(
+    out: str | Path | IO[str],
+    sections: Frames | dict[str, Frames],
+    title: str = "",
+    float_format: str = ",.4f",
+    formats: dict[str, str] | None = None,
+    index: bool = True,
+    chunk_rows: int = 10_000,
+) -> None:
+    """
+    Stream DataFrames into an HTML page, one table per section
+
+    The jinja2 template is rendered with stream(), so rows are formatted and written
+    chunk by chunk. formats maps column => Python format spec (e.g. {"iv": ".1%"}).
+    """
+    import jinja2
+
+    formats = formats or {}
+    template = jinja2.Environment(autoescape=True).from_string(_HTML_TEMPLATE)
+
+    def generate_sections():
+        for name, frames in _as_sections(sections):
+            chunks = _chunks(frames, chunk_rows, index)
+            first = next(chunks, None)
+            if first is None:
+                yield name, [], [], iter(())
+                continue
+            numeric = [pd.api.types.is_numeric_dtype(first[c].dtype) for c in first.columns]
+            yield name, [str(c) for c in first.columns], numeric, _text_rows(chunks, first, float_format, formats)
+
+    with _open(out) as f:
+        template.stream(title=title, sections=generate_sections()).dump(f)
+
+
+def _as_sections(sections: Frames | dict[str, Frames]) -> Iterator[tuple[str, Frames]]:
+    yield from _as_sheets(sections, "").items()
+
+
+# --- Markdown --------------------------------------------------------------------------
+
+
+def write_markdown(
+    out: str | Path | IO[str],
+    sections: Frames | dict[str, Frames],
+    float_format: str = ",.4f",
+    formats: dict[str, str] | None = None,
+    index: bool = True,
+    chunk_rows: int = 10_000,
+) -> None:
+    """
+    Stream DataFrames into Markdown pipe tables, one per section ("## <name>" headings)
+
+    Each chunk is rendered with tabulate on its own, so column widths may differ between
+    chunks; the result is still one valid pipe table per section.
+    """
+    from tabulate import tabulate
+
+    formats = formats or {}
+    with _open(out) as f:
+        for name, frames in _as_sections(sections):
+            if name:
+                f.write(f"## {name}\n\n")
+            chunks = _chunks(frames, chunk_rows, index)
+            first = next(chunks, None)
+            if first is None:
+                continue
+            header = [str(c) for c in first.columns]
+            numeric = [pd.api.types.is_numeric_dtype(first[c].dtype) for c in first.columns]
+            colalign = ["right" if n else "left" for n in numeric]
+            rows = _text_rows(chunks, first, float_format, formats)
+
+            written_header = False
+            while batch := [row for _, row in zip(range(chunk_rows), rows)]:
+                lines = tabulate(batch, headers=header, tablefmt="pipe", colalign=colalign, disable_numparse=True)
+                # Header and separator only once per table
+                f.write(lines if not written_header else lines.split("\n", 2)[2])
+                f.write("\n")
+                written_header = True
+            f.write("\n")
@@ -1,6 +1,8 @@
 import subprocess
 import tempfile
+from dataclasses import dataclass, field
 from loguru import logger
+import numpy as np
 import pandas as pd
 
 
@@ -33,10 +35,165 @@ def bcompare_frames(a: pd.DataFrame, b: pd.DataFrame):
             # bcomp in turn waits for the user to close the comparison window
 
 
-def bcompare(a: pd.Series | pd.DataFrame | pd.Index, b: pd.Series | pd.DataFrame | pd.Index):
+@dataclass
+class FrameDiff:
+    """
+    Result of diff_frames: keys added/removed, cell-level changes and column differences
+    """
+
+    added: pd.Index
+    removed: pd.Index
+    changed: pd.DataFrame  # (key, column) MultiIndex, columns 'a' and 'b'
+    added_columns: pd.Index
+    removed_columns: pd.Index
+    compared_rows: int = 0
+    hashed_equal_rows: int = 0
+    _a: pd.DataFrame = field(default=None, repr=False)
+    _b: pd.DataFrame = field(default=None, repr=False)
+
+    @property
+    def changed_keys(self) -> pd.Index:
+        return self.changed.index.get_level_values(0).unique()
+
+    @property
+    def equal(self) -> bool:
+        return not (
+            len(self.added)
+            or len(self.removed)
+            or len(self.changed)
+            or len(self.added_columns)
+            or len(self.removed_columns)
+        )
+
+    def changes_by_column(self) -> pd.Series:
+        """Number of changed cells per column."""
+        return self.changed.groupby(level=1, sort=False).size()
+
+    def slices(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Only the differing rows (changed, removed from a, added to b) and the columns that differ."""
+        columns = self.changes_by_column().index
+        a_cols = columns.union(self.removed_columns, sort=False)
+        b_cols = columns.union(self.added_columns, sort=False)
+        rows = self.changed_keys
+        if len(self.added_columns) or len(self.removed_columns):
+            # Every common row differs in the added/removed columns
+            rows = self._a.index.intersection(self._b.index, sort=False)
+        elif not len(self.changed):
+            # Only added/removed rows: show them in full
+            a_cols = b_cols = self._a.columns.intersection(self._b.columns, sort=False)
+        a_rows = rows.append(self.removed)
+        b_rows = rows.append(self.added)
+        return self._a.loc[a_rows, a_cols], self._b.loc[b_rows, b_cols]
+
+    def summary(self) -> str:
+        lines = [
+            f"rows compared: {self.compared_rows} ({self.hashed_equal_rows} identical by hash)",
+            f"added rows: {len(self.added)}, removed rows: {len(self.removed)}, "
+            f"changed rows: {len(self.changed_keys)} ({len(self.changed)} cells)",
+        ]
+        if len(self.added_columns) or len(self.removed_columns):
+            lines.append(f"added columns: {list(self.added_columns)}, removed columns: {list(self.removed_columns)}")
+        for column, count in self.changes_by_column().items():
+            lines.append(f"  {column}: {count} changed")
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.summary()
+
+
+def _cells_differ(a: pd.Series, b: pd.Series, atol: float, rtol: float) -> np.ndarray:
+    """Boolean mask of cells that differ (NaN == NaN; numeric columns within atol + rtol * |b|)."""
+    if pd.api.types.is_numeric_dtype(a.dtype) and pd.api.types.is_numeric_dtype(b.dtype):
+        av = a.to_numpy(dtype=float, na_value=np.nan)
+        bv = b.to_numpy(dtype=float, na_value=np.nan)
+        return ~np.isclose(av, bv, rtol=rtol, atol=atol, equal_nan=True)
+    a_na, b_na = a.isna().to_numpy(), b.isna().to_numpy()
+    return ~((a.to_numpy() == b.to_numpy()) | (a_na & b_na)) | (a_na != b_na)
+
+
+def diff_frames(
+    a: pd.DataFrame, b: pd.DataFrame, atol: float = 0.0, rtol: float = 0.0, chunk_rows: int = 1_000_000
+) -> FrameDiff:
+    """
+    Diff two dataframes keyed by their (unique) index, without leaving the process
+
+    Rows present in both frames are hashed chunk by chunk (pd.util.hash_pandas_object);
+    only rows whose hashes differ are compared cell by cell, with tolerance for numeric columns.
+    Memory beyond the inputs is bounded by chunk_rows.
+    """
+    for name, df in (("a", a), ("b", b)):
+        if not df.index.is_unique:
+            raise ValueError(f"Index of '{name}' must be unique to diff by key")
+
+    columns = a.columns.intersection(b.columns, sort=False)
+    common = a.index.intersection(b.index, sort=False)
+    a_pos = a.index.get_indexer(common)
+    b_pos = b.index.get_indexer(common)
+
+    changed_parts = []
+    # With no shared columns there is nothing to hash: common rows are unchanged
+    # and the frames differ only in their (added/removed) columns
+    hashed_rows = len(common) if len(columns) else 0
+    hashed_equal = len(common) - hashed_rows
+    for start in range(0, hashed_rows, chunk_rows):
+        a_chunk = a.iloc[a_pos[start : start + chunk_rows]][columns]
+        b_chunk = b.iloc[b_pos[start : start + chunk_rows]][columns]
+        a_hash = pd.util.hash_pandas_object(a_chunk, index=False).to_numpy()
+        b_hash = pd.util.hash_pandas_object(b_chunk, index=False).to_numpy()
+        candidates = np.flatnonzero(a_hash != b_hash)
+        hashed_equal += len(a_hash) - len(candidates)
+        if not len(candidates):
+            continue
+
+        a_rows, b_rows = a_chunk.iloc[candidates], b_chunk.iloc[candidates]
+        for column in columns:
+            mask = _cells_differ(a_rows[column], b_rows[column], atol, rtol)
+            if mask.any():
+                changed_parts.append(
+                    pd.DataFrame(
+                        {
+                            "key": a_rows.index[mask],
+                            "column": column,
+                            "a": a_rows[column].to_numpy()[mask],
+                            "b": b_rows[column].to_numpy()[mask],
+                        }
+                    )
+                )
+
+    if changed_parts:
+        changed = pd.concat(changed_parts, ignore_index=True).set_index(["key", "column"])
+    else:
+        changed = pd.DataFrame({"a": [], "b": []}, index=pd.MultiIndex.from_arrays([[], []], names=["key", "column"]))
+
+    return FrameDiff(
+        added=b.index.difference(a.index, sort=False),
+        removed=a.index.difference(b.index, sort=False),
+        changed=changed,
+        added_columns=b.columns.difference(a.columns, sort=False),
+        removed_columns=a.columns.difference(b.columns, sort=False),
+        compared_rows=len(common),
+        hashed_equal_rows=hashed_equal,
+        _a=a,
+        _b=b,
+    )
+
+
+def bcompare(
+    a: pd.Series | pd.DataFrame | pd.Index,
+    b: pd.Series | pd.DataFrame | pd.Index,
+    engine: str = "bcomp",
+    only_diff: bool = False,
+    atol: float = 0.0,
+    rtol: float = 0.0,
+) -> FrameDiff | None:
     """
     Diff two series or dataframes using Beyond Compare (wait for user to close the window)
+
+    engine="native" diffs in-process and returns a FrameDiff instead (no GUI needed).
+    only_diff=True sends only the differing rows/columns to Beyond Compare.
     """
+    if engine not in ("bcomp", "native"):
+        raise ValueError(f"engine must be 'bcomp' or 'native', got {engine!r}")
     # promote index to series and series to dataframe
     if isinstance(a, pd.Index):
         a = a.to_series()
@@ -47,4 +204,18 @@ def bcompare(a: pd.Series | pd.DataFrame | pd.Index, b: pd.Series | pd.DataFrame
         a = pd.DataFrame(a)
     if isinstance(b, pd.Series):
         b = pd.DataFrame(b)
+
+    if engine == "native" or only_diff:
+        diff = diff_frames(a, b, atol=atol, rtol=rtol)
+        if engine == "native":
+            return diff
+        if diff.equal:
+            logger.info("Frames are equal, nothing to compare")
+            return diff
+        a_slice, b_slice = diff.slices()
+        a_slice.index.name, b_slice.index.name = a.index.name, b.index.name
+        a_slice.columns.name, b_slice.columns.name = a.columns.name, b.columns.name
+        bcompare_frames(a_slice, b_slice)
+        return diff
+
     bcompare_frames(a, b)
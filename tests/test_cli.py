@@ -0,0 +1,83 @@
+import pandas as pd
+from click.testing import CliRunner
+
+from grynn_pylib import cli
+from grynn_pylib.data_providers import synthetic
+from grynn_pylib.finance import timeseries
+
+
+def test_chains_snapshot_resumes(tmp_path):
+    tickers = tmp_path / "tickers.txt"
+    tickers.write_text("aaa\nBBB  # comment\n\nAAA\n")
+    out = tmp_path / "snap"
+    args = ["chains", "snapshot", "--tickers", str(tickers), "--out", str(out), "--source", "synthetic"]
+    args += ["--max-expiries", "2"]
+
+    result = CliRunner().invoke(cli.main, args + ["--workers", "2"])
+    assert result.exit_code == 0, result.output
+    assert sorted(p.name for p in out.iterdir()) == ["AAA.parquet", "BBB.parquet", "_manifest.json"]
+
+    chain = pd.read_parquet(out / "AAA.parquet")
+    assert set(chain["option_type"]) == {"call", "put"}
+    assert chain["expiry"].nunique() == 2
+
+    result = CliRunner().invoke(cli.main, args)
+    assert result.exit_code == 0, result.output
+    assert "0 written" in result.output and "2 already done" in result.output
+
+
+def test_timeseries_cagr(tmp_path):
+    prices = synthetic.gbm_panel(5, years=4, seed=3)
+    src = tmp_path / "prices.parquet"
+    prices.to_parquet(src)
+    out = tmp_path / "cagr"
+
+    result = CliRunner().invoke(
+        cli.main,
+        ["timeseries", "cagr", "--input", str(src), "--out", str(out), "--years", "1,3", "--block-size", "2"]
+        + ["--workers", "2"],
+    )
+    assert result.exit_code == 0, result.output
+    assert len(list(out.glob("part-*.parquet"))) == 3
+
+    long = pd.read_parquet(out).set_index(["date", "series"]).sort_index()
+    assert list(long.columns) == ["cagr_1y", "cagr_3y"]
+    expected = timeseries.rolling_cagr(prices, years=3)
+    pd.testing.assert_series_equal(
+        long["cagr_3y"].xs("S00003", level="series").dropna(),
+        expected["S00003"].dropna(),
+        check_names=False,
+        check_freq=False,
+    )
+
+
+def test_chains_snapshot_refuses_to_resume_with_other_parameters(tmp_path):
+    out = tmp_path / "snap"
+    args = ["chains", "snapshot", "--ticker", "AAA", "--out", str(out), "--source", "synthetic"]
+
+    assert CliRunner().invoke(cli.main, args + ["--max-expiries", "2"]).exit_code == 0
+    result = CliRunner().invoke(cli.main, args + ["--max-expiries", "3"])
+    assert result.exit_code != 0
+    assert "max_expiries" in result.output
+
+    result = CliRunner().invoke(cli.main, args + ["--max-expiries", "3", "--no-resume"])
+    assert result.exit_code == 0, result.output
+    assert pd.read_parquet(out / "AAA.parquet")["expiry"].nunique() == 3
+    # The new parameters are recorded: resuming with them works
+    assert CliRunner().invoke(cli.main, args + ["--max-expiries", "3"]).exit_code == 0
+
+
+def test_timeseries_cagr_removes_stale_temp_files(tmp_path):
+    src = tmp_path / "prices.parquet"
+    synthetic.gbm_panel(2, years=2, seed=3).to_parquet(src)
+    out = tmp_path / "cagr"
+    out.mkdir()
+    # Left behind by a crashed run, from before temp files were hidden
+    (out / "part-00000.parquet.tmp").write_bytes(b"partial")
+
+    result = CliRunner().invoke(
+        cli.main, ["timeseries", "cagr", "--input", str(src), "--out", str(out), "--workers", "1"]
+    )
+    assert result.exit_code == 0, result.output
+    assert not list(out.glob("*.tmp"))
+    assert set(pd.read_parquet(out)["series"]) == {"S00000", "S00001"}
@@ -0,0 +1,192 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from grynn_pylib.concurrency import SingleFlight, single_flight
+from grynn_pylib.data_providers.yahoo_finance import client
+from grynn_pylib.finance import timeseries
+
+
+class SlowFetch:
+    """Counts calls and holds each one open until released, so callers overlap."""
+
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def __call__(self, key):
+        with self._lock:
+            self.calls += 1
+        self.release.wait(5)
+        if self.fail:
+            raise RuntimeError(f"fetch {key} failed")
+        return {"key": key}
+
+
+def _concurrently(func, args, flight: SingleFlight, fetch: SlowFetch, waiting: int) -> list:
+    """Run func(arg) in one thread per arg; let 'fetch' finish once 'waiting' callers wait on 'flight'."""
+    args = list(args)
+    with ThreadPoolExecutor(len(args)) as pool:
+        futures = [pool.submit(func, arg) for arg in args]
+        deadline = time.monotonic() + 5
+        while sum(c.waiters for c in flight._calls.values()) < waiting and time.monotonic() < deadline:
+            time.sleep(0.001)
+        fetch.release.set()
+        return [f.exception() or f.result() for f in futures]
+
+
+def test_single_flight_coalesces():
+    flight = SingleFlight()
+    fetch = SlowFetch()
+
+    def request(key):
+        return flight.do(key, fetch, key)
+
+    results = _concurrently(request, ["EURUSD=X"] * 10, flight, fetch, waiting=9)
+
+    assert fetch.calls == 1
+    assert all(r is results[0] for r in results)
+    assert flight.in_flight() == 0
+    # Nothing is remembered: the next request fetches again
+    flight.do("EURUSD=X", fetch, "EURUSD=X")
+    assert fetch.calls == 2
+
+
+def test_single_flight_shares_errors():
+    flight = SingleFlight()
+    fetch = SlowFetch(fail=True)
+
+    def request(key):
+        return flight.do(key, fetch, key)
+
+    results = _concurrently(request, ["QQQ"] * 5, flight, fetch, waiting=4)
+
+    assert fetch.calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert flight.in_flight() == 0
+    # Each waiter raises its own copy, chained to the leader's error
+    leader = next(r for r in results if r.__cause__ is None)
+    waiters = [r for r in results if r is not leader]
+    assert len({id(r) for r in waiters}) == 4
+    assert all(r.__cause__ is leader and str(r) == str(leader) for r in waiters)
+
+
+def test_single_flight_decorator_cache():
+    fetch = SlowFetch()
+    cached = single_flight(cache=True)(fetch)
+
+    results = _concurrently(cached, ["QQQ"] * 8 + ["SPY"] * 8, cached.flight, fetch, waiting=14)
+    assert fetch.calls == 2
+    assert results[0] is results[7] and results[8] is results[15]
+    assert cached.cache_info() == {"size": 2, "in_flight": 0}
+
+    assert cached("QQQ") is results[0]
+    assert fetch.calls == 2
+    cached.cache_clear()
+    cached("QQQ")
+    assert fetch.calls == 3
+
+
+def test_single_flight_decorator_does_not_cache_errors():
+    calls = []
+
+    @single_flight(cache=True)
+    def flaky(x):
+        calls.append(x)
+        if len(calls) == 1:
+            raise ValueError("transient")
+        return x * 2
+
+    with pytest.raises(ValueError):
+        flaky(2)
+    assert flaky(2) == 4
+    assert flaky(2) == 4
+    assert calls == [2, 2]
+
+
+def test_single_flight_unhashable_arguments_run_directly():
+    @single_flight(cache=True)
+    def total(values):
+        return sum(values)
+
+    assert total([1, 2, 3]) == 6
+    assert total.cache_info()["size"] == 0
+
+
+def test_download_ccy_pair_single_download(monkeypatch):
+    import yfinance as yf
+
+    fetch = SlowFetch()
+    frame = pd.DataFrame({"Close": [83.0, 83.5]}, index=pd.date_range("2024-01-01", periods=2))
+
+    def download(ticker, start=None, end=None):
+        fetch(ticker)
+        return frame
+
+    def request(_):
+        return timeseries.download_ccy_pair("USD", "INR", "2024-01-01", "2024-01-03")
+
+    monkeypatch.setattr(yf, "download", download)
+    timeseries.download_ccy_pair.cache_clear()
+    try:
+        results = _concurrently(request, range(10), timeseries._download_ccy_pair.flight, fetch, waiting=9)
+        assert fetch.calls == 1
+        assert all(r is frame for r in results)
+    finally:
+        timeseries.download_ccy_pair.cache_clear()
+
+
+class FakeTicker:
+    """yf.Ticker stand-in whose option_chain blocks on 'fetch' and returns raw yfinance-shaped frames."""
+
+    fetch: SlowFetch
+
+    def __init__(self, symbol):
+        self.symbol = symbol
+
+    @property
+    def info(self):
+        return {"symbol": self.symbol, "regularMarketPrice": 505.0, "marketState": "REGULAR", "currency": "USD"}
+
+    def option_chain(self, date_str):
+        self.fetch((self.symbol, date_str))
+        frame = pd.DataFrame(
+            {
+                "contractSymbol": [f"{self.symbol}250321C00500000", f"{self.symbol}250321C00510000"],
+                "strike": [500.0, 510.0],
+                "lastPrice": [20.0, 15.0],
+                "impliedVolatility": [0.2, 0.21],
+                "inTheMoney": [True, False],
+            }
+        )
+        return frame, frame.copy(), self.info
+
+
+def test_option_chain_callers_get_their_own_frames(monkeypatch):
+    fetch = SlowFetch()
+    monkeypatch.setattr(FakeTicker, "fetch", fetch, raising=False)
+    monkeypatch.setattr(client.yf, "Ticker", FakeTicker)
+    barrier = threading.Barrier(4)
+
+    def request(i):
+        calls, puts, info = client.get_option_chain("QQQ", "2025-03-21")
+        # Every caller modifies its result in place at the same time
+        barrier.wait()
+        calls["strike"] *= 2
+        calls["owner"] = i
+        info["owner"] = i
+        return calls, puts, info
+
+    results = _concurrently(request, range(4), client._fetch_option_chain.flight, fetch, waiting=3)
+
+    assert fetch.calls == 1
+    for i, (calls, puts, info) in enumerate(results):
+        assert list(calls["strike"]) == [1000.0, 1020.0]
+        assert (calls["owner"] == i).all() and info["owner"] == i
+        assert list(puts["strike"]) == [500.0, 510.0]
+    assert len({id(calls) for calls, _, _ in results}) == 4
@@ -0,0 +1,132 @@
+import asyncio
+from datetime import datetime
+
+from grynn_pylib.data_providers.yahoo_finance.poller import QuotePoller
+
+
+class FakeMarket:
+    """Quote responses per symbol with a settable marketState; records the batches requested."""
+
+    def __init__(self, states):
+        self.states = dict(states)
+        self.prices = {s: 100.0 for s in states}
+        self.batches = []
+
+    def __call__(self, symbols):
+        self.batches.append(list(symbols))
+        return {
+            s: {
+                "symbol": s,
+                "marketState": self.states[s],
+                "regularMarketPrice": self.prices[s],
+                "currency": "USD",
+                "regularMarketTime": 1_740_000_000,
+            }
+            for s in symbols
+            if s in self.states
+        }
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_intervals_follow_market_state():
+    market = FakeMarket({"AAPL": "REGULAR", "RELIANCE.NS": "CLOSED", "QQQ": "PRE"})
+    clock = Clock()
+    poller = QuotePoller(list(market.states), fetch=market, clock=clock, batch_size=2)
+    published = poller.poll_once()
+    assert [q.symbol for q in published] == ["AAPL", "RELIANCE.NS", "QQQ"]
+    assert market.batches == [["AAPL", "RELIANCE.NS"], ["QQQ"]]
+    assert poller.quotes["AAPL"].kind == "regularMarketPrice" and poller.quotes["QQQ"].state == "PRE"
+
+    # Over 30 minutes: REGULAR every 15s, PRE every 60s, CLOSED once
+    counts = {s: 0 for s in market.states}
+    for step in range(1, 1800):
+        clock.now = step
+        market.batches.clear()
+        poller.poll_once()
+        for batch in market.batches:
+            for s in batch:
+                counts[s] += 1
+    assert counts == {"AAPL": 119, "QQQ": 29, "RELIANCE.NS": 0}
+
+
+def test_only_changes_are_published_and_parking():
+    market = FakeMarket({"AAPL": "REGULAR"})
+    clock = Clock()
+    poller = QuotePoller(["AAPL"], fetch=market, clock=clock, intervals={"CLOSED": None})
+    seen = []
+    unsubscribe = poller.subscribe(seen.append)
+    poller.poll_once()
+    clock.now = 15
+    poller.poll_once()  # same price and state: not published
+    market.prices["AAPL"] = 101.0
+    clock.now = 30
+    poller.poll_once()
+    assert [q.price for q in seen] == [100.0, 101.0]
+
+    market.states["AAPL"] = "CLOSED"
+    clock.now = 45
+    poller.poll_once()
+    assert seen[-1].state == "CLOSED" and poller.next_due() is None
+    clock.now = 10_000
+    assert poller.poll_once() == []
+    poller.refresh()
+    unsubscribe()
+    assert len(poller.poll_once()) == 0 and len(seen) == 3 and poller.requests == 5
+
+
+def test_missing_symbols_back_off():
+    market = FakeMarket({"AAPL": "REGULAR"})
+    clock = Clock()
+    poller = QuotePoller(["AAPL", "NOPE"], fetch=market, clock=clock, error_backoff=30)
+    poller.poll_once()
+    assert set(poller.quotes) == {"AAPL"}
+    clock.now = 15
+    market.batches.clear()
+    poller.poll_once()
+    assert market.batches == [["AAPL"]]
+    clock.now = 30
+    market.batches.clear()
+    poller.poll_once()
+    assert market.batches == [["AAPL", "NOPE"]]
+
+
+def test_timestamp_matches_price_kind_and_bad_data_backs_off():
+    market = FakeMarket({"AAPL": "PRE", "QQQ": "REGULAR", "BAD": "REGULAR"})
+    responses = market(list(market.states))
+    responses["AAPL"].update(preMarketPrice=99.0, preMarketTime=1_740_100_000)
+    responses["QQQ"].update(postMarketTime=1_740_200_000)
+    responses["BAD"]["regularMarketTime"] = "not a time"
+    clock = Clock()
+    poller = QuotePoller(list(market.states), fetch=lambda symbols: responses, clock=clock, error_backoff=30)
+
+    poller.poll_once()
+    assert poller.quotes["AAPL"].kind == "preMarketPrice"
+    assert poller.quotes["AAPL"].timestamp == datetime.fromtimestamp(1_740_100_000)
+    assert poller.quotes["QQQ"].timestamp == datetime.fromtimestamp(1_740_000_000)
+    assert "BAD" not in poller.quotes and poller.next_due() == 15
+
+
+def test_stream_runs_in_background():
+    market = FakeMarket({"AAPL": "REGULAR", "QQQ": "REGULAR"})
+    poller = QuotePoller(["AAPL", "QQQ"], fetch=market)
+
+    async def first_two():
+        quotes = []
+        async for quote in poller.stream():
+            quotes.append(quote.symbol)
+            if len(quotes) == 2:
+                break
+        return quotes
+
+    try:
+        assert sorted(asyncio.run(asyncio.wait_for(first_two(), timeout=5))) == ["AAPL", "QQQ"]
+    finally:
+        poller.stop()
+    assert poller._thread is None
@@ -0,0 +1,127 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from grynn_pylib.data_providers import synthetic
+from grynn_pylib.data_providers.price_store import PriceStore
+from grynn_pylib.finance import timeseries
+
+
+class FakeProvider:
+    """yf.download-shaped bars from a synthetic panel, cut at 'today'; records each call."""
+
+    def __init__(self, symbols):
+        close = synthetic.gbm_panel(len(symbols), years=2, seed=3).set_axis(symbols, axis=1)
+        close.index = close.index.tz_localize("America/New_York")
+        self.bars = pd.concat(
+            {
+                "Close": close,
+                "Open": close * 0.99,
+                "High": close * 1.01,
+                "Low": close * 0.98,
+                "Volume": close * 0 + 1e6,
+            },
+            axis=1,
+            names=["Price", "Ticker"],
+        )
+        self.today = self.bars.index[300]
+        self.calls = []
+
+    def __call__(self, symbols, start, end):
+        self.calls.append((list(symbols), start))
+        bars = self.bars.loc[: self.today]
+        if start is not None:
+            bars = bars.loc[bars.index.tz_localize(None) >= start]
+        return bars.loc[:, bars.columns.get_level_values(1).isin(symbols)]
+
+
+@pytest.fixture
+def provider():
+    return FakeProvider(["QQQ", "^GSPC", "INRUSD=X"])
+
+
+def test_incremental_update(tmp_path, provider):
+    store = PriceStore(tmp_path, fetch=provider)
+    assert store.update(["QQQ", "^GSPC"], start="1990-01-01") == {"QQQ": 301, "^GSPC": 301}
+    assert store.last_timestamp("QQQ") == provider.today.tz_localize(None)
+
+    # Next day: only the last stored bar and the new one are fetched, in one call
+    provider.today = provider.bars.index[301]
+    provider.calls.clear()
+    assert store.update(["QQQ", "^GSPC"]) == {"QQQ": 2, "^GSPC": 2}
+    assert provider.calls == [(["QQQ", "^GSPC"], provider.bars.index[300].tz_localize(None))]
+
+    close = store.read(["QQQ", "^GSPC"], columns="Close")
+    expected = provider.bars["Close"].iloc[:302, :2]
+    expected.index = expected.index.tz_localize(None).rename("Date")
+    pd.testing.assert_frame_equal(close, expected, check_names=False, check_freq=False)
+    assert close.index.tz is None and close.index.is_unique
+    assert store.symbols() == ["QQQ", "^GSPC"]
+
+
+def test_read_columns_and_dates(tmp_path, provider):
+    store = PriceStore(tmp_path, fetch=provider)
+    store.update(["QQQ", "INRUSD=X"])
+    start, end = provider.bars.index[10].tz_localize(None), provider.bars.index[20].tz_localize(None)
+    wide = store.read(["QQQ", "INRUSD=X"], columns=["Open", "Close"], start=start, end=end)
+    assert list(wide.columns) == [("Open", "QQQ"), ("Open", "INRUSD=X"), ("Close", "QQQ"), ("Close", "INRUSD=X")]
+    assert wide.index[0] == start and wide.index[-1] == end
+    np.testing.assert_allclose(wide["Open"], wide["Close"] * 0.99)
+
+
+def test_compact_keeps_bars(tmp_path, provider):
+    store = PriceStore(tmp_path, fetch=provider)
+    store.update("QQQ")
+    for i in range(301, 305):
+        provider.today = provider.bars.index[i]
+        store.update("QQQ")
+    before = store.read("QQQ", columns=list(provider.bars.columns.levels[0]))
+    assert len(store._parts("QQQ")) == 5
+    store.compact()
+    assert len(store._parts("QQQ")) == 1
+    pd.testing.assert_frame_equal(store.read("QQQ", columns=list(provider.bars.columns.levels[0])), before)
+
+
+def test_to_usd_through_store(tmp_path, provider):
+    store = PriceStore(tmp_path, fetch=provider)
+    prices = pd.DataFrame({"RELIANCE.NS": 100.0}, index=provider.bars.index[50:60].tz_localize(None))
+    usd = timeseries.to_usd(prices, from_ccy="INR", store=store)
+    rate = provider.bars[("Close", "INRUSD=X")].iloc[50:60].to_numpy()
+    np.testing.assert_allclose(usd["RELIANCE.NS"].dropna().to_numpy(), 100 * rate)
+    assert store.symbols() == ["INRUSD=X"]
+
+
+def test_download_ccy_pair_updates_store_every_call(tmp_path, provider):
+    store = PriceStore(tmp_path, fetch=provider)
+    first = timeseries.download_ccy_pair("INR", "USD", store=store)
+    provider.today = provider.bars.index[320]
+    second = timeseries.download_ccy_pair("INR", "USD", store=store)
+    assert len(provider.calls) == 2
+    assert len(second) == len(first) + 20
+
+
+def test_concurrent_updates_share_one_fetch(tmp_path, provider):
+    store = PriceStore(tmp_path, fetch=provider)
+    barrier = threading.Barrier(8)
+    fetch = provider.__call__
+
+    def slow_fetch(symbols, start, end):
+        time.sleep(0.2)  # long enough for every thread to join the in-flight update
+        return fetch(symbols, start, end)
+
+    store.fetch = slow_fetch
+
+    def update():
+        barrier.wait()
+        return store.update(["QQQ", "^GSPC"], start="1990-01-01")
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: update(), range(8)))
+
+    assert len(provider.calls) == 1
+    assert all(r == {"QQQ": 301, "^GSPC": 301} for r in results)
+    assert len(store._parts("QQQ")) == 1
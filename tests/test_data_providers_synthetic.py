@@ -0,0 +1,63 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytz
+
+from grynn_pylib.data_providers import synthetic
+
+TZ = pytz.timezone("US/Central")
+ASOF = TZ.localize(datetime(2025, 3, 3, 10, 0))
+
+
+def test_gbm_panel_shape_and_reproducibility():
+    df = synthetic.gbm_panel(12, years=2, seed=7, s0=50.0)
+    assert df.shape == (504, 12)
+    assert isinstance(df.index, pd.DatetimeIndex)
+    assert (df.iloc[0] == 50.0).all()
+    assert (df > 0).all().all()
+    pd.testing.assert_frame_equal(df, synthetic.gbm_panel(12, years=2, seed=7, s0=50.0))
+
+
+def test_gbm_panel_correlation():
+    df = synthetic.gbm_panel(40, years=10, seed=1, correlation=0.5)
+    corr = np.log(df).diff().corr().to_numpy()
+    off_diagonal = corr[~np.eye(40, dtype=bool)]
+    assert abs(off_diagonal.mean() - 0.5) < 0.05
+
+
+def test_iter_gbm_panel_chunks():
+    blocks = list(synthetic.iter_gbm_panel(25, years=1, chunk_series=10, seed=3))
+    assert [b.shape[1] for b in blocks] == [10, 10, 5]
+    assert list(pd.concat(blocks, axis=1).columns) == [f"S{i:05d}" for i in range(25)]
+
+
+def test_option_chain_schema():
+    calls, puts, info = synthetic.option_chain("SYN", spot=100.0, expiries=3, strikes=21, asof=ASOF, seed=2)
+    assert len(calls) == len(puts) == 63
+    assert calls.index.name == "contract_symbol"
+    assert calls.index.is_unique
+    for col in ["strike", "bid", "ask", "iv", "in_the_money", "dte", "expiry", "spot", "synced_at"]:
+        assert col in calls.columns
+    assert calls["dte"].min() > 0
+    assert (calls["ask"] >= calls["bid"]).all()
+    # Calls are in the money below spot, puts above
+    assert (calls["in_the_money"] == (calls["strike"] < 100.0)).all()
+    assert (puts["in_the_money"] == (puts["strike"] > 100.0)).all()
+    assert info["regularMarketPrice"] == 100.0
+
+    again, _, _ = synthetic.option_chain("SYN", spot=100.0, expiries=3, strikes=21, asof=ASOF, seed=2)
+    pd.testing.assert_frame_equal(calls, again)
+
+
+def test_option_chain_dense_strikes_stay_unique():
+    # 0.005 apart before rounding to cents: neighbours would share an OCC contract symbol
+    calls, puts, _ = synthetic.option_chain("LOW", spot=5.0, expiries=1, strikes=1001, asof=ASOF, seed=2)
+    assert calls.index.is_unique and puts.index.is_unique
+    assert calls["strike"].is_unique and len(calls) == 501
+
+
+def test_iter_option_chains():
+    chains = list(synthetic.iter_option_chains(["AAA", "BBB"], expiries=1, strikes=5, asof=ASOF, seed=0))
+    assert [c[0] for c in chains] == ["AAA", "BBB"]
+    assert chains[0][1]["underlying_symbol"].eq("AAA").all()
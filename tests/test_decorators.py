@@ -0,0 +1,116 @@
+import json
+import time
+import unittest
+
+from grynn_pylib.decorators import ProfileRegistry, profiled, timed_call
+
+
+class TestDecorators(unittest.TestCase):
+    def test_timed_call_default_logger(self):
+        @timed_call(None)
+        def add(a, b):
+            return a + b
+
+        self.assertEqual(add(1, 2), 3)
+
+    def test_profiled_records_calls_and_percentiles(self):
+        reg = ProfileRegistry(enabled=True)
+
+        @profiled(name="sleepy", registry=reg)
+        def sleepy(seconds):
+            time.sleep(seconds)
+            return seconds
+
+        for _ in range(10):
+            self.assertEqual(sleepy(0.001), 0.001)
+
+        stats = reg.snapshot()["sleepy"]
+        self.assertEqual(stats["calls"], 10)
+        self.assertEqual(stats["sampled"], 10)
+        self.assertGreaterEqual(stats["min_s"], 0.001)
+        self.assertTrue(stats["min_s"] <= stats["p50_s"] <= stats["p95_s"] <= stats["p99_s"] <= stats["max_s"])
+
+        reg.reset()
+        self.assertEqual(reg.snapshot(), {})
+
+    def test_sampling_and_disabled(self):
+        reg = ProfileRegistry(enabled=False)
+
+        @profiled(registry=reg, sample_rate=0.25)
+        def noop():
+            pass
+
+        noop()
+        self.assertEqual(reg.snapshot(), {})
+
+        reg.enable()
+        for _ in range(8):
+            noop()
+        (stats,) = reg.snapshot().values()
+        self.assertEqual(stats["calls"], 8)
+        self.assertEqual(stats["sampled"], 2)
+
+    def test_context_manager_and_json(self):
+        reg = ProfileRegistry(enabled=True)
+        block = profiled("block", registry=reg)
+        with block:
+            with block:
+                pass
+
+        exported = json.loads(reg.to_json())
+        self.assertEqual(exported["block"]["calls"], 2)
+
+        with self.assertRaises(ValueError):
+            with profiled(registry=reg):
+                pass
+
+    def test_context_manager_sampling(self):
+        reg = ProfileRegistry(enabled=True)
+        block = profiled("block", registry=reg, sample_rate=0.25)
+        for _ in range(8):
+            with block:
+                pass
+
+        stats = reg.snapshot()["block"]
+        self.assertEqual(stats["calls"], 8)
+        self.assertEqual(stats["sampled"], 2)
+
+    def test_memory_profiling(self):
+        reg = ProfileRegistry(enabled=True, memory=True, memory_sample_rate=0.5)
+
+        @profiled(name="alloc", registry=reg)
+        def alloc(n):
+            keep = bytearray(n)
+            scratch = bytearray(4 * n)
+            del scratch
+            return keep
+
+        kept = [alloc(1_000_000) for _ in range(4)]
+
+        stats = reg.snapshot()["alloc"]
+        self.assertEqual(stats["calls"], 4)
+        self.assertEqual(stats["mem_sampled"], 2)
+        # Traced calls are left out of the timing histogram
+        self.assertEqual(stats["sampled"], 2)
+        self.assertGreaterEqual(stats["mem_peak_max_bytes"], 5_000_000)
+        self.assertGreaterEqual(stats["mem_net_mean_bytes"], 1_000_000)
+        self.assertLess(stats["mem_net_mean_bytes"], 2_000_000)
+        site, size = stats["mem_top_sites"][0]
+        self.assertIn("test_decorators.py", site)
+        self.assertGreaterEqual(size, 2_000_000)
+        self.assertIn("mem_top_sites", json.loads(reg.to_json())["alloc"])
+        del kept
+
+    def test_memory_profiling_context_manager(self):
+        reg = ProfileRegistry(enabled=True, memory=True, memory_sample_rate=1.0)
+        with profiled("block", registry=reg):
+            data = bytearray(2_000_000)
+
+        stats = reg.snapshot()["block"]
+        self.assertEqual(stats["calls"], 1)
+        self.assertGreaterEqual(stats["mem_peak_max_bytes"], 2_000_000)
+        del data
+
+
+if __name__ == "__main__":
+    unittest.main()
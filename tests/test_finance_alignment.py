@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from grynn_pylib.finance import alignment, timeseries
+
+
+@pytest.fixture
+def markets():
+    # NSE closes in Asia/Kolkata, FX quoted at UTC midnight, different holidays
+    nse_dates = pd.DatetimeIndex(["2025-01-02 15:30", "2025-01-03 15:30", "2025-01-06 15:30", "2025-01-08 15:30"])
+    nse = pd.DataFrame({"NIFTYBEES.NS": [270.0, 271.0, 268.0, 275.0]}, index=nse_dates.tz_localize("Asia/Kolkata"))
+    fx_dates = pd.DatetimeIndex(["2025-01-01", "2025-01-02", "2025-01-06", "2025-01-07"], tz="UTC")
+    fx = pd.Series([85.0, 85.5, 85.8, 86.0], index=fx_dates, name="USDINR=X")
+    return nse, fx
+
+
+def test_align_union_asof(markets):
+    nse, fx = markets
+    nse_u, fx_u = alignment.align(nse, fx)
+    expected_index = pd.DatetimeIndex(
+        ["2025-01-01", "2025-01-02", "2025-01-03", "2025-01-06", "2025-01-07", "2025-01-08"]
+    )
+    assert nse_u.index.equals(expected_index)
+    np.testing.assert_array_equal(nse_u["NIFTYBEES.NS"], [np.nan, 270.0, 271.0, 268.0, 268.0, 275.0])
+    np.testing.assert_array_equal(fx_u, [85.0, 85.5, 85.5, 85.8, 86.0, 86.0])
+    assert fx_u.name == "USDINR=X"
+
+    # Same as realigning in pandas on local dates
+    naive = fx.copy()
+    naive.index = naive.index.tz_localize(None)
+    pd.testing.assert_series_equal(
+        fx_u, naive.reindex(expected_index, method="ffill"), check_index_type=False, check_freq=False
+    )
+
+
+def test_aligner_is_cached_by_content(markets):
+    nse, fx = markets
+    first = alignment.aligner([nse.index, fx.index])
+    assert alignment.aligner([nse.index.copy(), fx.index.copy()]) is first
+    assert alignment.aligner([nse.index, fx.index[:-1]]) is not first
+    with pytest.raises(ValueError):
+        first.align(nse, fx.iloc[:-1])
+
+
+def test_aligner_cache_is_thread_safe(markets):
+    nse, fx = markets
+    keys = [fx.index[: len(fx) - i % 3] for i in range(200)]
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda index: alignment.aligner([nse.index, index]), keys))
+
+    # Threads asking for the same indexes share one Aligner, and the LRU stays bounded
+    assert len({id(r) for r in results}) == 3
+    assert len(alignment._cache) <= alignment._CACHE_SIZE
+
+
+def test_asof_with_tolerance(markets):
+    nse, fx = markets
+    target = pd.date_range("2024-12-31", "2025-01-12", freq="D")
+    rate = alignment.asof(fx, target, tolerance=pd.Timedelta(days=2))
+    assert np.isnan(rate.loc["2024-12-31"])
+    assert rate.loc["2025-01-09"] == 86.0
+    assert np.isnan(rate.loc["2025-01-10"])
+
+
+def test_to_usd_across_timezones(markets):
+    nse, fx = markets
+    usd = timeseries.to_usd(nse, 1 / fx, dtype=np.float64)
+    np.testing.assert_allclose(usd["NIFTYBEES.NS"], [270 / 85.5, 271 / 85.5, 268 / 85.8, 275 / 86.0])
+    assert usd.index.equals(nse.index)
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from grynn_pylib.data_providers import synthetic
+from grynn_pylib.finance import backtest, options, timeseries
+
+
+@pytest.fixture(scope="module")
+def prices():
+    return synthetic.gbm_panel(3, years=4, seed=7)
+
+
+def test_every_entry_is_priced_with_bs(prices):
+    result = backtest.run(prices, strategy="short_put", dte=30, moneyness=0.95, rate=0.03)
+    trades = result.trades.loc["S00001"]
+    # First entries wait for the realized-vol window; the last ones for a full holding period
+    assert trades.index[0] == prices.index[21]
+    assert (trades["exit_date"] <= trades.index + pd.Timedelta(days=30)).all()
+    row = trades.iloc[100]
+    expected = options.bs_price(row["spot"], row["spot"] * 0.95, 30, 0.03, row["vol"], "put")
+    assert row["strike"] == pytest.approx(row["spot"] * 0.95)
+    assert row["premium"] == pytest.approx(expected)
+    # Held to expiry: the exit value is the intrinsic value
+    assert row["exit_value"] == pytest.approx(max(row["strike"] - row["exit_spot"], 0))
+    assert not trades["early_exit"].any()
+
+
+def test_delta_strike_selection(prices):
+    result = backtest.run(prices["S00000"], strategy="covered_call", dte=45, delta=0.25, rate=0.02)
+    trades = result.trades.loc["S00000"]
+    d1, _ = options.bs_d1_d2(trades["spot"], trades["strike"], 45 / 365, 0.02, trades["vol"])
+    np.testing.assert_allclose(options._norm_cdf(d1), 0.25)
+    assert (trades["strike"] > trades["spot"]).all()
+
+
+def test_roll_rules_exit_early(prices):
+    base = backtest.run(prices, dte=30, delta=0.3)
+    tp = backtest.run(prices, dte=30, delta=0.3, take_profit=0.5)
+    trades = tp.trades
+    early = trades[trades["early_exit"]]
+    assert len(early) > 0
+    assert (early["exit_value"] <= 0.5 * early["premium"] + 1e-12).all()
+    assert (trades["exit_date"] <= base.trades["exit_date"]).all()
+
+    rolled = backtest.run(prices, dte=30, delta=0.3, roll_dte=7).trades
+    days_left = (rolled.index.get_level_values("entry_date") + pd.Timedelta(days=30) - rolled["exit_date"]).dt.days
+    assert (days_left[rolled["early_exit"]] <= 7).all()
+
+
+def test_equity_curve_chains_trades(prices):
+    result = backtest.run(prices, dte=30, moneyness=1.0, take_profit=0.5)
+    equity = result.equity
+    assert list(equity.columns) == list(prices.columns)
+    curve = equity["S00002"].dropna()
+    assert curve.iloc[0] == pytest.approx(1.0)
+    assert curve.index.is_monotonic_increasing and curve.notna().all()
+
+    # Between consecutive exits the curve grows by exactly the trade's return
+    trades = result.trades.loc["S00002"]
+    start, level = curve.index[0], 1.0
+    for _ in range(5):
+        trade = trades.loc[start]
+        level *= 1 + trade["return"]
+        assert curve.loc[trade["exit_date"]] == pytest.approx(level)
+        start = trade["exit_date"]
+
+    assert timeseries.drawdowns(equity).max().max() <= 0
+    assert timeseries.rolling_cagr(equity, years=1).notna().any().all()
+
+
+def test_invalid_arguments(prices):
+    with pytest.raises(ValueError):
+        backtest.run(prices, strategy="iron_condor", delta=0.3)
+    with pytest.raises(ValueError):
+        backtest.run(prices, delta=0.3, moneyness=0.95)
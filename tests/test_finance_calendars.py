@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+from grynn_pylib.finance import calendars
+
+
+def test_get_sessions_skips_holidays():
+    sessions = calendars.get_sessions("XNYS", "2024-07-01", "2024-07-08")
+    assert pd.Timestamp("2024-07-04") not in sessions
+    assert list(sessions.day) == [1, 2, 3, 5, 8]
+
+
+def test_session_positions_snaps_back():
+    sessions, pos = calendars.session_positions(pd.DatetimeIndex(["2024-07-04", "2024-07-06", "2024-07-08"]))
+    assert list(sessions[pos].day) == [3, 5, 8]
+
+
+def test_window_lags():
+    sessions = calendars.get_sessions("XNYS", "2020-01-01", "2024-12-31")
+    lags = calendars.window_lags("XNYS", 1, sessions)
+    anchors = np.arange(len(sessions)) - lags
+    # anchor is the last session on or before (session - 1 year)
+    k = sessions.get_loc(pd.Timestamp("2024-07-05"))
+    assert sessions[anchors[k]] == pd.Timestamp("2023-07-05")
+
+
+def test_trading_dte():
+    assert calendars.trading_dte("2024-07-08", asof="2024-07-01") == 5
+    assert calendars.trading_dte("2024-07-01", asof="2024-07-01") == 1
+    assert calendars.trading_dte("2024-06-28", asof="2024-07-01") == 0
+    dte = calendars.trading_dte(["2024-07-05", "2024-07-08"], asof="2024-07-01")
+    assert list(dte) == [4, 5]
+
+
+def test_sessions_start_at_calendar_bound():
+    # XBOM holidays are only recorded from 1997; an earlier start is clipped, not an error
+    sessions = calendars.get_sessions("XBOM", start="1990-01-01", end="1997-03-31")
+    assert sessions[0] >= pd.Timestamp("1997-01-01")
+    assert len(sessions) > 50
@@ -0,0 +1,142 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from grynn_pylib.data_providers import synthetic
+from grynn_pylib.finance import chains, options
+
+ASOF = pytz.timezone("US/Central").localize(datetime(2025, 3, 3, 10, 0))
+
+
+@pytest.fixture(scope="module")
+def chain():
+    return synthetic.option_chain("SYN", spot=100.0, expiries=3, strikes=11, asof=ASOF, seed=5)
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_enrich_chain_matches_scalar_greeks(chain, option_type):
+    calls, puts, _ = chain
+    df = calls if option_type == "call" else puts
+    rate = 0.04
+
+    enriched = chains.enrich_chain(df, option_type, rate=rate)
+
+    row = enriched.loc[enriched["strike"] == 100.0].iloc[-1]
+    t = row["dte"] / 365
+    args = (row["spot"], row["strike"], t, rate, row["iv"])
+    assert row["delta"] == pytest.approx(options.bs_delta(*args, option_type))
+    assert row["gamma"] == pytest.approx(options.bs_gamma(*args))
+    assert row["theta"] == pytest.approx(options.bs_theta(*args, option_type))
+    assert row["moneyness"] == pytest.approx(row["strike"] / 100.0)
+    assert row["mid"] == pytest.approx((row["bid"] + row["ask"]) / 2)
+    assert row["intrinsic"] == pytest.approx(options.intrinsic_value(100.0, row["strike"], option_type))
+    collateral = 100.0 if option_type == "call" else row["strike"]
+    assert row["ar"] == pytest.approx(row["time_value"] / collateral * 365 / row["dte"])
+    assert (enriched["time_value"] >= 0).all()
+    # Input is left untouched
+    assert "delta" not in df.columns
+
+
+def test_enrich_chain_infers_type_from_symbol(chain):
+    calls, puts, _ = chain
+    mixed = pd.concat([calls, puts])
+
+    enriched = chains.enrich_chain(mixed)
+
+    expected = pd.concat([chains.enrich_chain(calls, "call"), chains.enrich_chain(puts, "put")])
+    pd.testing.assert_series_equal(enriched["delta"], expected["delta"])
+
+
+def test_enrich_chain_invalid_iv(chain):
+    calls, _, _ = chain
+    df = calls.copy()
+    df.iloc[0, df.columns.get_loc("iv")] = 0.0
+
+    enriched = chains.enrich_chain(df, "call")
+
+    assert np.isnan(enriched["delta"].iloc[0])
+    assert not np.isnan(enriched["delta"].iloc[1])
+    with pytest.raises(ValueError):
+        chains.enrich_chain(df, "straddle")
+
+
+@pytest.fixture(scope="module")
+def index(chain):
+    calls, puts, _ = chain
+    return chains.ChainIndex([calls, puts])
+
+
+def test_chain_index_nearest_and_atm(index, chain):
+    calls, _, _ = chain
+    expiries = index.expiries
+    assert len(expiries) == 3
+
+    atm = index.atm()
+    assert len(atm) == 3
+    assert (atm["strike"] == 100.0).all()
+
+    near = index.nearest(87.0, expiry=expiries[1], option_type="put", n=2)
+    # Strikes are 50, 60, ..., 150
+    assert sorted(near["strike"]) == [80.0, 90.0]
+    assert near.index.str[-9].unique().tolist() == ["P"]
+
+
+def test_chain_index_ranges_match_scans(index, chain):
+    calls, puts, _ = chain
+    both = pd.concat([calls, puts])
+
+    got = index.strike_range(75, 110, option_type=None)
+    expected = both.loc[both["strike"].between(75, 110)]
+    assert sorted(got.index) == sorted(expected.index)
+
+    got = index.moneyness_range(0.9, 1.0, expiry=index.expiries[0], option_type="put")
+    assert sorted(got["strike"]) == [90.0, 100.0]
+
+
+def test_chain_index_wide_and_out_of_range_bounds(index, chain):
+    calls, puts, _ = chain
+    first = index.expiries[0]
+
+    got = index.strike_range(0, 1e6, option_type="call")
+    assert got.index.is_unique and sorted(got.index) == sorted(calls.index)
+
+    got = index.strike_range(120, 1000, expiry=first)
+    assert got["strike"].tolist() == [120.0, 130.0, 140.0, 150.0]
+    assert (got["expiry"].dt.normalize().dt.tz_localize(None) == first).all()
+    assert index.strike_range(-1e6, 55)["strike"].tolist() == [50.0] * 3
+    assert index.strike_range(2000, 3000).empty
+
+    got = index.moneyness_range(1.0, 5.0, option_type=None)
+    both = pd.concat([calls, puts])
+    assert got.index.is_unique and sorted(got.index) == sorted(both.index[both["strike"] >= 100])
+
+    # Targets far outside the strikes still give each expiry its closest strikes
+    assert sorted(index.nearest(1e6, n=2)["strike"]) == [140.0] * 3 + [150.0] * 3
+    assert index.nearest(-1e6, option_type="put")["strike"].tolist() == [50.0] * 3
+
+
+def test_chain_index_buckets(index):
+    bucket = index.bucket("0.4-0.6", option_type=None)
+    assert len(bucket) > 0
+    assert bucket["delta"].abs().between(0.4, 0.6).all()
+    assert set(index.bucket("0.975-1.025", kind="moneyness")["strike"]) == {100.0}
+    with pytest.raises(ValueError):
+        index.bucket("0.3-0.5")
+
+
+def test_rank_short_puts(chain):
+    _, puts, _ = chain
+
+    ranked = chains.rank_short_puts(puts, rate=0.04, min_pop=0.6, quantiles=(0.05, 0.5))
+
+    assert len(ranked) > 0
+    assert ranked["ev_annualized"].is_monotonic_decreasing
+    assert (ranked["pop"] >= 0.6).all()
+    assert {"premium", "breakeven", "ev", "ev_on_risk", "return_q05", "return_q50"} <= set(ranked.columns)
+    row = ranked.iloc[0]
+    expected = options.ev_short_put(row["spot"], row["strike"], row["premium"], row["dte"] / 365, 0.04, row["iv"])
+    assert row["ev"] == pytest.approx(expected)
+    assert len(chains.rank_short_puts(puts, top=3)) == 3
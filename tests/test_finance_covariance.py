@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from grynn_pylib.data_providers import synthetic
+from grynn_pylib.finance import covariance
+
+
+@pytest.fixture
+def returns():
+    prices = synthetic.gbm_panel(7, years=2, seed=5, correlation=0.4)
+    returns = prices.pct_change().iloc[1:]
+    returns.iloc[:40, 6] = np.nan  # listed later
+    return returns
+
+
+def test_fit_matches_pandas(returns):
+    ewma = covariance.EWMACovariance(halflife=30, block_size=3).fit(returns)
+    alpha = ewma.alpha
+    expected = returns.fillna(0).ewm(alpha=alpha, adjust=False).cov(bias=True).loc[returns.index[-1]]
+    np.testing.assert_allclose(ewma.covariance(), expected, rtol=1e-10, atol=1e-15)
+    corr = ewma.correlation()
+    np.testing.assert_allclose(corr, expected / np.sqrt(np.outer(np.diag(expected), np.diag(expected))), rtol=1e-10)
+    assert (np.diag(corr) == 1).all()
+    assert ewma.last == returns.index[-1]
+
+
+def test_update_matches_fit(returns):
+    full = covariance.EWMACovariance(span=40).fit(returns)
+    incremental = covariance.EWMACovariance(span=40, block_size=2).fit(returns.iloc[:300])
+    incremental.update_many(returns.iloc[300:])
+    np.testing.assert_allclose(incremental.covariance(), full.covariance(), rtol=1e-9)
+    np.testing.assert_allclose(incremental.mean, full.mean, rtol=1e-9)
+    assert incremental.count == len(returns) and incremental.last == returns.index[-1]
+
+    # From scratch, bar by bar
+    scratch = covariance.EWMACovariance(span=40).update_many(returns)
+    np.testing.assert_allclose(scratch.covariance(), full.covariance(), rtol=1e-9)
+
+
+def test_float32_storage(returns):
+    full = covariance.EWMACovariance(halflife=30).fit(returns)
+    small = covariance.EWMACovariance(halflife=30, dtype="float32").fit(returns.iloc[:-5])
+    small.update_many(returns.iloc[-5:])
+    assert small.cov.dtype == np.float32 and small.correlation().to_numpy().dtype == np.float32
+    np.testing.assert_allclose(small.correlation(), full.correlation(), atol=1e-5)
+    np.testing.assert_allclose(small.volatility(annualize=252), full.volatility(annualize=252), rtol=1e-5)
+
+
+def test_arguments():
+    with pytest.raises(ValueError):
+        covariance.EWMACovariance(halflife=10, span=20)
+    with pytest.raises(ValueError):
+        covariance.EWMACovariance(alpha=0)
+    with pytest.raises(ValueError):
+        covariance.EWMACovariance(alpha=0.1).correlation()
+    corr = covariance.ewma_correlation(pd.DataFrame({"a": [0.01, -0.02, 0.03], "flat": 0.0}), halflife=2)
+    assert corr.loc["a", "a"] == 1 and np.isnan(corr.loc["flat", "a"])
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from grynn_pylib.data_providers import synthetic
+from grynn_pylib.finance import data_quality
+
+
+@pytest.fixture
+def prices():
+    df = synthetic.gbm_panel(4, years=1, seed=11, sigma=0.1)
+    df.iloc[50, 0] *= 1.6  # bad tick: out and back
+    df.iloc[120:, 1] *= 0.5  # real 50% drop that stays
+    df.iloc[200:208, 2] = df.iloc[199, 2]  # stale for 8 sessions
+    df.iloc[30, 3] = np.nan
+    return df
+
+
+def test_scan_flags_each_kind(prices):
+    report = data_quality.scan(prices)
+    issues = report.issues.set_index("kind")
+    spike = issues.loc[["spike"]].iloc[0]
+    assert (spike["column"], spike["start"]) == ("S00000", prices.index[50])
+    assert spike["change"] == pytest.approx(0.6, abs=0.05)
+    jump = issues.loc[["jump"]].iloc[0]
+    assert (jump["column"], jump["start"]) == ("S00001", prices.index[120])
+    stale = issues.loc[["stale"]].iloc[0]
+    assert (stale["column"], stale["start"], stale["end"], stale["length"]) == (
+        "S00002",
+        prices.index[200],
+        prices.index[207],
+        8,
+    )
+    # The spike's return leg and the NaN are not issues; business days have no 5-day gaps
+    assert sorted(report.issues["kind"]) == ["jump", "spike", "stale"]
+    assert report.summary().loc["stale", "cells"] == 8
+    assert report.mask(["stale"]).to_numpy().sum() == 8
+
+
+def test_block_size_does_not_change_result(prices):
+    wide = pd.concat([prices] * 5, axis=1, keys=range(5))
+    whole = data_quality.scan(wide, block_size=10_000)
+    blocked = data_quality.scan(wide, block_size=3)
+    pd.testing.assert_frame_equal(whole.issues, blocked.issues)
+    np.testing.assert_array_equal(whole.flags, blocked.flags)
+    assert len(whole.issues) == 15
+
+
+def test_repair_methods(prices):
+    report = data_quality.scan(prices)
+    masked = data_quality.repair(prices, report)
+    assert np.isnan(masked.iloc[50, 0]) and np.isnan(masked.iloc[30, 3])
+    assert masked.iloc[120, 1] == prices.iloc[120, 1]  # jumps are not repaired by default
+
+    filled = data_quality.repair(prices, report, method="ffill")
+    assert filled.iloc[50, 0] == prices.iloc[49, 0]
+    assert np.isnan(filled.iloc[30, 3])  # NaNs that were already there stay
+
+    interpolated, _ = data_quality.clean(prices, method="interpolate", kinds=("spike", "stale"))
+    assert prices.iloc[49, 0] < interpolated.iloc[50, 0] < prices.iloc[51, 0] or (
+        prices.iloc[49, 0] > interpolated.iloc[50, 0] > prices.iloc[51, 0]
+    )
+    assert interpolated.iloc[200:208, 2].diff().iloc[1:].abs().gt(0).all()
+
+    with pytest.raises(ValueError):
+        data_quality.repair(prices, report, method="median")
+
+
+def test_gaps():
+    index = pd.bdate_range("2025-01-02", "2025-03-31").delete(range(20, 30))
+    prices = pd.Series(100.0 + np.arange(len(index)), index=index)
+    gaps = data_quality.scan(prices).issues.query("kind == 'gap'")
+    assert len(gaps) == 1 and gaps.iloc[0]["column"] is None
+    sessions = data_quality.scan(prices, exchange="XNYS").issues.query("kind == 'gap'")
+    assert sessions.iloc[0]["start"] == pd.bdate_range("2025-01-02", periods=21)[-1]
+    assert sessions.iloc[0]["length"] == 10
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from grynn_pylib.finance import options
 
@@ -142,3 +143,37 @@ def test_short_payoff_put_percent():
     expected_payoff = 0.0526
     payoff = options.payoff_short_put_percent(S, K, premium)
     assert payoff == pytest.approx(expected_payoff, abs=1e-4)
+
+
+def test_short_put_pop_and_ev():
+    spot, strike, premium, time, rate, vol = 100.0, 95.0, 2.0, 30 / 365, 0.04, 0.25
+
+    pop = options.pop_short_put(spot, strike, premium, time, rate, vol)
+    ev = options.ev_short_put(spot, strike, premium, time, rate, vol)
+
+    z = np.random.default_rng(0).standard_normal(1_000_000)
+    terminal = spot * np.exp((rate - 0.5 * vol**2) * time + vol * np.sqrt(time) * z)
+    assert pop == pytest.approx((terminal > strike - premium).mean(), abs=2e-3)
+    assert ev == pytest.approx(
+        options.expected_payoff(lambda s: premium - np.maximum(strike - s, 0), spot, time, rate, vol, nodes=200),
+        abs=1e-3,
+    )
+    # Risk neutral: the expected payout is the forward value of the put
+    assert ev == pytest.approx(premium - options.bs_price(spot, strike, 30, rate, vol, "put") * np.exp(rate * time))
+
+
+def test_short_put_analytics_broadcast():
+    strikes = np.array([80.0, 90.0, 100.0])
+    times = np.array([[0.1], [0.5]])
+
+    pop = options.pop_short_put(100.0, strikes, 1.0, times, 0.04, 0.3)
+    quantiles = options.return_quantiles_short_put(100.0, strikes, 1.0, times, 0.04, 0.3, q=(0.05, 0.5, 0.95))
+
+    assert pop.shape == (2, 3)
+    # Further out of the money and shorter dated => more likely to profit
+    assert (np.diff(pop, axis=1) < 0).all() and (pop[0] > pop[1]).all()
+    assert quantiles.shape == (2, 3, 3)
+    assert (np.diff(quantiles, axis=-1) >= 0).all()
+    # The best case is keeping the premium
+    assert quantiles[..., -1] == pytest.approx(1.0 / (strikes - 1.0) * np.ones((2, 1)))
+    assert options.pop_short_put(100.0, 1.0, 2.0, 0.1, 0.04, 0.3) == 1.0
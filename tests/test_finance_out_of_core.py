@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from grynn_pylib.finance import out_of_core, timeseries
+
+
+@pytest.fixture
+def panel():
+    dates = pd.bdate_range("2015-01-01", periods=1500)
+    rng = np.random.default_rng(42)
+    data = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, size=(len(dates), 7)), axis=0))
+    data[10:20, 3] = np.nan
+    return pd.DataFrame(data, index=dates, columns=[f"S{i}" for i in range(7)])
+
+
+def test_rolling_cagr_npy(tmp_path, panel):
+    np.save(tmp_path / "prices.npy", panel.to_numpy())
+
+    result = out_of_core.rolling_cagr(
+        tmp_path / "prices.npy", tmp_path / "cagr.npy", years=2, snap_to_closest=True, index=panel.index, block_size=3
+    )
+    expected = timeseries.rolling_cagr(panel, years=2, snap_to_closest=True)
+    assert isinstance(result, np.memmap)
+    np.testing.assert_allclose(np.load(tmp_path / "cagr.npy"), expected.to_numpy(), equal_nan=True)
+
+
+def test_rolling_return_and_drawdowns_npy(tmp_path, panel):
+    np.save(tmp_path / "prices.npy", panel.to_numpy())
+    np.save(tmp_path / "dates.npy", panel.index.to_numpy())
+
+    result = out_of_core.rolling_return(
+        tmp_path / "prices.npy", tmp_path / "rr.npy", years=1, index=tmp_path / "dates.npy"
+    )
+    np.testing.assert_allclose(result, timeseries.rolling_return(panel, years=1).to_numpy(), equal_nan=True)
+
+    result = out_of_core.drawdowns(tmp_path / "prices.npy", tmp_path / "dd.npy", index=panel.index, block_size=2)
+    np.testing.assert_allclose(result, timeseries.drawdowns(panel).to_numpy(), equal_nan=True)
+
+
+def test_drawdowns_arrow(tmp_path, panel):
+    feather = pytest.importorskip("pyarrow.feather")
+    feather.write_feather(
+        panel.rename_axis("date").reset_index(), tmp_path / "prices.arrow", compression="uncompressed"
+    )
+
+    result = out_of_core.drawdowns(tmp_path / "prices.arrow", tmp_path / "dd.npy", block_size=4)
+    np.testing.assert_allclose(result, timeseries.drawdowns(panel).to_numpy(), equal_nan=True)
+
+
+def test_npy_requires_index(tmp_path, panel):
+    np.save(tmp_path / "prices.npy", panel.to_numpy())
+    with pytest.raises(ValueError):
+        out_of_core.drawdowns(tmp_path / "prices.npy", tmp_path / "dd.npy")
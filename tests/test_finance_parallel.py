@@ -0,0 +1,39 @@
+import gc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from grynn_pylib.finance import parallel, timeseries
+
+
+@pytest.fixture
+def panel():
+    dates = pd.bdate_range("2015-01-01", periods=1500)
+    rng = np.random.default_rng(7)
+    data = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, size=(len(dates), 9)), axis=0))
+    return pd.DataFrame(data, index=dates, columns=[f"S{i}" for i in range(9)])
+
+
+def test_rolling_cagr_matches_serial(panel):
+    result = parallel.rolling_cagr(panel, years=2, snap_to_closest=True, workers=2, shard_size=4)
+    expected = timeseries.rolling_cagr(panel, years=2, snap_to_closest=True)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_rolling_cagr_short_history_is_nan(panel):
+    result = parallel.rolling_cagr(panel.iloc[:100], years=1, workers=2, shard_size=4)
+    assert result.shape == (100, 9)
+    assert result.isna().all().all()
+
+
+def test_drawdowns_matches_serial(panel):
+    result = parallel.drawdowns(panel, workers=2)
+    pd.testing.assert_frame_equal(result, timeseries.drawdowns(panel))
+    del result
+    gc.collect()
+
+
+def test_unknown_function(panel):
+    with pytest.raises(ValueError):
+        parallel.parallel_apply("bs_price", panel)
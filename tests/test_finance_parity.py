@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from grynn_pylib.finance import options, parity
+
+
+def _chain(option_type, symbol="XYZ", spot=100.0, dte=30, rate=0.04, spread=0.0):
+    strikes = np.array([90.0, 100.0, 110.0])
+    price = options.bs_price(spot, strikes, dte, rate, 0.25, option_type)
+    cp = "C" if option_type == "call" else "P"
+    return pd.DataFrame(
+        {
+            "strike": strikes,
+            "bid": price - spread,
+            "ask": price + spread,
+            "last": price,
+            "spot": spot,
+            "dte": dte,
+            "expiry": pd.Timestamp("2025-04-17 15:00", tz="US/Central"),
+            "underlying_symbol": symbol,
+        },
+        index=pd.Index([f"{symbol}250417{cp}{int(k * 1000):08d}" for k in strikes], name="contract_symbol"),
+    )
+
+
+def test_parity_holds_for_european_prices():
+    calls = pd.concat([_chain("call"), _chain("call", symbol="ABC", spot=50.0)])
+    # Puts in a different order: pairing must not depend on row order
+    puts = pd.concat([_chain("put", symbol="ABC", spot=50.0), _chain("put")]).iloc[::-1]
+
+    result = parity.scan(calls, puts, rate=0.04)
+
+    assert len(result) == 6
+    assert list(result.index.get_level_values("underlying_symbol").unique()) == ["ABC", "XYZ"]
+    np.testing.assert_allclose(result["residual"], 0, atol=1e-10)
+    np.testing.assert_allclose(result["implied_rate"], 0.04, atol=1e-9)
+    np.testing.assert_allclose(result.xs("XYZ")["forward"], 100 * np.exp(0.04 * 30 / 365))
+    np.testing.assert_allclose(result["arb"], 0, atol=1e-10)
+
+    # ABC (spot 50) has no strikes near the money
+    rates = parity.implied_rates(result, moneyness=0.15)
+    assert list(rates.index.get_level_values("underlying_symbol")) == ["XYZ"]
+    assert rates["pairs"].item() == 3
+    assert rates["implied_rate"].item() == pytest.approx(0.04)
+
+
+def test_conversion_arbitrage_uses_tradable_quotes():
+    calls = _chain("call", spread=0.05)
+    puts = _chain("put", spread=0.05)
+    # Rich call at 100: selling it and buying the put beats the locked-in strike by 0.45
+    calls.loc[calls["strike"] == 100.0, ["bid", "ask"]] += 0.55
+
+    result = parity.scan(calls, puts, rate=0.04).xs("XYZ")
+
+    row = result.xs(100.0, level="strike").iloc[0]
+    assert row["conversion"] == pytest.approx(0.45)
+    assert row["arb"] == pytest.approx(0.45)
+    assert row["implied_rate"] > 0.04
+    np.testing.assert_allclose(result.drop(100.0, level="strike")["arb"], 0, atol=1e-10)
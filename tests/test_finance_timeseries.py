@@ -2,7 +2,7 @@ import unittest
 import pandas as pd
 import numpy as np
 import warnings
-from grynn_pylib.finance import timeseries
+from grynn_pylib.finance import calendars, timeseries
 
 
 class TestTimeSeries(unittest.TestCase):
@@ -109,6 +109,111 @@ class TestTimeSeries(unittest.TestCase):
             "Expected 2 unique values in the CAGR DataFrame, 261 & 262 bdays",
         )
 
+    def test_rolling_return_calendar_matches_snap_on_sessions(self):
+        sessions = calendars.get_sessions("XNYS", "2015-01-01", "2020-12-31")
+        df = pd.DataFrame({"A": np.power(1.001, np.arange(len(sessions)))}, index=sessions)
+
+        expected = timeseries.rolling_return(df, years=1, snap_to_closest=True)
+        result = timeseries.rolling_return_calendar(df, years=1, exchange="XNYS")
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_rolling_return_calendar_sessions_window(self):
+        sessions = calendars.get_sessions("XNYS", "2015-01-01", "2020-12-31")
+        s = pd.Series(np.power(1.001, np.arange(len(sessions))), index=sessions, name="A")
+
+        result = timeseries.rolling_return_calendar(s, exchange="XNYS", sessions=252)
+        self.assertTrue(result.iloc[:252].isna().all())
+        self.assertTrue(np.allclose(result.iloc[252:], 1.001**252))
+
+        cagr = timeseries.rolling_cagr_calendar(s, exchange="XNYS", sessions=252)
+        self.assertTrue(np.allclose(cagr.iloc[252:], 1.001**252 - 1))
+
+    def test_rolling_return_calendar_holiday_alignment(self):
+        # XBOM and XNYS have different holidays; a daily (calendar) series snaps to each exchange's sessions
+        dates = pd.date_range("2018-01-01", "2021-12-31", freq="D")
+        data = np.arange(len(dates)) + 1.0
+        df = pd.DataFrame({"SPY": data, "NIFTYBEES.NS": data}, index=dates)
+
+        result = timeseries.rolling_return_calendar(df, exchange={"SPY": "XNYS", "NIFTYBEES.NS": "XBOM"}, sessions=5)
+        self.assertListEqual(list(result.columns), list(df.columns))
+        self.assertTrue(result.iloc[-1].notna().all())
+        self.assertFalse(result["SPY"].equals(result["NIFTYBEES.NS"]))
+
+    def _brute_force_window(self, prices, i, years=1):
+        # returns over (t - years, t], snapped to the last date on or before t - years
+        idx = prices.index
+        anchor = np.searchsorted(idx, idx[i] - pd.DateOffset(years=years), side="right") - 1
+        return prices.iloc[anchor : i + 1].pct_change().dropna()
+
+    def test_rolling_risk_stats_brute_force(self):
+        rng = np.random.default_rng(0)
+        dates = pd.bdate_range("2015-01-01", periods=1500)
+        prices = pd.DataFrame(
+            100 * np.exp(np.cumsum(rng.normal(0, 0.01, size=(1500, 3)), axis=0)), index=dates, columns=list("ABC")
+        )
+        benchmark = prices.mean(axis=1)
+        stats = timeseries.rolling_risk_stats(prices, years=[1, 2], benchmark=benchmark, snap_to_closest=True)
+        self.assertEqual(set(stats.columns.get_level_values(0)), set(timeseries.RISK_STATS))
+
+        for i in [300, 900, 1499]:
+            r = self._brute_force_window(prices["B"], i)
+            rb = self._brute_force_window(benchmark, i)
+            self.assertAlmostEqual(stats["volatility", 1]["B"].iloc[i], r.std() * np.sqrt(252))
+            self.assertAlmostEqual(stats["sharpe", 1]["B"].iloc[i], r.mean() / r.std() * np.sqrt(252))
+            dd = np.sqrt((np.minimum(r, 0) ** 2).mean())
+            self.assertAlmostEqual(stats["downside_deviation", 1]["B"].iloc[i], dd * np.sqrt(252))
+            self.assertAlmostEqual(stats["sortino", 1]["B"].iloc[i], r.mean() / dd * np.sqrt(252))
+            self.assertAlmostEqual(stats["beta", 1]["B"].iloc[i], np.cov(r, rb)[0, 1] / rb.var())
+            self.assertAlmostEqual(stats["correlation", 1]["B"].iloc[i], np.corrcoef(r, rb)[0, 1])
+
+        # No window start within the first year
+        self.assertTrue(stats["volatility", 2].iloc[:400].isna().all(axis=None))
+
+    def test_rolling_volatility_series(self):
+        data = np.power(1.001, np.arange(1000))
+        result = timeseries.rolling_volatility(pd.Series(data, index=self.df.index, name="price"), snap_to_closest=True)
+        self.assertIsInstance(result, pd.Series)
+        self.assertEqual(result.name, "price")
+        self.assertTrue(np.allclose(result.dropna(), 0, atol=1e-9))
+
+        with self.assertRaises(ValueError):
+            timeseries.rolling_risk_stats(self.df, stats=["beta"])
+
+    def test_buffered_paths_match_default(self):
+        dates = pd.bdate_range("2015-01-01", periods=1500)
+        rng = np.random.default_rng(1)
+        df = pd.DataFrame(100 * np.exp(np.cumsum(rng.normal(0, 0.01, size=(1500, 4)), axis=0)), index=dates)
+        df.iloc[100:110, 1] = np.nan
+        df.iloc[-5:, 2] = np.nan
+        # Leading gap, and a gap across a row-chunk boundary of the buffered paths
+        df.iloc[:3, 3] = np.nan
+        df.iloc[250:270, 3] = np.nan
+
+        for snap in [True, False]:
+            expected = timeseries.rolling_return(df, years=1, snap_to_closest=snap)
+            out = np.empty(df.shape)
+            result = timeseries.rolling_return(df, years=1, snap_to_closest=snap, out=out)
+            self.assertTrue(np.shares_memory(result.to_numpy(), out))
+            pd.testing.assert_frame_equal(result, expected)
+
+        expected = timeseries.rolling_cagr(df[0], years=2, snap_to_closest=True)
+        result = timeseries.rolling_cagr(df[0], years=2, snap_to_closest=True, dtype=np.float32)
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, expected, atol=1e-6, equal_nan=True)
+
+        pd.testing.assert_frame_equal(timeseries.drawdowns(df, dtype=np.float64), timeseries.drawdowns(df))
+
+        ccy = pd.Series(0.012, index=dates)
+        pd.testing.assert_frame_equal(timeseries.to_usd(df, ccy, dtype=np.float64), timeseries.to_usd(df, ccy))
+
+    def test_drawdowns_in_place(self):
+        data = np.array([1.0, 2.0, np.nan, 1.0, 4.0])
+        expected = timeseries.drawdowns(pd.Series(data))
+        timeseries.drawdowns(pd.Series(data, copy=False), out=data)
+        np.testing.assert_allclose(data, expected, equal_nan=True)
+        with self.assertRaises(ValueError):
+            timeseries.drawdowns(pd.Series(data), out=np.empty(3))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,33 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY = ["yfinance", "pandas", "scipy.stats", "exchange_calendars"]
+
+
+def _loaded_after(statement: str) -> set[str]:
+    code = f"import sys; {statement}; print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return set(filter(None, out.strip().split(",")))
+
+
+@pytest.mark.parametrize(
+    "statement, allowed",
+    [
+        ("import grynn_pylib", set()),
+        ("from grynn_pylib.finance import options", set()),
+        ("from grynn_pylib.data_providers import yahoo_finance", set()),
+        ("from grynn_pylib.finance import timeseries", {"pandas"}),
+    ],
+)
+def test_lazy_imports(statement, allowed):
+    assert _loaded_after(statement) <= allowed
+
+
+def test_lazy_attribute_access():
+    import grynn_pylib
+
+    assert grynn_pylib.finance.options.bs_price(100, 100, 365, 0.05, 0.2) > 0
+    with pytest.raises(AttributeError):
+        grynn_pylib.does_not_exist
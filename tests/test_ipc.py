@@ -0,0 +1,60 @@
+import os
+from datetime import datetime
+
+import pandas as pd
+import pytest
+import pytz
+
+from grynn_pylib import ipc
+from grynn_pylib.data_providers import synthetic
+from grynn_pylib.finance import parallel
+
+ASOF = pytz.timezone("US/Central").localize(datetime(2025, 3, 3, 10, 0))
+
+
+def _chain(ticker: str, max_expiries: int | None = None) -> pd.DataFrame:
+    if ticker == "BAD":
+        raise ValueError("no expiries")
+    calls, puts, _ = synthetic.option_chain(ticker, expiries=max_expiries or 3, strikes=20, asof=ASOF, seed=1)
+    return pd.concat([calls.assign(option_type="call"), puts.assign(option_type="put")])
+
+
+def _panel(seed: int) -> tuple[pd.DataFrame, pd.Series]:
+    prices = synthetic.gbm_panel(5, years=1, seed=seed)
+    return prices, prices.iloc[:, 0].rename("first")
+
+
+def _shm_exists(name: str) -> bool:
+    return os.path.exists(f"/dev/shm/{name.lstrip('/')}")
+
+
+def test_round_trip_chain_and_panel():
+    chain = _chain("SYN")
+    handle = ipc.to_shared(chain)
+    assert _shm_exists(handle.name)
+    result = ipc.from_shared(handle)
+    pd.testing.assert_frame_equal(result, chain)
+    assert not _shm_exists(handle.name)
+
+    prices, first = _panel(3)
+    pd.testing.assert_frame_equal(ipc.from_shared(ipc.to_shared(prices)), prices, check_freq=False)
+    pd.testing.assert_series_equal(ipc.from_shared(ipc.to_shared(first)), first, check_freq=False)
+
+
+def test_map_frames_matches_serial():
+    results = list(ipc.map_frames(_panel, [1, 2, 3], workers=2))
+    for seed, (prices, first) in zip([1, 2, 3], results):
+        expected_prices, expected_first = _panel(seed)
+        pd.testing.assert_frame_equal(prices, expected_prices, check_freq=False)
+        pd.testing.assert_series_equal(first, expected_first, check_freq=False)
+    pickled = list(ipc.map_frames(_panel, [1], workers=1, transport="pickle"))
+    pd.testing.assert_frame_equal(pickled[0][0], results[0][0], check_freq=False)
+    with pytest.raises(ValueError):
+        ipc.map_frames(_panel, [1], transport="json")
+
+
+def test_parallel_option_chains():
+    chains = parallel.option_chains(["AAA", "BAD", "BBB"], max_expiries=2, workers=2, fetch=_chain)
+    assert list(chains) == ["AAA", "BBB"]
+    pd.testing.assert_frame_equal(chains["AAA"], _chain("AAA", 2))
+    assert chains["BBB"]["expiry"].nunique() == 2
@@ -0,0 +1,88 @@
+import io
+import re
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from grynn_pylib import reports
+
+
+def _frame(n=5):
+    return pd.DataFrame(
+        {
+            "strike": np.arange(n, dtype=float) + 100.5,
+            "iv": [0.2, np.nan] + [0.3] * (n - 2),
+            "expiry": pd.date_range("2025-03-21 15:00", periods=n, freq="D", tz="US/Central"),
+            "itm": [True, False] * (n // 2) + [True] * (n % 2),
+            "symbol": [f"<S{i}>" for i in range(n)],
+        },
+        index=pd.Index(range(n), name="k"),
+    )
+
+
+def test_write_excel_streams_chunks(tmp_path):
+    chunks = (_frame(5) for _ in range(3))
+    path = reports.write_excel(
+        tmp_path / "r.xlsx", {"chain": chunks, "empty": []}, formats={"iv": "0.0%"}, chunk_rows=2
+    )
+
+    with zipfile.ZipFile(path) as z:
+        sheet = z.read("xl/worksheets/sheet1.xml").decode()
+        styles = z.read("xl/styles.xml").decode()
+        assert "xl/worksheets/sheet2.xml" in z.namelist()
+    # header + 15 rows, 6 columns (index included)
+    assert '<dimension ref="A1:F16"/>' in sheet
+    assert 'formatCode="0.0%"' in styles
+    # The NaN iv cell (C3) is left blank, the expiry is an Excel serial of the wall-clock time
+    assert 'r="C3"' not in sheet
+    assert re.search(r'<c r="D2" s="\d+"><v>45737\.625</v>', sheet)
+
+
+def test_write_excel_dtype_changes_between_chunks(tmp_path):
+    # "note" starts out numeric and turns into strings; "flag" gains a missing value
+    chunks = [
+        pd.DataFrame({"note": [1.5, np.nan], "flag": [True, False]}),
+        pd.DataFrame({"note": ["n/a", None], "flag": pd.array([True, None], dtype="boolean")}),
+    ]
+    path = reports.write_excel(tmp_path / "r.xlsx", chunks, index=False)
+
+    with zipfile.ZipFile(path) as z:
+        sheet = z.read("xl/worksheets/sheet1.xml").decode()
+    assert re.search(r'<c r="A2"[^>]*><v>1\.5</v>', sheet)
+    assert "n/a" in sheet
+    assert 'r="A3"' not in sheet and 'r="A5"' not in sheet and 'r="B5"' not in sheet
+
+
+def test_write_excel_spills_over_row_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(reports, "EXCEL_MAX_ROWS", 4)
+    path = reports.write_excel(tmp_path / "r.xlsx", {"big": _frame(10)}, index=False)
+
+    with zipfile.ZipFile(path) as z:
+        workbook = z.read("xl/workbook.xml").decode()
+    assert 'name="big"' in workbook and 'name="big (2)"' in workbook and 'name="big (3)"' in workbook
+
+
+def test_write_html():
+    out = io.StringIO()
+    reports.write_html(out, {"chain": [_frame(3), _frame(2)]}, title="Chains", formats={"iv": ".1%"}, chunk_rows=2)
+    html = out.getvalue()
+
+    assert "<h2>chain</h2>" in html
+    assert html.count("<tr>") == 6
+    assert "&lt;S0&gt;" in html
+    assert '<td class="num">20.0%</td>' in html
+    assert '<td class="num"></td>' in html
+
+
+def test_write_markdown():
+    out = io.StringIO()
+    reports.write_markdown(out, {"chain": _frame(5)}, index=False, float_format=".2f", chunk_rows=2)
+    lines = out.getvalue().strip().split("\n")
+
+    assert lines[0] == "## chain"
+    assert lines[2].startswith("|") and "strike" in lines[2]
+    # One header, one separator, five rows
+    assert sum(line.startswith("|--") or line.startswith("|:") for line in lines) == 1
+    assert len(lines) == 2 + 2 + 5
+    assert lines[4].startswith("|   100.50 | 0.20 |")
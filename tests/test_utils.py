@@ -20,6 +20,71 @@ class TestUtils(unittest.TestCase):
         args, kwargs = mock_subprocess_run.call_args
         self.assertIn("bcomp", args[0])
 
+    def test_diff_frames(self):
+        a = pd.DataFrame({"x": [1.0, 2.0, 3.0, 4.0], "s": ["p", "q", "r", "s"]}, index=[10, 11, 12, 13])
+        b = pd.DataFrame({"x": [1.0 + 1e-9, 2.5, 3.0, 5.0], "s": ["p", "q", "z", "t"]}, index=[10, 11, 12, 14])
+
+        diff = utils.diff_frames(a, b, atol=1e-6, chunk_rows=2)
+
+        self.assertEqual(list(diff.added), [14])
+        self.assertEqual(list(diff.removed), [13])
+        self.assertEqual(list(diff.changed.index), [(11, "x"), (12, "s")])
+        self.assertEqual(diff.changed.loc[(11, "x"), "b"], 2.5)
+        self.assertEqual(diff.compared_rows, 3)
+        self.assertFalse(diff.equal)
+        self.assertTrue(utils.diff_frames(a, a.copy()).equal)
+
+    def test_diff_frames_requires_unique_index(self):
+        a = pd.DataFrame({"x": [1, 2]}, index=[1, 1])
+        with self.assertRaises(ValueError):
+            utils.diff_frames(a, a)
+
+    def test_bcompare_native(self):
+        a = pd.Series([1, 2, 3], name="a")
+        b = pd.Series([1, 2, 4], name="a")
+        with patch("grynn_pylib.utils.subprocess.run") as mock_subprocess_run:
+            diff = utils.bcompare(a, b, engine="native")
+        self.assertFalse(mock_subprocess_run.called)
+        self.assertEqual(list(diff.changed_keys), [2])
+
+    @patch("grynn_pylib.utils.bcompare_frames")
+    def test_bcompare_only_diff(self, mock_bcompare_frames):
+        a = pd.DataFrame({"x": range(100), "y": range(100)})
+        b = a.copy()
+        b.loc[42, "y"] = -1
+
+        utils.bcompare(a, b, only_diff=True)
+
+        a_slice, b_slice = mock_bcompare_frames.call_args[0]
+        self.assertEqual(a_slice.shape, (1, 1))
+        self.assertEqual(b_slice.loc[42, "y"], -1)
+
+    def test_bcompare_native_no_common_columns(self):
+        a = pd.Series([1, 2, 3], name="a")
+        b = pd.Series([4, 5, 6], name="b")
+
+        diff = utils.bcompare(a, b, engine="native")
+
+        self.assertFalse(diff.equal)
+        self.assertEqual(list(diff.added_columns), ["b"])
+        self.assertEqual(list(diff.removed_columns), ["a"])
+        self.assertEqual(len(diff.changed), 0)
+        self.assertEqual(diff.hashed_equal_rows, 3)
+
+    @patch("grynn_pylib.utils.bcompare_frames")
+    def test_bcompare_only_diff_column_changes(self, mock_bcompare_frames):
+        a = pd.DataFrame({"x": range(5), "y": range(5)})
+        b = a.drop(columns="y").assign(z=1)
+        b.loc[2, "x"] = -1
+
+        utils.bcompare(a, b, only_diff=True)
+
+        a_slice, b_slice = mock_bcompare_frames.call_args[0]
+        self.assertEqual(list(a_slice.index), list(range(5)))
+        self.assertEqual(list(a_slice.columns), ["x", "y"])
+        self.assertEqual(list(b_slice.columns), ["x", "z"])
+        self.assertEqual(b_slice.loc[2, "x"], -1)
+
 
 if __name__ == "__main__":
     unittest.main()